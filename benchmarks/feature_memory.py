@@ -0,0 +1,101 @@
+"""Measure the memory used by the parsed feature files.
+
+Generate a corpus of table-heavy feature files (scenario outlines with large step tables and many examples),
+then measure with ``tracemalloc`` the memory retained and peaking while building their Gherkin documents and their
+``Feature`` models, and the size and time of a ``pickle`` round trip of the features (as in the feature cache).
+
+Usage::
+
+    python benchmarks/feature_memory.py [--files 20] [--rows 200] [--examples 100] [--directory DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import pickle
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, TypeVar
+
+from pytest_bdd.gherkin_parser import get_gherkin_document
+from pytest_bdd.parser import FeatureParser
+
+T = TypeVar("T")
+
+
+def generate_corpus(directory: str, files: int, rows: int, examples: int, scenarios: int = 5) -> list[str]:
+    """Generate the feature files of the corpus, and return their names."""
+    table = "\n".join(
+        f"            | {row} | name {row} | {row * 3} | value {row % 7} | x{row} |" for row in range(rows)
+    )
+    examples_table = "\n".join(f"            | {row} | {row * 2} |" for row in range(examples))
+    filenames = []
+    for index in range(files):
+        lines = [f"Feature: Feature {index}"]
+        for number in range(scenarios):
+            lines += [
+                f"    Scenario Outline: Scenario {number}",
+                "        Given I have a table",
+                "            | id | name | amount | value | extra |",
+                table,
+                "        When I use <a> and <b>",
+                "",
+                "        Examples:",
+                "            | a | b |",
+                examples_table,
+                "",
+            ]
+        filename = f"memory_{index}.feature"
+        with open(os.path.join(directory, filename), "w", encoding="utf-8") as feature_file:
+            feature_file.write("\n".join(lines))
+        filenames.append(filename)
+    return filenames
+
+
+def measure(label: str, func: Callable[[], T]) -> T:
+    """Call the function, and print the memory it retained and its peak memory."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label}: retained {current / 1e6:.1f}MB, peak {peak / 1e6:.1f}MB, {elapsed:.2f}s")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=20, help="number of feature files (default: 20)")
+    parser.add_argument("--rows", type=int, default=200, help="number of rows of the step tables (default: 200)")
+    parser.add_argument("--examples", type=int, default=100, help="number of examples per outline (default: 100)")
+    parser.add_argument("--directory", help="directory of the corpus (default: a temporary directory)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        directory = args.directory or tmp_dir
+        os.makedirs(directory, exist_ok=True)
+        filenames = generate_corpus(directory, args.files, args.rows, args.examples)
+
+        documents = measure(
+            "GherkinDocument",
+            lambda: [get_gherkin_document(os.path.join(directory, filename)) for filename in filenames],
+        )
+        del documents
+        features = measure("Feature", lambda: [FeatureParser(directory, filename).parse() for filename in filenames])
+
+        start = time.perf_counter()
+        pickled = [pickle.dumps(feature, protocol=pickle.HIGHEST_PROTOCOL) for feature in features]
+        for data in pickled:
+            pickle.loads(data)
+        elapsed = time.perf_counter() - start
+        print(f"pickled features: {sum(map(len, pickled)) / 1e6:.1f}MB, round trip {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
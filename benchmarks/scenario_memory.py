@@ -0,0 +1,90 @@
+"""Measure the memory used by the parsed features and the rendered scenarios of a corpus with repeated steps.
+
+Generate a corpus of feature files whose scenario outlines draw their steps and tags from a small set (as in real
+suites, where the same steps are repeated across the scenarios), then measure with ``tracemalloc`` the memory
+retained by their ``Feature`` models, and by the scenarios rendered for each example.
+
+Usage::
+
+    python benchmarks/scenario_memory.py [--files 300] [--scenarios 20] [--directory DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import random
+import tempfile
+import tracemalloc
+
+from pytest_bdd.parser import FeatureParser
+
+VERBS = ("opens", "closes", "reloads", "bookmarks")
+PAGES = ("home", "login", "settings", "profile", "search", "cart", "checkout", "orders", "help", "admin")
+TAGS = ("@smoke", "@regression", "@slow", "@ui", "@api", "@critical")
+
+
+def generate_corpus(directory: str, files: int, scenarios: int, steps: int = 8) -> list[str]:
+    """Generate the feature files of the corpus, and return their names."""
+    rnd = random.Random(0)
+    step_texts = [f"the user {verb} the {page} page" for verb in VERBS for page in PAGES]
+    filenames = []
+    for index in range(files):
+        lines = [f"Feature: Feature {index}"]
+        for number in range(scenarios):
+            lines += [
+                f"    {' '.join(rnd.sample(TAGS, 2))}",
+                f"    Scenario Outline: Scenario {number}",
+                "        Given the user is logged in as <role>",
+            ]
+            lines += [f"        {'And' if step % 2 else 'When'} {rnd.choice(step_texts)}" for step in range(steps)]
+            lines += [
+                "        Then the user sees <result>",
+                "",
+                "        Examples:",
+                "            | role  | result         |",
+                "            | admin | the dashboard  |",
+                "            | guest | the login page |",
+                "",
+            ]
+        filename = f"scenarios_{index}.feature"
+        with open(os.path.join(directory, filename), "w", encoding="utf-8") as feature_file:
+            feature_file.write("\n".join(lines))
+        filenames.append(filename)
+    return filenames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=300, help="number of feature files (default: 300)")
+    parser.add_argument("--scenarios", type=int, default=20, help="number of outlines per file (default: 20)")
+    parser.add_argument("--directory", help="directory of the corpus (default: a temporary directory)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        directory = args.directory or tmp_dir
+        os.makedirs(directory, exist_ok=True)
+        filenames = generate_corpus(directory, args.files, args.scenarios)
+
+        gc.collect()
+        tracemalloc.start()
+        features = [FeatureParser(directory, filename).parse() for filename in filenames]
+        gc.collect()
+        parsed = tracemalloc.get_traced_memory()[0]
+        rendered = [
+            scenario.render(context)
+            for feature in features
+            for scenario in feature.scenarios.values()
+            for examples in scenario.examples
+            for context in examples.as_contexts()
+        ]
+        gc.collect()
+        total = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"parsed features: {parsed / 1e6:.1f}MB")
+        print(f"{len(rendered)} rendered scenarios: {(total - parsed) / 1e6:.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,6 @@
 from __future__ import annotations
 
 from pytest_bdd.scenario import scenario, scenarios
-from pytest_bdd.steps import given, step, then, when
+from pytest_bdd.steps import given, register_steps, step, then, when
 
-__all__ = ["given", "when", "step", "then", "scenario", "scenarios"]
+__all__ = ["given", "when", "step", "then", "scenario", "scenarios", "register_steps"]
@@ -23,6 +23,18 @@ class StepDefinitionNotFoundError(Exception):
     """Step definition not found."""
 
 
+class StepParserError(Exception):
+    """The parser of a step definition failed to match a step (e.g. its expression is invalid)."""
+
+
+class AmbiguousStepDefinitionError(Exception):
+    """Several step definitions at the same scope can parse a step."""
+
+
+class AmbiguousStepDefinitionWarning(UserWarning):
+    """Several step definitions at the same scope can parse a step."""
+
+
 class NoScenariosFound(Exception):
     """No scenarios found."""
 
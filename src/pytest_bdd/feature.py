@@ -26,14 +26,332 @@ one line.
 
 from __future__ import annotations
 
+import contextlib
 import glob
+import hashlib
+import logging
 import os.path
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, NamedTuple
+from weakref import WeakKeyDictionary
 
+import pytest
+
+from . import parser as parser_module
 from .parser import Feature, FeatureParser
+from .prescan import FeatureIndex
+from .utils import CONFIG_STACK
+
+if TYPE_CHECKING:
+    from _pytest.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Default maximum number of parsed features kept in memory: no limit, so that a feature file is parsed once per session
+FEATURES_CACHE_SIZE: int | None = None
+
+# Version of the serialized feature models, to bump whenever the classes of `parser` change
+FEATURE_CACHE_FORMAT = 3
+FEATURE_CACHE_DIR = "pytest-bdd-features"
+# Index of the prescanned feature files, in the feature cache directory
+FEATURE_INDEX_FILE = "index.json"
+
+# Minimum number of feature files to parse for the parsing to be spread over processes,
+# below that the start of the processes costs more than it saves
+PARALLEL_PARSE_MIN_FILES = 20
+
+
+class FeatureCacheStats(NamedTuple):
+    """Statistics of a `FeatureCache`."""
+
+    hits: int
+    misses: int
+    invalidations: int
+    evictions: int
+    size: int
+    maxsize: int | None
+
+
+class FeatureCache:
+    """In-memory cache of the parsed features, by the absolute filename of their feature file.
+
+    The least recently used features are evicted when there are more than `maxsize` of them (None doesn't bound
+    the cache). A feature is invalidated when the modification time or the size of its feature file changes,
+    so that long-lived processes (IDE runners, daemons) don't serve stale features.
+    The cache can be shared by several threads.
+    """
+
+    def __init__(self, maxsize: int | None = FEATURES_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[Feature, tuple[int, int]]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, filename: str) -> Feature | None:
+        """Get the feature of the feature file, or None if it is not cached or its feature file changed."""
+        with self._lock:
+            entry = self._entries.get(filename)
+            if entry is not None:
+                feature, signature = entry
+                if signature == self.get_signature(filename):
+                    self._entries.move_to_end(filename)
+                    self.hits += 1
+                    return feature
+                del self._entries[filename]
+                self.invalidations += 1
+            self.misses += 1
+            return None
+
+    def set(self, filename: str, feature: Feature, signature: tuple[int, int] | None) -> None:
+        """Cache the feature parsed from the feature file.
+
+        :param signature: The signature of the feature file from `get_signature`, taken before parsing it:
+            if the feature file changes in between, the feature is outdated instead of having the signature
+            of a content that was not parsed. None doesn't cache the feature.
+        """
+        if signature is None:
+            return
+        with self._lock:
+            self._entries[filename] = (feature, signature)
+            self._entries.move_to_end(filename)
+            self._evict()
+
+    def resize(self, maxsize: int | None) -> None:
+        """Change the maximum number of cached features, evicting the least recently used ones."""
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all the cached features and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.invalidations = self.evictions = 0
+
+    def stats(self) -> FeatureCacheStats:
+        """Get the statistics of the cache."""
+        with self._lock:
+            return FeatureCacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                invalidations=self.invalidations,
+                evictions=self.evictions,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+    def __contains__(self, filename: str) -> bool:
+        with self._lock:
+            return filename in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _evict(self) -> None:
+        if self.maxsize is None:
+            return
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @staticmethod
+    def get_signature(filename: str) -> tuple[int, int] | None:
+        """Get the modification time and the size of the feature file, or None if it can't be read."""
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+
+# Global features cache
+features = FeatureCache()
+
+
+# Errors reading or writing a cache entry, which is then ignored: pickle can also raise the errors of the objects
+# it (un)serializes, e.g. when the classes of the models were moved or changed
+UNPICKLING_ERRORS = (
+    OSError,
+    pickle.UnpicklingError,
+    EOFError,
+    AttributeError,
+    ImportError,
+    IndexError,
+    TypeError,
+    ValueError,
+)
+PICKLING_ERRORS = (OSError, pickle.PicklingError, AttributeError, TypeError, RecursionError)
+
+
+def get_feature_cache_version() -> str:
+    """Get the version of the persistent feature cache entries.
+
+    It changes with the versions of pytest-bdd and gherkin-official, and with the format of the cache. When
+    pytest-bdd is not installed (e.g. imported from a source checkout), the hash of its models module is used instead.
+    """
+    try:
+        pytest_bdd_version = version("pytest-bdd")
+    except PackageNotFoundError:
+        with open(parser_module.__file__, "rb") as parser_file:
+            pytest_bdd_version = hashlib.sha256(parser_file.read()).hexdigest()
+    return f"{pytest_bdd_version}:{version('gherkin-official')}:{FEATURE_CACHE_FORMAT}"
+
+
+class PersistentFeatureCache:
+    """Cache of the parsed features, persisted in a directory across the test sessions.
+
+    Each feature file is cached in its own pickle file, named after the absolute path of the feature file,
+    the path relative to its base directory, the encoding, the pytest-bdd and gherkin-official versions and the
+    format of the cache.
+    The pickle file also stores a hash of the content of the feature file, so a modified feature file
+    is parsed again and its cache entry replaced.
+
+    Entries are written to a temporary file first and then renamed, so that concurrent sessions
+    (e.g. xdist workers) never read a partially written entry.
+
+    The feature files are also summarized in a `FeatureIndex`, for the selection tooling, when their entry is stored:
+    loading a cached feature doesn't touch the index. The xdist workers
+    save their summaries in their own index file, that the controller merges in the index at the end of the session.
+    Failing to summarize a feature file never prevents loading it.
+    """
+
+    def __init__(self, directory: str, worker_id: str | None = None) -> None:
+        self.directory = directory
+        self.version = get_feature_cache_version()
+        index_path = os.path.join(directory, FEATURE_INDEX_FILE)
+        self.index = FeatureIndex(index_path, get_worker_index_path(index_path, worker_id) if worker_id else None)
+        self.hits = 0
+        self.misses = 0
+
+    def get_feature(self, base_path: str, filename: str, encoding: str = "utf-8") -> Feature:
+        """Get a feature from the cache, parsing the feature file if its entry is missing or outdated."""
+        parser = FeatureParser(base_path, filename, encoding)
+        content_hash = self.get_content_hash(parser)
+        feature = self.load(parser, content_hash)
+        if feature is None:
+            feature = parser.parse()
+            self.store(parser, feature, content_hash)
+        return feature
+
+    def load(self, parser: FeatureParser, content_hash: str) -> Feature | None:
+        """Load the feature of the parser from the cache, or None if its entry is missing or outdated.
 
-# Global features dictionary
-features: dict[str, Feature] = {}
+        :param str content_hash: The hash of the content of the feature file, from `get_content_hash`.
+        """
+        feature = self._load(self._get_entry_path(parser), content_hash)
+        if feature is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return feature
+
+    def store(self, parser: FeatureParser, feature: Feature, content_hash: str) -> None:
+        """Store the feature parsed by the parser in the cache.
+
+        :param str content_hash: The hash of the content of the feature file, from `get_content_hash`, taken before
+            parsing it: if the feature file changes in between, the entry is outdated instead of having the hash
+            of a content that was not parsed.
+        """
+        self._store(self._get_entry_path(parser), content_hash, feature)
+        try:
+            self.index.get_summary(parser.abs_filename, parser.encoding)
+        except Exception:
+            logger.debug("Could not index the feature file %r", parser.abs_filename, exc_info=True)
+
+    @staticmethod
+    def get_content_hash(parser: FeatureParser) -> str:
+        """Get the hash of the content of the feature file of the parser."""
+        with open(parser.abs_filename, "rb") as feature_file:
+            return hashlib.sha256(feature_file.read()).hexdigest()
+
+    def _get_entry_path(self, parser: FeatureParser) -> str:
+        key = "\0".join((parser.abs_filename, parser.rel_filename, parser.encoding, self.version))
+        return os.path.join(self.directory, f"{hashlib.sha256(key.encode()).hexdigest()}.pickle")
+
+    def _load(self, entry_path: str, content_hash: str) -> Feature | None:
+        try:
+            with open(entry_path, "rb") as entry_file:
+                entry_content_hash, feature = pickle.load(entry_file)
+        except FileNotFoundError:
+            return None
+        except UNPICKLING_ERRORS:
+            logger.debug("Could not load the cached feature %r", entry_path, exc_info=True)
+            return None
+        if entry_content_hash != content_hash or not isinstance(feature, Feature):
+            return None
+        return feature
+
+    def _store(self, entry_path: str, content_hash: str, feature: Feature) -> None:
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as entry_file:
+                pickle.dump((content_hash, feature), entry_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+            tmp_path = None
+        except PICKLING_ERRORS:
+            logger.debug("Could not cache the feature in %r", entry_path, exc_info=True)
+        finally:
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+
+
+persistent_feature_cache_registry: WeakKeyDictionary[Config, PersistentFeatureCache] = WeakKeyDictionary()
+
+
+def configure(config: Config) -> None:
+    """Configure the parsing of the feature files.
+
+    Validate the ``bdd_parse_workers`` ini option, bound the features cache with the ``bdd_features_cache_size``
+    ini option, and set up the persistent feature cache if enabled with the ``bdd_feature_cache`` ini option.
+    """
+    get_parse_workers(config)
+    features.resize(get_features_cache_size(config))
+    cache = getattr(config, "cache", None)
+    if cache is None or not config.getini("bdd_feature_cache"):
+        return
+    workerinput = getattr(config, "workerinput", None)
+    persistent_feature_cache_registry[config] = PersistentFeatureCache(
+        str(cache.mkdir(FEATURE_CACHE_DIR)), worker_id=workerinput["workerid"] if workerinput is not None else None
+    )
+
+
+def get_worker_index_path(index_path: str, worker_id: str) -> str:
+    """Get the path of the index file written by an xdist worker."""
+    root, ext = os.path.splitext(index_path)
+    return f"{root}-{worker_id}{ext}"
+
+
+def unconfigure(config: Config) -> None:
+    """Save the index of the feature files, if the persistent feature cache is enabled.
+
+    The xdist workers save their own index file, the controller (or a session without xdist) merges them in the index.
+    """
+    persistent_feature_cache = persistent_feature_cache_registry.pop(config, None)
+    if persistent_feature_cache is None:
+        return
+    index = persistent_feature_cache.index
+    if not hasattr(config, "workerinput"):
+        index.merge(glob.glob(get_worker_index_path(glob.escape(index.path), "*")))
+    index.save()
+
+
+def get_persistent_feature_cache() -> PersistentFeatureCache | None:
+    """Get the persistent feature cache of the current session, if enabled."""
+    if not CONFIG_STACK:
+        return None
+    return persistent_feature_cache_registry.get(CONFIG_STACK[-1])
 
 
 def get_feature(base_path: str, filename: str, encoding: str = "utf-8") -> Feature:
@@ -46,25 +364,43 @@ def get_feature(base_path: str, filename: str, encoding: str = "utf-8") -> Featu
     :return: `Feature` instance from the parsed feature cache.
 
     :note: The features are parsed on the execution of the test and
-           stored in the global variable cache to improve the performance
+           stored in the global `features` cache to improve the performance
            when multiple scenarios are referencing the same file.
+           A feature is parsed again when its feature file changes.
+           If the ``bdd_feature_cache`` ini option is enabled, the parsed features
+           are also persisted in the pytest cache directory across the test sessions.
     """
     __tracebackhide__ = True
     full_name = os.path.abspath(os.path.join(base_path, filename))
     feature = features.get(full_name)
-    if not feature:
-        feature = FeatureParser(base_path, filename, encoding).parse()
-        features[full_name] = feature
+    if feature is None:
+        signature = features.get_signature(full_name)
+        persistent_feature_cache = get_persistent_feature_cache()
+        if persistent_feature_cache is not None:
+            feature = persistent_feature_cache.get_feature(base_path, filename, encoding)
+        else:
+            feature = FeatureParser(base_path, filename, encoding).parse()
+        features.set(full_name, feature, signature)
     return feature
 
 
-def get_features(paths: Iterable[str], encoding: str = "utf-8") -> list[Feature]:
+def get_features(paths: Iterable[str], encoding: str = "utf-8", workers: int | None = None) -> list[Feature]:
     """Get features for given paths.
 
     :param list paths: `list` of paths (file or dirs)
+    :param str encoding: Feature file encoding.
+    :param int workers: Number of processes parsing the feature files in parallel, when there are at least
+        `PARALLEL_PARSE_MIN_FILES` of them to parse. Defaults to the ``bdd_parse_workers`` ini option;
+        0 or 1 parse them sequentially.
 
     :return: `list` of `Feature` objects.
     """
+    paths = list(paths)
+    if workers is None:
+        workers = get_parse_workers(CONFIG_STACK[-1]) if CONFIG_STACK else 0
+    if workers > 1:
+        parse_features_in_parallel(list(iter_feature_file_paths(paths)), encoding=encoding, workers=workers)
+
     seen_names = set()
     _features = []
     for path in paths:
@@ -72,10 +408,94 @@ def get_features(paths: Iterable[str], encoding: str = "utf-8") -> list[Feature]
             seen_names.add(path)
             if os.path.isdir(path):
                 file_paths = list(glob.iglob(os.path.join(path, "**", "*.feature"), recursive=True))
-                _features.extend(get_features(file_paths, encoding=encoding))
+                _features.extend(get_features(file_paths, encoding=encoding, workers=0))
             else:
                 base, name = os.path.split(path)
                 feature = get_feature(base, name, encoding=encoding)
                 _features.append(feature)
     _features.sort(key=lambda _feature: _feature.name or _feature.filename)
     return _features
+
+
+def iter_feature_file_paths(paths: Iterable[str]) -> Iterable[str]:
+    """Iterate over the feature files of the given paths (file or dirs), the same way as `get_features`."""
+    seen_names = set()
+    for path in paths:
+        if path not in seen_names:
+            seen_names.add(path)
+            if os.path.isdir(path):
+                yield from glob.iglob(os.path.join(path, "**", "*.feature"), recursive=True)
+            else:
+                yield path
+
+
+def get_features_cache_size(config: Config) -> int | None:
+    """Get the maximum number of features kept in memory, from the ``bdd_features_cache_size`` ini option."""
+    value = config.getini("bdd_features_cache_size")
+    try:
+        maxsize = int(value)
+    except ValueError:
+        maxsize = -1
+    if maxsize < 0:
+        raise pytest.UsageError(f"Invalid bdd_features_cache_size value {value!r}, expected a number of features")
+    return maxsize or None
+
+
+def get_parse_workers(config: Config) -> int:
+    """Get the number of processes parsing the feature files, from the ``bdd_parse_workers`` ini option."""
+    value = config.getini("bdd_parse_workers")
+    if value == "auto":
+        return os.cpu_count() or 1
+    try:
+        return int(value)
+    except ValueError:
+        raise pytest.UsageError(
+            f"Invalid bdd_parse_workers value {value!r}, expected a number of processes or 'auto'"
+        ) from None
+
+
+def _parse_feature(args: tuple[str, str, str]) -> Feature | None:
+    base_path, filename, encoding = args
+    try:
+        return FeatureParser(base_path, filename, encoding).parse()
+    except Exception:
+        # Parsed again by `get_feature`, which raises the error in the main process
+        logger.debug("Could not parse the feature file %r", filename, exc_info=True)
+        return None
+
+
+def parse_features_in_parallel(file_paths: list[str], encoding: str, workers: int) -> None:
+    """Parse the feature files that are not cached yet in a pool of processes, and add them to the features cache.
+
+    The features are added to the cache in the order of the paths. The feature files that fail to parse are
+    left out, so that `get_feature` raises their error when it parses them again.
+    """
+    persistent_feature_cache = get_persistent_feature_cache()
+    parsers: dict[str, tuple[FeatureParser, tuple[int, int] | None, str | None]] = {}
+    tasks = []
+    for path in file_paths:
+        base, name = os.path.split(path)
+        parser = FeatureParser(base, name, encoding)
+        if parser.abs_filename in parsers or features.get(parser.abs_filename) is not None:
+            continue
+        signature = features.get_signature(parser.abs_filename)
+        content_hash = None
+        if persistent_feature_cache is not None:
+            content_hash = persistent_feature_cache.get_content_hash(parser)
+            feature = persistent_feature_cache.load(parser, content_hash)
+            if feature is not None:
+                features.set(parser.abs_filename, feature, signature)
+                continue
+        parsers[parser.abs_filename] = (parser, signature, content_hash)
+        tasks.append((base, name, encoding))
+    if len(tasks) < PARALLEL_PARSE_MIN_FILES:
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+        results = list(executor.map(_parse_feature, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    for (parser, signature, content_hash), feature in zip(parsers.values(), results):
+        if feature is None:
+            continue
+        features.set(parser.abs_filename, feature, signature)
+        if persistent_feature_cache is not None and content_hash is not None:
+            persistent_feature_cache.store(parser, feature, content_hash)
@@ -10,17 +10,15 @@ from _pytest._io import TerminalWriter
 from _pytest.python import Function
 from mako.lookup import TemplateLookup  # type: ignore
 
-from .compat import getfixturedefs
 from .feature import get_features
 from .parser import Feature, ScenarioTemplate, Step
 from .scenario import (
-    inject_fixturedefs_for_step,
+    get_step_resolution_cache,
     make_python_docstring,
     make_python_name,
     make_string_literal,
     scenario_wrapper_template_registry,
 )
-from .steps import get_step_fixture_name
 from .types import STEP_TYPES
 
 if TYPE_CHECKING:
@@ -136,9 +134,8 @@ def _find_step_fixturedef(
     fixturemanager: FixtureManager, item: Node, step: Step
 ) -> Sequence[FixtureDef[object]] | None:
     """Find step fixturedef."""
-    with inject_fixturedefs_for_step(step=step, fixturemanager=fixturemanager, node=item):
-        bdd_name = get_step_fixture_name(step=step)
-        return getfixturedefs(fixturemanager, bdd_name, item)
+    resolution = get_step_resolution_cache(fixturemanager).resolve(step=step, fixturemanager=fixturemanager, node=item)
+    return resolution.fixturedefs or None
 
 
 def parse_feature_files(
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import functools
 import linecache
 import re
 import textwrap
 import typing
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass, field, fields
+from typing import Any, TypeVar
 
-from gherkin.errors import CompositeParserException  # type: ignore
+from gherkin.ast_builder import AstBuilder  # type: ignore
+from gherkin.errors import AstBuilderException, CompositeParserException  # type: ignore
 from gherkin.parser import Parser  # type: ignore
 
 from . import exceptions
@@ -16,6 +18,10 @@ from . import exceptions
 if typing.TYPE_CHECKING:
     from typing_extensions import Self
 
+T = TypeVar("T")
+
+# Number of distinct locations shared between the parsed documents
+LOCATION_CACHE_SIZE = 4096
 
 ERROR_PATTERNS = [
     (
@@ -56,17 +62,49 @@ ERROR_PATTERNS = [
 ]
 
 
-@dataclass
+def _get_slots_state(self: object) -> tuple[object, ...]:
+    return tuple(getattr(self, name) for name in self.__slots__)  # type: ignore[attr-defined]
+
+
+def _set_slots_state(self: object, state: tuple[object, ...]) -> None:
+    for name, value in zip(self.__slots__, state):  # type: ignore[attr-defined]
+        object.__setattr__(self, name, value)
+
+
+def _slotted(cls: type[T]) -> type[T]:
+    """Recreate the dataclass ``cls`` with ``__slots__`` instead of a ``__dict__`` per instance.
+
+    This is what ``dataclass(slots=True)`` does on Python 3.10+.
+    """
+    field_names = tuple(f.name for f in fields(cls))  # type: ignore[arg-type]
+    namespace = {
+        key: value for key, value in cls.__dict__.items() if key not in (*field_names, "__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = field_names
+    # The frozen dataclasses can't be unpickled by setting their attributes
+    namespace["__getstate__"] = _get_slots_state
+    namespace["__setstate__"] = _set_slots_state
+    slotted: type[T] = type(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+@_slotted
+@dataclass(frozen=True)
 class Location:
     column: int
     line: int
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> Self:
-        return cls(column=data["column"], line=data["line"])
+    def from_dict(cls, data: dict[str, Any]) -> Location:
+        return _get_location(data["column"], data["line"])
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _get_location, (self.column, self.line)
 
-@dataclass
+
+@_slotted
+@dataclass(frozen=True)
 class Comment:
     location: Location
     text: str
@@ -76,7 +114,8 @@ class Comment:
         return cls(location=Location.from_dict(data["location"]), text=data["text"])
 
 
-@dataclass
+@_slotted
+@dataclass(frozen=True)
 class Cell:
     location: Location
     value: str
@@ -86,6 +125,7 @@ class Cell:
         return cls(location=Location.from_dict(data["location"]), value=_to_raw_string(data["value"]))
 
 
+@_slotted
 @dataclass
 class Row:
     id: str
@@ -101,6 +141,7 @@ class Row:
         )
 
 
+@_slotted
 @dataclass
 class ExamplesTable:
     location: Location
@@ -120,6 +161,7 @@ class ExamplesTable:
         )
 
 
+@_slotted
 @dataclass
 class DataTable:
     location: Location
@@ -135,7 +177,8 @@ class DataTable:
         return [[cell.value for cell in row.cells] for row in self.rows]
 
 
-@dataclass
+@_slotted
+@dataclass(frozen=True)
 class DocString:
     content: str
     delimiter: str
@@ -150,6 +193,7 @@ class DocString:
         )
 
 
+@_slotted
 @dataclass
 class Step:
     id: str
@@ -173,7 +217,8 @@ class Step:
         )
 
 
-@dataclass
+@_slotted
+@dataclass(frozen=True)
 class Tag:
     id: str
     location: Location
@@ -184,6 +229,7 @@ class Tag:
         return cls(id=data["id"], location=Location.from_dict(data["location"]), name=data["name"])
 
 
+@_slotted
 @dataclass
 class Scenario:
     id: str
@@ -209,6 +255,7 @@ class Scenario:
         )
 
 
+@_slotted
 @dataclass
 class Rule:
     id: str
@@ -232,6 +279,7 @@ class Rule:
         )
 
 
+@_slotted
 @dataclass
 class Background:
     id: str
@@ -253,6 +301,7 @@ class Background:
         )
 
 
+@_slotted
 @dataclass
 class Child:
     background: Background | None = None
@@ -268,6 +317,7 @@ class Child:
         )
 
 
+@_slotted
 @dataclass
 class Feature:
     location: Location
@@ -291,6 +341,7 @@ class Feature:
         )
 
 
+@_slotted
 @dataclass
 class GherkinDocument:
     feature: Feature
@@ -304,16 +355,216 @@ class GherkinDocument:
         )
 
 
+@functools.lru_cache(maxsize=LOCATION_CACHE_SIZE)
+def _get_location(column: int, line: int) -> Location:
+    """Get a location, the frozen instances are shared since the same positions repeat in every document."""
+    return Location(column=column, line=line)
+
+
 def _to_raw_string(normal_string: str) -> str:
     return normal_string.replace("\\", "\\\\")
 
 
+class GherkinDocumentBuilder(AstBuilder):
+    """Build the nodes of the Gherkin document straight from the tokens of the gherkin parser.
+
+    The gherkin ``AstBuilder`` produces dictionaries, that ``GherkinDocument.from_dict`` would convert again;
+    this builder creates the same document (including the ids) without them.
+
+    It relies on the tokens and AST nodes of the gherkin parser, which are not a public API: it is tested against
+    the supported gherkin-official versions (see the ``gherkin_official`` tox factors), and `get_gherkin_document`
+    falls back to ``GherkinDocument.from_dict`` if they miss an attribute it uses.
+    """
+
+    def reset(self) -> None:
+        super().reset()
+        self.document_comments: list[Comment] = []
+
+    def build(self, token: Any) -> None:
+        if token.matched_type == "Comment":
+            self.document_comments.append(Comment(location=self._get_location(token), text=token.matched_text))
+        else:
+            self.current_node.add(token.matched_type, token)
+
+    def transform_node(self, node: Any) -> object:  # type: ignore[override]
+        rule_type = node.rule_type
+        if rule_type == "Step":
+            step_line = node.get_token("StepLine")
+            return Step(
+                id=self.id_generator.get_next_id(),
+                location=self._get_location(step_line),
+                keyword=step_line.matched_keyword.strip(),
+                keyword_type=step_line.matched_keyword_type,
+                text=step_line.matched_text,
+                datatable=node.get_single("DataTable"),
+                docstring=node.get_single("DocString"),
+            )
+        if rule_type == "DocString":
+            separator_token = node.get_tokens("DocStringSeparator")[0]
+            return DocString(
+                content=textwrap.dedent("\n".join([token.matched_text for token in node.get_tokens("Other")])),
+                delimiter=separator_token.matched_keyword,
+                location=self._get_location(separator_token),
+            )
+        if rule_type == "DataTable":
+            rows = self._get_rows(node)
+            return DataTable(location=rows[0].location, rows=rows)
+        if rule_type == "Background":
+            background_line = node.get_token("BackgroundLine")
+            return Background(
+                id=self.id_generator.get_next_id(),
+                location=self._get_location(background_line),
+                keyword=background_line.matched_keyword,
+                name=background_line.matched_text,
+                description=self.get_description(node),
+                steps=node.get_items("Step"),
+            )
+        if rule_type == "ScenarioDefinition":
+            tags = self._get_tags(node)
+            scenario_node = node.get_single("Scenario")
+            scenario_line = scenario_node.get_token("ScenarioLine")
+            return Scenario(
+                id=self.id_generator.get_next_id(),
+                location=self._get_location(scenario_line),
+                keyword=scenario_line.matched_keyword,
+                name=scenario_line.matched_text,
+                description=self.get_description(scenario_node),
+                steps=scenario_node.get_items("Step"),
+                tags=tags,
+                examples=scenario_node.get_items("ExamplesDefinition"),
+            )
+        if rule_type == "ExamplesDefinition":
+            tags = self._get_tags(node)
+            # The examples have no id in the document, but they take one like in the gherkin AstBuilder
+            self.id_generator.get_next_id()
+            examples_node = node.get_single("Examples")
+            examples_line = examples_node.get_token("ExamplesLine")
+            rows = examples_node.get_single("ExamplesTable")
+            return ExamplesTable(
+                location=self._get_location(examples_line),
+                tags=tags,
+                name=examples_line.matched_text,
+                table_header=rows[0] if rows else None,
+                table_body=rows[1:] if rows else [],
+            )
+        if rule_type == "ExamplesTable":
+            return self._get_rows(node)
+        if rule_type == "Rule":
+            header = node.get_single("RuleHeader")
+            if not header:
+                return None
+            tags = self._get_tags(header)
+            rule_line = header.get_token("RuleLine")
+            if not rule_line:
+                return None
+            return Rule(
+                id=self.id_generator.get_next_id(),
+                location=self._get_location(rule_line),
+                keyword=rule_line.matched_keyword,
+                name=rule_line.matched_text,
+                description=self.get_description(header),
+                tags=tags,
+                children=self._get_children(node),
+            )
+        if rule_type == "Feature":
+            header = node.get_single("FeatureHeader")
+            if not header:
+                return None
+            tags = self._get_tags(header)
+            feature_line = header.get_token("FeatureLine")
+            if not feature_line:
+                return None
+            return Feature(
+                location=self._get_location(feature_line),
+                language=feature_line.matched_gherkin_dialect,
+                keyword=feature_line.matched_keyword,
+                tags=tags,
+                name=feature_line.matched_text,
+                description=self.get_description(header),
+                children=self._get_children(node),
+            )
+        if rule_type == "GherkinDocument":
+            return GherkinDocument(
+                feature=node.get_single("Feature"),
+                comments=self.document_comments,
+            )
+        return super().transform_node(node)
+
+    @staticmethod
+    def _get_location(token: Any, column: int | None = None) -> Location:
+        return _get_location(column or token.location["column"], token.location["line"])
+
+    def _get_tags(self, node: Any) -> list[Tag]:
+        tags_node = node.get_single("Tags")
+        if not tags_node:
+            return []
+        return [
+            Tag(
+                id=self.id_generator.get_next_id(),
+                location=self._get_location(token, tag_item["column"]),
+                name=tag_item["text"],
+            )
+            for token in tags_node.get_tokens("TagLine")
+            for tag_item in token.matched_items
+        ]
+
+    def _get_rows(self, node: Any) -> list[Row]:
+        rows = [
+            Row(
+                id=self.id_generator.get_next_id(),
+                location=self._get_location(token),
+                cells=[
+                    Cell(
+                        location=self._get_location(token, cell_item["column"]),
+                        value=_to_raw_string(cell_item["text"]),
+                    )
+                    for cell_item in token.matched_items
+                ],
+            )
+            for token in node.get_tokens("TableRow")
+        ]
+        if rows:
+            cell_count = len(rows[0].cells)
+            for row in rows:
+                if len(row.cells) != cell_count:
+                    raise AstBuilderException(
+                        "inconsistent cell count within the table",
+                        {"line": row.location.line, "column": row.location.column},
+                    )
+        return rows
+
+    @staticmethod
+    def _get_children(node: Any) -> list[Child]:
+        children = []
+        background = node.get_single("Background")
+        if background:
+            children.append(Child(background=background))
+        children += [Child(scenario=scenario) for scenario in node.get_items("ScenarioDefinition")]
+        children += [Child(rule=rule) for rule in node.get_items("Rule")]
+        return children
+
+
+# Whether the document can be built from the parser tokens, see `GherkinDocumentBuilder`
+_use_document_builder = True
+
+
+def _parse_gherkin_document(feature_file_text: str) -> GherkinDocument:
+    global _use_document_builder
+    if _use_document_builder:
+        try:
+            return typing.cast(GherkinDocument, Parser(GherkinDocumentBuilder()).parse(feature_file_text))
+        except (AttributeError, KeyError):
+            # The tokens or the nodes of this gherkin-official version are not the ones the builder knows
+            _use_document_builder = False
+    return GherkinDocument.from_dict(Parser().parse(feature_file_text))
+
+
 def get_gherkin_document(abs_filename: str, encoding: str = "utf-8") -> GherkinDocument:
     with open(abs_filename, encoding=encoding) as f:
         feature_file_text = f.read()
 
     try:
-        gherkin_data = Parser().parse(feature_file_text)
+        gherkin_document = _parse_gherkin_document(feature_file_text)
     except CompositeParserException as e:
         message = e.args[0]
         line = e.errors[0].location["line"]
@@ -323,8 +574,8 @@ def get_gherkin_document(abs_filename: str, encoding: str = "utf-8") -> GherkinD
         # If no patterns matched, raise a generic GherkinParserError
         raise exceptions.GherkinParseError(f"Unknown parsing error: {message}", line, line_content, filename) from e
 
-    # At this point, the `gherkin_data` should be valid if no exception was raised
-    return GherkinDocument.from_dict(gherkin_data)
+    # At this point, the `gherkin_document` should be valid if no exception was raised
+    return gherkin_document
 
 
 def handle_gherkin_parser_error(
@@ -0,0 +1,256 @@
+"""Step matching statistics (``--bdd-match-stats``).
+
+Record how many times each step definition was tried against the step texts, how many times
+it matched and how long its parser took, to find the expensive step definitions.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, TypedDict
+
+from _pytest.compat import getlocation
+
+from .step_index import step_definition_index
+
+if TYPE_CHECKING:
+    from _pytest.config import Config
+    from _pytest.config.argparsing import Parser
+    from _pytest.terminal import TerminalReporter
+
+    from .parsers import StepMatch
+    from .step_index import StepDefinition
+
+
+class SlowStepDict(TypedDict):
+    step: str
+    duration: float
+
+
+class StepDefinitionStatsDict(TypedDict):
+    type: str | None
+    parser: str
+    expression: str
+    location: str
+    attempts: int
+    hits: int
+    duration: float
+    slowest_steps: list[SlowStepDict]
+
+
+class ParserStatsDict(TypedDict):
+    parser: str
+    step_definitions: int
+    attempts: int
+    hits: int
+    duration: float
+
+
+class MatchStatsDict(TypedDict):
+    lookups: int
+    lookup_duration: float
+    parsers: list[ParserStatsDict]
+    step_definitions: list[StepDefinitionStatsDict]
+
+
+@dataclass(eq=False)
+class StepDefinitionStats:
+    """Matching statistics of a step definition.
+
+    Attributes:
+        definition (StepDefinition): The step definition.
+        attempts (int): The number of step texts its parser was tried against.
+        hits (int): The number of step texts its parser matched.
+        duration (float): The total time spent in its parser, in seconds.
+        slowest_steps (list[tuple[float, str]]): The step texts that took the longest to match, as a min-heap.
+    """
+
+    definition: StepDefinition
+    attempts: int = 0
+    hits: int = 0
+    duration: float = 0.0
+    slowest_steps: list[tuple[float, str]] = field(default_factory=list)
+
+    @property
+    def parser_name(self) -> str:
+        parser_class = type(self.definition.context.parser)
+        return f"{parser_class.__module__}.{parser_class.__qualname__}"
+
+    def serialize(self, rootpath: str) -> StepDefinitionStatsDict:
+        context = self.definition.context
+        return {
+            "type": context.type,
+            "parser": self.parser_name,
+            "expression": str(context.parser.name),
+            "location": getlocation(context.step_func, rootpath),
+            "attempts": self.attempts,
+            "hits": self.hits,
+            "duration": self.duration,
+            "slowest_steps": [
+                {"step": step_name, "duration": duration}
+                for duration, step_name in sorted(self.slowest_steps, reverse=True)
+            ],
+        }
+
+
+class MatchStats:
+    """Statistics of the step matching of a session."""
+
+    max_slowest_steps = 5
+
+    def __init__(self) -> None:
+        self.lookups = 0
+        self.lookup_duration = 0.0
+        self._step_definitions: dict[StepDefinition, StepDefinitionStats] = {}
+
+    def match_definition(self, definition: StepDefinition, step_name: str) -> StepMatch | None:
+        """Match a step text with the parser of a step definition, recording the attempt."""
+        start = perf_counter()
+        match = definition.context.parser.match(step_name)
+        self.record_match(definition, step_name, matched=match is not None, duration=perf_counter() - start)
+        return match
+
+    def record_match(self, definition: StepDefinition, step_name: str, matched: bool, duration: float) -> None:
+        """Record an attempt to match a step text with a step definition."""
+        stats = self._step_definitions.get(definition)
+        if stats is None:
+            stats = self._step_definitions[definition] = StepDefinitionStats(definition=definition)
+        stats.attempts += 1
+        stats.hits += matched
+        stats.duration += duration
+        if any(name == step_name for _, name in stats.slowest_steps):
+            return
+        if len(stats.slowest_steps) < self.max_slowest_steps:
+            heapq.heappush(stats.slowest_steps, (duration, step_name))
+        else:
+            heapq.heappushpop(stats.slowest_steps, (duration, step_name))
+
+    def record_lookup(self, duration: float) -> None:
+        """Record a lookup of the step definitions that can parse a step."""
+        self.lookups += 1
+        self.lookup_duration += duration
+
+    def step_definitions(self) -> list[StepDefinitionStats]:
+        """Get the statistics of the step definitions, from the slowest to the fastest."""
+        return sorted(self._step_definitions.values(), key=lambda stats: stats.duration, reverse=True)
+
+    def parsers(self) -> list[ParserStatsDict]:
+        """Get the statistics aggregated per parser class, from the slowest to the fastest."""
+        parsers: dict[str, ParserStatsDict] = {}
+        for stats in self._step_definitions.values():
+            parser_name = stats.parser_name
+            parser_stats = parsers.setdefault(
+                parser_name, {"parser": parser_name, "step_definitions": 0, "attempts": 0, "hits": 0, "duration": 0.0}
+            )
+            parser_stats["step_definitions"] += 1
+            parser_stats["attempts"] += stats.attempts
+            parser_stats["hits"] += stats.hits
+            parser_stats["duration"] += stats.duration
+        return sorted(parsers.values(), key=lambda stats: stats["duration"], reverse=True)
+
+    def serialize(self, rootpath: str) -> MatchStatsDict:
+        return {
+            "lookups": self.lookups,
+            "lookup_duration": self.lookup_duration,
+            "parsers": self.parsers(),
+            "step_definitions": [stats.serialize(rootpath) for stats in self.step_definitions()],
+        }
+
+
+def add_options(parser: Parser) -> None:
+    """Add pytest-bdd options."""
+    group = parser.getgroup("bdd", "Step matching statistics")
+    group.addoption(
+        "--bdd-match-stats",
+        action="store",
+        dest="bdd_match_stats_path",
+        metavar="path",
+        default=None,
+        help="record step matching statistics, print a summary and write them to a json file at given path.",
+    )
+
+
+def configure(config: Config) -> None:
+    match_stats_path = config.option.bdd_match_stats_path
+    if match_stats_path:
+        workerinput = getattr(config, "workerinput", None)
+        if workerinput is not None:
+            # xdist workers match the steps of their own tests, each of them writes its own file
+            root, ext = os.path.splitext(match_stats_path)
+            match_stats_path = f"{root}-{workerinput['workerid']}{ext}"
+        config._bddmatchstats = MatchStatsReporter(config, match_stats_path)  # type: ignore[attr-defined]
+        config.pluginmanager.register(config._bddmatchstats)  # type: ignore[attr-defined]
+
+
+def unconfigure(config: Config) -> None:
+    reporter = getattr(config, "_bddmatchstats", None)  # type: ignore[attr-defined]
+    if reporter is not None:
+        reporter.stop()
+        del config._bddmatchstats  # type: ignore[attr-defined]
+        config.pluginmanager.unregister(reporter)
+
+
+class MatchStatsReporter:
+    """Plugin recording the step matching statistics, and reporting them at the end of the session."""
+
+    max_step_definitions = 10
+
+    def __init__(self, config: Config, path: str) -> None:
+        path = os.path.expanduser(os.path.expandvars(path))
+        self.path = os.path.normpath(os.path.abspath(path))
+        self.config = config
+        self.rootpath = str(config.rootpath)
+        self.stats = MatchStats()
+        step_definition_index.match_stats = self.stats
+
+    def stop(self) -> None:
+        if step_definition_index.match_stats is self.stats:
+            step_definition_index.match_stats = None
+
+    def is_xdist_controller(self) -> bool:
+        """Whether the session distributes its tests to xdist workers, that match the steps and write the files."""
+        return self.config.pluginmanager.hasplugin("dsession")
+
+    def pytest_sessionfinish(self) -> None:
+        if self.is_xdist_controller():
+            return
+        with open(self.path, "w", encoding="utf-8") as stats_file:
+            json.dump(self.stats.serialize(self.rootpath), stats_file, indent=2)
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        if self.is_xdist_controller():
+            root, ext = os.path.splitext(self.path)
+            terminalreporter.write_sep(
+                "-", f"step matching statistics files generated by the xdist workers: {root}-<worker id>{ext}"
+            )
+            return
+        for line in self._summary_lines():
+            terminalreporter.write_line(line)
+        terminalreporter.write_sep("-", f"generated step matching statistics file: {self.path}")
+
+    def _summary_lines(self) -> Iterator[str]:
+        stats = self.stats
+        yield ""
+        yield f"Step matching statistics: {stats.lookups} lookups in {stats.lookup_duration * 1000:.2f}ms"
+        for parser_stats in stats.parsers():
+            yield (
+                f"  {parser_stats['parser']}: {parser_stats['step_definitions']} step definitions, "
+                f"{parser_stats['attempts']} attempts, {parser_stats['hits']} hits, "
+                f"{parser_stats['duration'] * 1000:.2f}ms"
+            )
+        step_definitions = stats.step_definitions()[: self.max_step_definitions]
+        if step_definitions:
+            yield "Slowest step definitions:"
+        for definition_stats in step_definitions:
+            serialized = definition_stats.serialize(self.rootpath)
+            yield (
+                f"  {serialized['type'] or '*'} {serialized['expression']!r} ({serialized['location']}): "
+                f"{serialized['attempts']} attempts, {serialized['hits']} hits, {serialized['duration'] * 1000:.2f}ms"
+            )
+            for slow_step in serialized["slowest_steps"][:1]:
+                yield f"    slowest step: {slow_step['step']!r} ({slow_step['duration'] * 1000:.3f}ms)"
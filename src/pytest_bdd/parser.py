@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import copy
 import os.path
 import re
+import sys
 import textwrap
 from collections import OrderedDict
 from collections.abc import Generator, Iterable, Mapping, Sequence
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 from .exceptions import StepError
 from .gherkin_parser import Background as GherkinBackground
@@ -45,13 +45,15 @@ def render_string(input_string: str, render_context: Mapping[str, object]) -> st
 def get_tag_names(tag_data: list[GherkinTag]) -> set[str]:
     """Extract tag names from tag data.
 
+    The names are interned, since the same tags are repeated across the feature files.
+
     Args:
         tag_data (list[dict]): The tag data to extract names from.
 
     Returns:
         set[str]: A set of tag names.
     """
-    return {tag.name.lstrip("@") for tag in tag_data}
+    return {sys.intern(tag.name.lstrip("@")) for tag in tag_data}
 
 
 @dataclass(eq=False)
@@ -104,7 +106,7 @@ class Examples:
         Args:
             keys (Iterable[str]): The parameter names to set.
         """
-        self.example_params = [str(key) for key in keys]
+        self.example_params = [sys.intern(str(key)) for key in keys]
 
     def add_example(self, values: Sequence[str]) -> None:
         """Add a new example row.
@@ -157,6 +159,8 @@ class ScenarioTemplate:
         _steps (list[Step]): The list of steps in the scenario (internal use only).
         examples (Examples | None): The examples used for parameterization in the scenario.
         rule (Rule | None): The rule to which the scenario may belong (None = no rule).
+        _background_steps (tuple[Step, ...] | None): The cached background steps (internal use only).
+        _all_steps (tuple[Step, ...] | None): The cached background and scenario steps (internal use only).
     """
 
     feature: Feature
@@ -169,6 +173,8 @@ class ScenarioTemplate:
     _steps: list[Step] = field(init=False, default_factory=list)
     examples: list[Examples] = field(default_factory=list[Examples])
     rule: Rule | None = None
+    _background_steps: tuple[Step, ...] | None = field(init=False, default=None, repr=False, compare=False)
+    _all_steps: tuple[Step, ...] | None = field(init=False, default=None, repr=False, compare=False)
 
     def add_step(self, step: Step) -> None:
         """Add a step to the scenario.
@@ -178,26 +184,43 @@ class ScenarioTemplate:
         """
         step.scenario = self
         self._steps.append(step)
+        self._all_steps = None
 
     @property
-    def all_background_steps(self) -> list[Step]:
-        steps = []
-        # Add background steps from the feature
-        if self.feature.background:
-            steps.extend(self.feature.background.steps)
+    def all_background_steps(self) -> tuple[Step, ...]:
+        """Get the background steps of the feature and of the rule of the scenario.
+
+        They are cached, and composed again if steps were added to the backgrounds since (the steps of a background
+        are only ever appended, the parser completes the backgrounds before parsing the scenarios).
+
+        Returns:
+            tuple[Step, ...]: The background steps of the feature, followed by the ones of the rule.
+        """
+        background_steps_count = len(self.feature.background.steps) if self.feature.background else 0
         if self.rule is not None and self.rule.background is not None:
-            # Add background steps from the rule
-            steps.extend(self.rule.background.steps)
-        return steps
+            background_steps_count += len(self.rule.background.steps)
+        if self._background_steps is None or len(self._background_steps) != background_steps_count:
+            steps: list[Step] = []
+            # Add background steps from the feature
+            if self.feature.background:
+                steps.extend(self.feature.background.steps)
+            if self.rule is not None and self.rule.background is not None:
+                # Add background steps from the rule
+                steps.extend(self.rule.background.steps)
+            self._background_steps = tuple(steps)
+        return self._background_steps
 
     @property
-    def steps(self) -> list[Step]:
+    def steps(self) -> tuple[Step, ...]:
         """Get all steps for the scenario, including background steps.
 
         Returns:
-            list[Step]: A list of steps, including any background steps from the feature.
+            tuple[Step, ...]: The steps, including any background steps from the feature and the rule.
         """
-        return self.all_background_steps + self._steps
+        background_steps = self.all_background_steps
+        if self._all_steps is None or len(self._all_steps) != len(background_steps) + len(self._steps):
+            self._all_steps = background_steps + tuple(self._steps)
+        return self._all_steps
 
     def render(self, context: Mapping[str, object]) -> Scenario:
         """Render the scenario with the given context.
@@ -209,10 +232,9 @@ class ScenarioTemplate:
             Scenario: A Scenario object with steps rendered based on the context.
         """
         example = self.find_scenario_example_from_context(context)
-        base_steps = self.all_background_steps + self._steps
         scenario_steps = [
             Step(
-                name=render_string(step.name, context),
+                name=sys.intern(render_string(step.name, context)),
                 type=step.type,
                 indent=step.indent,
                 line_number=step.line_number,
@@ -220,7 +242,7 @@ class ScenarioTemplate:
                 datatable=step.render_datatable(step.datatable, context) if step.datatable else None,
                 docstring=render_string(step.docstring, context) if step.docstring else None,
             )
-            for step in base_steps
+            for step in self.steps
         ]
         return Scenario(
             feature=self.feature,
@@ -346,11 +368,11 @@ class Step:
         Returns:
             datatable (DataTable): The rendered datatable with parameters replaced only if they exist in the context.
         """
-        rendered_datatable = copy.deepcopy(datatable)
-        for row in rendered_datatable.rows:
-            for cell in row.cells:
-                cell.value = render_string(cell.value, context)
-        return rendered_datatable
+        rows = [
+            replace(row, cells=[replace(cell, value=render_string(cell.value, context)) for cell in row.cells])
+            for row in datatable.rows
+        ]
+        return replace(datatable, rows=rows)
 
 
 @dataclass(eq=False)
@@ -392,6 +414,8 @@ class FeatureParser:
     def parse_steps(self, steps_data: list[GherkinStep]) -> list[Step]:
         """Parse a list of step data into Step objects.
 
+        The step texts and keywords are interned, since the same steps are repeated across the scenarios.
+
         Args:
             steps_data (list[dict]): The list of step data.
 
@@ -417,11 +441,11 @@ class FeatureParser:
             current_type = STEP_TYPE_BY_PARSER_KEYWORD.get(step.keyword_type, current_type)
             steps.append(
                 Step(
-                    name=step.text,
+                    name=sys.intern(step.text),
                     type=current_type,
                     indent=step.location.column - 1,
                     line_number=step.location.line,
-                    keyword=step.keyword.title(),
+                    keyword=sys.intern(step.keyword.title()),
                     datatable=step.datatable,
                     docstring=step.docstring.content if step.docstring else None,
                 )
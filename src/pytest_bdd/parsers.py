@@ -3,12 +3,43 @@
 from __future__ import annotations
 
 import abc
+import functools
 import re as base_re
-from typing import Any, TypeVar, cast, overload
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable, TypeVar, cast, overload
 
 import parse as base_parse
 from parse_type import cfparse as base_cfparse
 
+# Guards the lazy compilation of the step expressions
+_compile_lock = threading.Lock()
+
+
+class StepMatch:
+    """Result of matching a step name with a step parser.
+
+    The step arguments are extracted again at each access, from the match of the parser expression when
+    the parser keeps it, so that every execution of the step gets its own argument values: the parser
+    types may return mutable objects, that a step function could modify.
+    """
+
+    def __init__(
+        self, parser: StepParser, name: str, get_arguments: Callable[[], dict[str, Any]] | None = None
+    ) -> None:
+        self.parser = parser
+        self.name = name
+        self._get_arguments = get_arguments
+
+    @property
+    def arguments(self) -> dict[str, Any] | None:
+        """Step arguments, extracted at each access."""
+        if self._get_arguments is None:
+            return self.parser.parse_arguments(self.name)
+        return self._get_arguments()
+
 
 class StepParser(abc.ABC):
     """Parser of the individual step."""
@@ -16,6 +47,22 @@ class StepParser(abc.ABC):
     def __init__(self, name: str) -> None:
         self.name = name
 
+    def compile(self) -> None:
+        """Compile the step expression ahead of the first match.
+
+        Parsers compiling their expression on first use override this.
+        """
+        return None
+
+    def match(self, name: str) -> StepMatch | None:
+        """Match given name with the step name.
+
+        :return: `StepMatch` carrying the step arguments, or None if the name doesn't match.
+        """
+        if not self.is_matching(name):
+            return None
+        return StepMatch(self, name)
+
     @abc.abstractmethod
     def parse_arguments(self, name: str) -> dict[str, Any] | None:
         """Get step arguments from the given step name.
@@ -31,12 +78,49 @@ class StepParser(abc.ABC):
 
 
 class re(StepParser):
-    """Regex step parser."""
+    """Regex step parser.
+
+    The regex is compiled on first use.
+    """
 
     def __init__(self, name: str, *args: Any, **kwargs: Any) -> None:
-        """Compile regex."""
         super().__init__(name)
-        self.regex = base_re.compile(self.name, *args, **kwargs)
+        self._compile_args = args
+        self._compile_kwargs = kwargs
+        self._regex: base_re.Pattern[str] | None = None
+
+    @property
+    def regex(self) -> base_re.Pattern[str]:
+        """The compiled regex."""
+        regex = self._regex
+        if regex is None:
+            regex = self._compile_regex()
+        return regex
+
+    @regex.setter
+    def regex(self, regex: base_re.Pattern[str]) -> None:
+        self._regex = regex
+
+    @property
+    def pattern(self) -> str:
+        """The source of the regex."""
+        return self.name
+
+    @property
+    def flags(self) -> int:
+        """The flags given to compile the regex."""
+        flags = self._compile_args[0] if self._compile_args else self._compile_kwargs.get("flags", 0)
+        return int(flags)
+
+    def compile(self) -> None:
+        """Compile the regex ahead of the first match."""
+        self._compile_regex()
+
+    def _compile_regex(self) -> base_re.Pattern[str]:
+        with _compile_lock:
+            if self._regex is None:
+                self._regex = base_re.compile(self.pattern, *self._compile_args, **self._compile_kwargs)
+            return self._regex
 
     def parse_arguments(self, name: str) -> dict[str, str] | None:
         """Get step arguments.
@@ -48,18 +132,54 @@ class re(StepParser):
             return None
         return match.groupdict()
 
+    def match(self, name: str) -> StepMatch | None:
+        """Match given name with the step name, keeping the match to extract the step arguments."""
+        match = self.regex.fullmatch(name)
+        if match is None:
+            return None
+        return StepMatch(self, name, match.groupdict)
+
     def is_matching(self, name: str) -> bool:
         """Match given name with the step name."""
         return bool(self.regex.fullmatch(name))
 
 
 class parse(StepParser):
-    """parse step parser."""
+    """parse step parser.
+
+    The parse expression is compiled on first use.
+    """
 
     def __init__(self, name: str, *args: Any, **kwargs: Any) -> None:
-        """Compile parse expression."""
         super().__init__(name)
-        self.parser = base_parse.compile(self.name, *args, **kwargs)
+        self._compile_args = args
+        self._compile_kwargs = kwargs
+        self._parser: base_parse.Parser | None = None
+
+    @property
+    def parser(self) -> base_parse.Parser:
+        """The compiled parse expression."""
+        parser = self._parser
+        if parser is None:
+            parser = self._compile_parser()
+        return parser
+
+    @parser.setter
+    def parser(self, parser: base_parse.Parser) -> None:
+        self._parser = parser
+
+    def compile(self) -> None:
+        """Compile the parse expression ahead of the first match."""
+        self._compile_parser()
+
+    def _compile_parser(self) -> base_parse.Parser:
+        with _compile_lock:
+            if self._parser is None:
+                self._parser = self._make_parser()
+            return self._parser
+
+    def _make_parser(self) -> base_parse.Parser:
+        return base_parse.compile(self.name, *self._compile_args, **self._compile_kwargs)
 
     def parse_arguments(self, name: str) -> dict[str, Any]:
         """Get step arguments.
@@ -68,21 +188,327 @@ class parse(StepParser):
         """
         return cast(dict[str, Any], self.parser.parse(name).named)
 
+    def match(self, name: str) -> StepMatch | None:
+        """Match given name with the step name.
+
+        The name is matched once, but the types of the parse result are converted again at each access of
+        `StepMatch.arguments`, since the converted values would be shared.
+        """
+        result = self.parser.parse(name, evaluate_result=False)
+        if result is None:
+            return None
+        return StepMatch(self, name, lambda: cast(dict[str, Any], result.evaluate_result().named))
+
     def is_matching(self, name: str) -> bool:
         """Match given name with the step name."""
+        parser = self.parser
         try:
-            return bool(self.parser.parse(name))
+            return bool(parser.parse(name))
         except ValueError:
             return False
 
 
 class cfparse(parse):
-    """cfparse step parser."""
+    """cfparse step parser.
 
-    def __init__(self, name: str, *args: Any, **kwargs: Any) -> None:
-        """Compile parse expression."""
-        super(parse, self).__init__(name)
-        self.parser = base_cfparse.Parser(self.name, *args, **kwargs)
+    The parse expression is compiled on first use.
+    """
+
+    def _make_parser(self) -> base_parse.Parser:
+        return base_cfparse.Parser(self.name, *self._compile_args, **self._compile_kwargs)
+
+
+@dataclass(frozen=True)
+class ParameterType:
+    """A parameter type of the Cucumber Expressions, like ``{int}``.
+
+    Attributes:
+        name (str): The name of the parameter type, used between the braces.
+        regexp (str): The regular expression matching the parameter values.
+        transformer (Callable[[str], Any] | None): The function converting the matched text, if any.
+        groups (int): The number of capturing groups of the regular expression.
+    """
+
+    name: str
+    regexp: str
+    transformer: Callable[[str], Any] | None
+    groups: int
+
+
+class ParameterTypeRegistry:
+    """Registry of the parameter types of the Cucumber Expressions.
+
+    It is global: the parameter types defined with ``parsers.define_parameter_type`` are available
+    to all the ``parsers.cucumber`` expressions compiled afterwards.
+    """
+
+    def __init__(self) -> None:
+        self._parameter_types: dict[str, ParameterType] = {}
+
+    def define(
+        self, name: str, regexp: str | Sequence[str], transformer: Callable[[str], Any] | None = None
+    ) -> ParameterType:
+        """Define a parameter type.
+
+        Args:
+            name (str): The name of the parameter type, used as ``{name}`` in the expressions.
+            regexp (str | Sequence[str]): The regular expression(s) matching the parameter values.
+            transformer (Callable[[str], Any] | None): The function converting the matched text.
+                The text is passed as is when it is not given.
+
+        Returns:
+            ParameterType: The defined parameter type.
+        """
+        if CUCUMBER_ILLEGAL_PARAMETER_NAME_RE.search(name):
+            raise ValueError(f"Illegal character in parameter type name {name!r}")
+        if not isinstance(regexp, str):
+            regexp = "|".join(f"(?:{alternative})" for alternative in regexp)
+        compiled = base_re.compile(regexp)
+        if compiled.groupindex:
+            raise ValueError(f"The regular expression of the parameter type {name!r} can't have named groups")
+        parameter_type = ParameterType(name=name, regexp=regexp, transformer=transformer, groups=compiled.groups)
+        with _compile_lock:
+            if name in self._parameter_types:
+                raise ValueError(f"There is already a parameter type named {name!r}")
+            self._parameter_types[name] = parameter_type
+        return parameter_type
+
+    def get(self, name: str) -> ParameterType | None:
+        """Get a parameter type by name."""
+        return self._parameter_types.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._parameter_types
+
+
+def _unquote(value: str) -> str:
+    quote = value[0]
+    return value[1:-1].replace(f"\\{quote}", quote)
+
+
+CUCUMBER_ILLEGAL_PARAMETER_NAME_RE = base_re.compile(r"[{}()\\/]")
+CUCUMBER_INTEGER_REGEXP = r"[-+]?\d+"
+CUCUMBER_FLOAT_REGEXP = r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?"
+
+parameter_type_registry = ParameterTypeRegistry()
+for _name in ("int", "biginteger", "byte", "short", "long"):
+    parameter_type_registry.define(_name, CUCUMBER_INTEGER_REGEXP, int)
+for _name in ("float", "double"):
+    parameter_type_registry.define(_name, CUCUMBER_FLOAT_REGEXP, float)
+parameter_type_registry.define("bigdecimal", CUCUMBER_FLOAT_REGEXP, Decimal)
+parameter_type_registry.define("word", r"[^\s]+")
+parameter_type_registry.define("string", r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'', _unquote)
+parameter_type_registry.define("", r".*")
+del _name
+
+
+def define_parameter_type(
+    name: str, regexp: str | Sequence[str], transformer: Callable[[str], Any] | None = None
+) -> ParameterType:
+    """Define a parameter type for the ``parsers.cucumber`` expressions.
+
+    See ``ParameterTypeRegistry.define``.
+    """
+    return parameter_type_registry.define(name, regexp, transformer)
+
+
+class cucumber(re):
+    """Cucumber Expressions step parser.
+
+    The expression (e.g. ``"I have {int} cucumber(s) in my belly/stomach"``) is translated into a regular
+    expression, compiled on first use. The argument converters of its parameter types are looked up once,
+    and the values are converted each time the arguments of a match are extracted: when the step is executed,
+    so only the transformers of the step definition that is executed run.
+
+    Cucumber Expressions parameters are positional: the names of the step arguments are given in order with
+    ``names`` (e.g. ``names=["count"]``). The syntax of the expression and the number of names are checked
+    when the parser is created, the parameter types are only looked up on first use.
+    """
+
+    def __init__(self, name: str, names: Sequence[str] | None = None) -> None:
+        super().__init__(name)
+        self.names = tuple(names) if names is not None else None
+        self._words = _split_cucumber_expression(name, self.names)
+        self._pattern: str | None = None
+        self._converters: tuple[tuple[str, int, Callable[[str], Any] | None], ...] = ()
+
+    @property
+    def pattern(self) -> str:
+        """The regular expression the Cucumber Expression is translated into."""
+        pattern = self._pattern
+        if pattern is None:
+            pattern = self._translate()
+        return pattern
+
+    def _translate(self) -> str:
+        with _compile_lock:
+            if self._pattern is None:
+                self._pattern, self._converters = _translate_cucumber_words(self.name, self._words, self.names)
+            return self._pattern
+
+    def _compile_regex(self) -> base_re.Pattern[str]:
+        self._translate()
+        return super()._compile_regex()
+
+    def _convert(self, match: base_re.Match[str]) -> dict[str, Any]:
+        arguments = {}
+        for name, group, transformer in self._converters:
+            value = match.group(group)
+            arguments[name] = value if value is None or transformer is None else transformer(value)
+        return arguments
+
+    def parse_arguments(self, name: str) -> dict[str, Any] | None:
+        """Get step arguments.
+
+        :return: `dict` of step arguments
+        """
+        match = self.regex.fullmatch(name)
+        if match is None:
+            return None
+        return self._convert(match)
+
+    def match(self, name: str) -> StepMatch | None:
+        """Match given name with the step name, keeping the match to extract and convert the step arguments."""
+        match = self.regex.fullmatch(name)
+        if match is None:
+            return None
+        return StepMatch(self, name, functools.partial(self._convert, match))
+
+
+def _tokenize_cucumber_expression(expression: str) -> list[tuple[str, str]]:
+    """Split a Cucumber Expression into ``(kind, text)`` tokens.
+
+    The kinds are ``"text"``, ``"space"``, ``"parameter"``, ``"optional"`` and ``"alternation"``.
+    """
+    tokens: list[tuple[str, str]] = []
+    pos = 0
+    while pos < len(expression):
+        char = expression[pos]
+        if char == "\\":
+            if pos + 1 == len(expression):
+                raise ValueError(f"The escape character at the end of {expression!r} doesn't escape anything")
+            tokens.append(("text", expression[pos + 1]))
+            pos += 2
+            continue
+        if char in "{(":
+            start = pos
+            end_char, kind, label = (
+                ("}", "parameter", "parameter") if char == "{" else (")", "optional", "optional text")
+            )
+            text = []
+            pos += 1
+            while pos < len(expression) and expression[pos] != end_char:
+                if expression[pos] == "\\" and pos + 1 < len(expression):
+                    pos += 1
+                elif expression[pos] in "{(":
+                    nested = "A parameter" if expression[pos] == "{" else "An optional text"
+                    raise ValueError(f"{nested} can't be used in the {label} at {start} of {expression!r}")
+                text.append(expression[pos])
+                pos += 1
+            if pos == len(expression):
+                raise ValueError(f"The {label} at {start} of {expression!r} is not closed")
+            if kind == "optional" and not text:
+                raise ValueError(f"The optional text at {start} of {expression!r} is empty")
+            tokens.append((kind, "".join(text)))
+            pos += 1
+            continue
+        if char in "})":
+            raise ValueError(f"Unexpected {char!r} at {pos} of {expression!r}")
+        tokens.append(("space" if char.isspace() else "alternation" if char == "/" else "text", char))
+        pos += 1
+    return tokens
+
+
+def _split_cucumber_expression(expression: str, names: Sequence[str] | None) -> list[list[tuple[str, str]]]:
+    """Split a Cucumber Expression into words of ``(kind, text)`` tokens, checking its syntax and argument names.
+
+    The parameter types are not looked up, so that they can be defined after the expression.
+    """
+    # Words are separated by whitespace, alternations apply to whole words
+    words: list[list[tuple[str, str]]] = [[]]
+    for kind, text in _tokenize_cucumber_expression(expression):
+        if kind == "space":
+            words.append([(kind, text)])
+            words.append([])
+        else:
+            words[-1].append((kind, text))
+
+    parameters = 0
+    for word in words:
+        alternatives: list[list[str]] = [[]]
+        for kind, _ in word:
+            if kind == "alternation":
+                alternatives.append([])
+            else:
+                alternatives[-1].append(kind)
+        kinds = [kind for alternative in alternatives for kind in alternative]
+        parameters += kinds.count("parameter")
+        if len(alternatives) == 1:
+            continue
+        if any(not alternative for alternative in alternatives):
+            raise ValueError(f"An alternative is empty in {expression!r}")
+        if "parameter" in kinds:
+            raise ValueError(f"A parameter can't be used in an alternation in {expression!r}")
+
+    if names is None:
+        names = ()
+    if len(names) != parameters:
+        raise ValueError(f"{len(names)} argument names given for the {parameters} parameters of {expression!r}")
+    if len(set(names)) != len(names):
+        raise ValueError(f"The argument names {list(names)!r} of {expression!r} are not unique")
+    return words
+
+
+def translate_cucumber_expression(
+    expression: str, names: Sequence[str] | None = None
+) -> tuple[str, tuple[tuple[str, int, Callable[[str], Any] | None], ...]]:
+    """Translate a Cucumber Expression into a regular expression.
+
+    Returns:
+        tuple: The regular expression, and for each parameter its argument name, its group number
+            and the transformer of its parameter type.
+
+    Example:
+    >>> pattern, converters = translate_cucumber_expression("I eat {int} cucumber(s) at lunch/dinner", ["count"])
+    >>> print(pattern)
+    I\\ eat\\ ([-+]?\\d+)\\ cucumber(?:s)?\\ at\\ (?:lunch|dinner)
+    >>> converters
+    (('count', 1, <class 'int'>),)
+    """
+    return _translate_cucumber_words(expression, _split_cucumber_expression(expression, names), names)
+
+
+def _translate_cucumber_words(
+    expression: str, words: list[list[tuple[str, str]]], names: Sequence[str] | None
+) -> tuple[str, tuple[tuple[str, int, Callable[[str], Any] | None], ...]]:
+    parameter_types = []
+    parts = []
+    group = 1
+    for word in words:
+        alternatives: list[list[str]] = [[]]
+        for kind, text in word:
+            if kind == "alternation":
+                alternatives.append([])
+            elif kind == "parameter":
+                parameter_type = parameter_type_registry.get(text)
+                if parameter_type is None:
+                    raise ValueError(f"Undefined parameter type {{{text}}} in {expression!r}")
+                parameter_types.append((parameter_type, group))
+                group += 1 + parameter_type.groups
+                alternatives[-1].append(f"({parameter_type.regexp})")
+            elif kind == "optional":
+                alternatives[-1].append(f"(?:{base_re.escape(text)})?")
+            else:
+                alternatives[-1].append(base_re.escape(text))
+        if len(alternatives) == 1:
+            parts.extend(alternatives[0])
+        else:
+            parts.append(f"(?:{'|'.join(''.join(alternative) for alternative in alternatives)})")
+
+    converters = tuple(
+        (name, group, parameter_type.transformer) for name, (parameter_type, group) in zip(names or (), parameter_types)
+    )
+    return "".join(parts), converters
 
 
 class string(StepParser):
@@ -95,6 +521,12 @@ class string(StepParser):
         """
         return {}
 
+    def match(self, name: str) -> StepMatch | None:
+        """Match given name with the step name."""
+        if self.name != name:
+            return None
+        return StepMatch(self, name, dict)
+
     def is_matching(self, name: str) -> bool:
         """Match given name with the step name."""
         return self.name == name
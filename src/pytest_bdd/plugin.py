@@ -8,14 +8,29 @@ from typing import TYPE_CHECKING, Callable, TypeVar, cast
 import pytest
 from typing_extensions import ParamSpec
 
-from . import cucumber_json, generation, gherkin_terminal_reporter, given, reporting, then, when
+from . import cucumber_json, feature, generation, gherkin_terminal_reporter, given, match_stats, reporting, then, when
+from .scenario import (
+    AMBIGUOUS_STEPS_IGNORE,
+    AMBIGUOUS_STEPS_MODES,
+    AMBIGUOUS_STEPS_WARN,
+    UNDEFINED_STEPS_DESELECT,
+    UNDEFINED_STEPS_MODES,
+    UNDEFINED_STEPS_RUN,
+    deselect_undefined_scenario_items,
+    get_ambiguous_steps_mode,
+    get_undefined_steps_mode,
+    invalidate_step_resolution_caches,
+    plan_scenario_items,
+    warn_ambiguous_steps,
+)
 from .utils import CONFIG_STACK
 
 if TYPE_CHECKING:
     from _pytest.config import Config, PytestPluginManager
     from _pytest.config.argparsing import Parser
     from _pytest.fixtures import FixtureRequest
-    from _pytest.nodes import Item
+    from _pytest.main import Session
+    from _pytest.nodes import Collector, Item
     from _pytest.runner import CallInfo
     from pluggy._result import _Result
 
@@ -58,21 +73,81 @@ def _pytest_bdd_example() -> dict:
 def pytest_addoption(parser: Parser) -> None:
     """Add pytest-bdd options."""
     add_bdd_ini(parser)
+    add_bdd_options(parser)
     cucumber_json.add_options(parser)
     generation.add_options(parser)
     gherkin_terminal_reporter.add_options(parser)
+    match_stats.add_options(parser)
 
 
 def add_bdd_ini(parser: Parser) -> None:
     parser.addini("bdd_features_base_dir", "Base features directory.")
+    parser.addini(
+        "bdd_feature_cache",
+        "Persist the parsed feature files in the pytest cache directory, to load them instead of parsing them "
+        "in the next sessions.",
+        type="bool",
+        default=False,
+    )
+    parser.addini(
+        "bdd_features_cache_size",
+        "Maximum number of parsed feature files kept in memory, the least recently used ones are parsed again "
+        "when needed (default: 0, no limit).",
+        default=str(feature.FEATURES_CACHE_SIZE or 0),
+    )
+    parser.addini(
+        "bdd_parse_workers",
+        "Number of processes parsing the feature files found by scenarios() in parallel, or 'auto' for one per CPU "
+        "(default: 0, parse them sequentially).",
+        default="0",
+    )
+    parser.addini(
+        "bdd_undefined_steps",
+        f"What to do with the scenarios having undefined steps: {', '.join(UNDEFINED_STEPS_MODES)}.",
+        default=UNDEFINED_STEPS_RUN,
+    )
+    parser.addini(
+        "bdd_ambiguous_steps",
+        "What to do with the steps that several step definitions at the same scope can parse: "
+        f"{', '.join(AMBIGUOUS_STEPS_MODES)}.",
+        default=AMBIGUOUS_STEPS_IGNORE,
+    )
+
+
+def add_bdd_options(parser: Parser) -> None:
+    group = parser.getgroup("bdd", "Scenarios")
+    group.addoption(
+        "--bdd-undefined-steps",
+        action="store",
+        dest="bdd_undefined_steps",
+        choices=UNDEFINED_STEPS_MODES,
+        default=None,
+        help="What to do with the scenarios having undefined steps: run them until the undefined step (default), "
+        "fail them before running any step, or deselect them. Overrides the bdd_undefined_steps ini option.",
+    )
+    group.addoption(
+        "--bdd-ambiguous-steps",
+        action="store",
+        dest="bdd_ambiguous_steps",
+        choices=AMBIGUOUS_STEPS_MODES,
+        default=None,
+        help="What to do with the steps that several step definitions at the same scope can parse, checked when "
+        "the scenarios are collected: ignore them and use the last registered one (default), warn about them, or "
+        "fail the scenarios using them. Overrides the bdd_ambiguous_steps ini option.",
+    )
 
 
 @pytest.hookimpl(trylast=True)
 def pytest_configure(config: Config) -> None:
     """Configure all subplugins."""
     CONFIG_STACK.append(config)
+    # Validate the options early
+    get_undefined_steps_mode(config)
+    get_ambiguous_steps_mode(config)
+    feature.configure(config)
     cucumber_json.configure(config)
     gherkin_terminal_reporter.configure(config)
+    match_stats.configure(config)
 
 
 def pytest_unconfigure(config: Config) -> None:
@@ -80,6 +155,30 @@ def pytest_unconfigure(config: Config) -> None:
     if CONFIG_STACK:
         CONFIG_STACK.pop()
     cucumber_json.unconfigure(config)
+    match_stats.unconfigure(config)
+    feature.unconfigure(config)
+
+
+def pytest_plugin_registered(plugin: object, manager: PytestPluginManager) -> None:
+    # Conftest files and plugins may define step definitions
+    invalidate_step_resolution_caches()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_make_collect_report(collector: Collector) -> Generator[None, _Result, None]:
+    yield
+    # Collecting a node parses the fixtures it defines, including step definitions
+    invalidate_step_resolution_caches()
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session: Session, config: Config, items: list[Item]) -> None:
+    # Resolve the steps of the selected scenarios once, instead of at each run
+    plan_scenario_items(items, session._fixturemanager)
+    if get_undefined_steps_mode(config) == UNDEFINED_STEPS_DESELECT:
+        deselect_undefined_scenario_items(config, items)
+    if get_ambiguous_steps_mode(config) == AMBIGUOUS_STEPS_WARN:
+        warn_ambiguous_steps(config, items)
 
 
 @pytest.hookimpl(hookwrapper=True)
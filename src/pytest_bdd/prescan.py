@@ -0,0 +1,314 @@
+"""Prescan of the feature files.
+
+Extract the names, tags and line numbers of the feature, rules and scenarios of a feature file by looking at
+the first word of its lines, without the Gherkin parser nor the models of ``pytest_bdd.parser``.
+Selection tooling can use it to find the feature files that need a full parse.
+
+The summaries are kept in a ``FeatureIndex``, persisted as a JSON file next to the feature cache.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from gherkin.dialect import Dialect  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Version of the JSON format of the feature index, to bump whenever the summaries change
+FEATURE_INDEX_FORMAT = 1
+
+LANGUAGE_RE = re.compile(r"^\s*#\s*language\s*:\s*([a-zA-Z\-_]+)\s*$")
+TAG_COMMENT_RE = re.compile(r"\s#")
+
+FEATURE = "feature"
+RULE = "rule"
+BACKGROUND = "background"
+SCENARIO = "scenario"
+EXAMPLES = "examples"
+
+
+@dataclass(frozen=True)
+class RuleSummary:
+    """Name, line number and tags of a rule."""
+
+    name: str
+    line_number: int
+    tags: frozenset[str]
+
+
+@dataclass(frozen=True)
+class ScenarioSummary:
+    """Name, line number and tags of a scenario.
+
+    The tags are the ones pytest-bdd applies to the scenario: the tags of the scenario, of its feature,
+    of its rule and of its examples.
+    """
+
+    name: str
+    line_number: int
+    tags: frozenset[str]
+    rule: str | None = None
+
+
+@dataclass(frozen=True)
+class FeatureSummary:
+    """Summary of a feature file, as found by `prescan_feature_file`."""
+
+    filename: str
+    name: str
+    line_number: int
+    tags: frozenset[str]
+    rules: tuple[RuleSummary, ...]
+    scenarios: tuple[ScenarioSummary, ...]
+
+    @property
+    def all_tags(self) -> frozenset[str]:
+        """All the tags of the feature file."""
+        return self.tags.union(*(scenario.tags for scenario in self.scenarios))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "filename": self.filename,
+            "name": self.name,
+            "line_number": self.line_number,
+            "tags": sorted(self.tags),
+            "rules": [
+                {"name": rule.name, "line_number": rule.line_number, "tags": sorted(rule.tags)} for rule in self.rules
+            ],
+            "scenarios": [
+                {
+                    "name": scenario.name,
+                    "line_number": scenario.line_number,
+                    "tags": sorted(scenario.tags),
+                    "rule": scenario.rule,
+                }
+                for scenario in self.scenarios
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FeatureSummary:
+        return cls(
+            filename=data["filename"],
+            name=data["name"],
+            line_number=data["line_number"],
+            tags=frozenset(data["tags"]),
+            rules=tuple(
+                RuleSummary(name=rule["name"], line_number=rule["line_number"], tags=frozenset(rule["tags"]))
+                for rule in data["rules"]
+            ),
+            scenarios=tuple(
+                ScenarioSummary(
+                    name=scenario["name"],
+                    line_number=scenario["line_number"],
+                    tags=frozenset(scenario["tags"]),
+                    rule=scenario["rule"],
+                )
+                for scenario in data["scenarios"]
+            ),
+        )
+
+
+@lru_cache
+def _get_keywords(language: str) -> dict[str, str]:
+    """Get the section keywords of the language (followed by a colon), and the kind of section they start."""
+    dialect = Dialect.for_name(language)
+    if dialect is None:
+        # Reported by the Gherkin parser
+        return _get_keywords("en")
+    keywords = {}
+    for kind, names in (
+        (FEATURE, dialect.feature_keywords),
+        (RULE, dialect.rule_keywords),
+        (BACKGROUND, dialect.background_keywords),
+        (SCENARIO, dialect.scenario_keywords + dialect.scenario_outline_keywords),
+        (EXAMPLES, dialect.examples_keywords),
+    ):
+        for name in names:
+            keywords[f"{name}:"] = kind
+    return keywords
+
+
+def _get_tag_names(line: str) -> list[str]:
+    uncommented_line = TAG_COMMENT_RE.split(line, maxsplit=1)[0]
+    return [tag.strip() for tag in uncommented_line.split("@")[1:]]
+
+
+def prescan_feature_file(filename: str, encoding: str = "utf-8") -> FeatureSummary:
+    """Extract the names, tags and line numbers of the feature, rules and scenarios of a feature file.
+
+    Only the lines starting with a tag or a section keyword (``Feature:``, ``Rule:``, ``Scenario:``, ``Examples:``...)
+    are looked at, in the language of the ``# language:`` comment. The feature file is not validated.
+    """
+    with open(filename, encoding=encoding) as feature_file:
+        lines = feature_file.read().splitlines()
+
+    keywords = _get_keywords("en")
+    prefixes = tuple(keywords)
+    feature_name = ""
+    feature_line_number = 0
+    feature_tags: frozenset[str] = frozenset()
+    rules: list[RuleSummary] = []
+    scenarios: list[ScenarioSummary] = []
+    rule: RuleSummary | None = None
+    scenario: ScenarioSummary | None = None
+    examples_tags: set[str] = set()
+    tags: list[str] = []
+    docstring_separator = None
+
+    def add_scenario() -> None:
+        if scenario is not None:
+            scenarios.append(
+                ScenarioSummary(
+                    name=scenario.name,
+                    line_number=scenario.line_number,
+                    tags=scenario.tags.union(feature_tags, rule.tags if rule else (), examples_tags),
+                    rule=scenario.rule,
+                )
+            )
+
+    for line_number, line in enumerate(lines, start=1):
+        text = line.strip()
+        if docstring_separator is not None:
+            if text.startswith(docstring_separator):
+                docstring_separator = None
+            continue
+        if not text or text[0] == "|":
+            continue
+        if text[0] == "#":
+            if not feature_line_number and (match := LANGUAGE_RE.match(text)):
+                keywords = _get_keywords(match.group(1))
+                prefixes = tuple(keywords)
+            continue
+        if text[0] == "@":
+            tags.extend(_get_tag_names(text))
+            continue
+        if text.startswith(('"""', "```")):
+            docstring_separator = text[:3]
+            continue
+        if not text.startswith(prefixes):
+            continue
+
+        keyword, _, name = text.partition(":")
+        kind = keywords[f"{keyword}:"]
+        name = name.strip()
+        if kind == EXAMPLES:
+            examples_tags.update(tags)
+        elif kind == FEATURE:
+            feature_name, feature_line_number, feature_tags = name, line_number, frozenset(tags)
+        else:
+            add_scenario()
+            scenario = None
+            examples_tags = set()
+            if kind == RULE:
+                rule = RuleSummary(name=name, line_number=line_number, tags=frozenset(tags))
+                rules.append(rule)
+            elif kind == SCENARIO:
+                scenario = ScenarioSummary(
+                    name=name, line_number=line_number, tags=frozenset(tags), rule=rule.name if rule else None
+                )
+        tags = []
+    add_scenario()
+
+    return FeatureSummary(
+        filename=filename,
+        name=feature_name,
+        line_number=feature_line_number,
+        tags=feature_tags,
+        rules=tuple(rules),
+        scenarios=tuple(scenarios),
+    )
+
+
+class FeatureIndex:
+    """Summaries of the feature files, persisted in a JSON file.
+
+    A summary is invalidated when the modification time or the size of its feature file changes.
+    The index is loaded from ``path`` when it is created, and written by `save` if a summary was added or replaced:
+    to ``save_path`` if given, so that concurrent sessions (e.g. xdist workers) write their own file instead of
+    overwriting the summaries of each other, and ``merge`` them in the index afterwards.
+    """
+
+    def __init__(self, path: str, save_path: str | None = None) -> None:
+        self.path = path
+        self.save_path = save_path or path
+        self._entries: dict[str, dict[str, Any]] = self._read(path)
+        self._modified = False
+        self._lock = threading.Lock()
+
+    def get_summary(self, filename: str, encoding: str = "utf-8") -> FeatureSummary:
+        """Get the summary of the feature file, prescanning it if it is not indexed or if it changed."""
+        filename = os.path.abspath(filename)
+        stat = os.stat(filename)
+        with self._lock:
+            entry = self._entries.get(filename)
+        if (
+            entry is not None
+            and entry["mtime_ns"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+            and entry["encoding"] == encoding
+        ):
+            return FeatureSummary.from_dict(entry["summary"])
+
+        summary = prescan_feature_file(filename, encoding)
+        with self._lock:
+            self._entries[filename] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "encoding": encoding,
+                "summary": summary.to_dict(),
+            }
+            self._modified = True
+        return summary
+
+    def merge(self, paths: Iterable[str]) -> None:
+        """Add the summaries of other index files (e.g. written by the xdist workers), and remove these files."""
+        for path in paths:
+            entries = self._read(path)
+            with contextlib.suppress(OSError):
+                os.remove(path)
+            if entries:
+                with self._lock:
+                    self._entries.update(entries)
+                    self._modified = True
+
+    def save(self) -> None:
+        """Write the index, if it was modified."""
+        with self._lock:
+            if not self._modified:
+                return
+            content = json.dumps({"version": FEATURE_INDEX_FORMAT, "features": self._entries})
+            self._modified = False
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.save_path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as index_file:
+                index_file.write(content)
+            os.replace(tmp_path, self.save_path)
+        except OSError:
+            logger.debug("Could not write the feature index %r", self.save_path, exc_info=True)
+
+    @staticmethod
+    def _read(path: str) -> dict[str, dict[str, Any]]:
+        try:
+            with open(path, encoding="utf-8") as index_file:
+                data = json.load(index_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.debug("Could not load the feature index %r", path, exc_info=True)
+            return {}
+        if not isinstance(data, dict) or data.get("version") != FEATURE_INDEX_FORMAT:
+            return {}
+        entries = data.get("features")
+        return entries if isinstance(entries, dict) else {}
@@ -13,27 +13,36 @@ test_publish_article = scenario(
 
 from __future__ import annotations
 
-import contextlib
 import logging
 import os
 import re
+import warnings
 from collections.abc import Iterable, Iterator
-from inspect import signature
-from typing import TYPE_CHECKING, Callable, TypeVar, cast
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, NoReturn, TypeVar, cast
 from weakref import WeakKeyDictionary
 
 import pytest
+from _pytest.compat import getlocation
 from _pytest.fixtures import FixtureDef, FixtureManager, FixtureRequest, call_fixture_func
 
 from . import exceptions
 from .compat import getfixturedefs, inject_fixture
 from .feature import get_feature, get_features
-from .steps import StepFunctionContext, get_step_fixture_name, step_function_context_registry
+from .parsers import StepMatch
+from .step_index import StepParserFailure, step_definition_index
+from .steps import (
+    STEP_ARGUMENT_DATATABLE,
+    STEP_ARGUMENT_DOCSTRING,
+    StepFunctionContext,
+    step_function_context_registry,
+)
 from .utils import (
     CONFIG_STACK,
     get_caller_module_locals,
     get_caller_module_path,
     get_required_args,
+    get_unique_name,
     identity,
     registry_get_safe,
 )
@@ -51,35 +60,50 @@ logger = logging.getLogger(__name__)
 PYTHON_REPLACE_REGEX = re.compile(r"\W")
 ALPHA_REGEX = re.compile(r"^\d+_*")
 
-STEP_ARGUMENT_DATATABLE = "datatable"
-STEP_ARGUMENT_DOCSTRING = "docstring"
 STEP_ARGUMENTS_RESERVED_NAMES = {STEP_ARGUMENT_DATATABLE, STEP_ARGUMENT_DOCSTRING}
 
+UNDEFINED_STEPS_RUN = "run"
+UNDEFINED_STEPS_FAIL = "fail"
+UNDEFINED_STEPS_DESELECT = "deselect"
+UNDEFINED_STEPS_MODES = (UNDEFINED_STEPS_RUN, UNDEFINED_STEPS_FAIL, UNDEFINED_STEPS_DESELECT)
+
+AMBIGUOUS_STEPS_IGNORE = "ignore"
+AMBIGUOUS_STEPS_WARN = "warn"
+AMBIGUOUS_STEPS_FAIL = "fail"
+AMBIGUOUS_STEPS_MODES = (AMBIGUOUS_STEPS_IGNORE, AMBIGUOUS_STEPS_WARN, AMBIGUOUS_STEPS_FAIL)
+
 scenario_wrapper_template_registry: WeakKeyDictionary[Callable[..., object], ScenarioTemplate] = WeakKeyDictionary()
 
 
 def find_fixturedefs_for_step(step: Step, fixturemanager: FixtureManager, node: Node) -> Iterable[FixtureDef[object]]:
-    """Find the fixture defs that can parse a step."""
-    # happens to be that _arg2fixturedefs is changed during the iteration so we use a copy
-    fixture_def_by_name = list(fixturemanager._arg2fixturedefs.items())
-    for fixturename, fixturedefs in fixture_def_by_name:
-        for _, fixturedef in enumerate(fixturedefs):
-            step_func_context = step_function_context_registry.get(fixturedef.func)
-            if step_func_context is None:
-                continue
+    """Find the fixture defs that can parse a step.
 
-            if step_func_context.type is not None and step_func_context.type != step.type:
-                continue
+    The step definition index gives us the definitions that can parse the step text, then we keep
+    the fixture defs providing them that are visible from the node.
+    """
+    for fixturedef, _ in find_step_matches(step=step, fixturemanager=fixturemanager, node=node):
+        yield fixturedef
 
-            match = step_func_context.parser.is_matching(step.name)
-            if not match:
-                continue
 
-            fixturedefs = list(getfixturedefs(fixturemanager, fixturename, node) or [])
-            if fixturedef not in fixturedefs:
-                continue
+def find_step_matches(
+    step: Step, fixturemanager: FixtureManager, node: Node
+) -> Iterator[tuple[FixtureDef[object], StepMatch]]:
+    """Find the fixture defs that can parse a step, along with the match of their step parser.
 
-            yield fixturedef
+    :raises StepParserError: If the parser of a step definition visible from the node failed to match the step.
+    """
+    for definition, match in step_definition_index.find(step.type, step.name):
+        for fixturedef in getfixturedefs(fixturemanager, definition.fixture_name, node) or ():
+            if fixturedef.func is not definition.func:
+                continue
+            if isinstance(match, StepParserFailure):
+                step_func = definition.context.step_func
+                raise exceptions.StepParserError(
+                    f"The parser {definition.context.parser.name!r} of the step definition {step_func.__name__} "
+                    f"({getlocation(step_func, str(node.config.rootpath))}) failed to match the step {step}: "
+                    f"{match.error}"
+                ) from match.error
+            yield fixturedef, match
 
 
 # Function copied from pytest 8.0 (removed in later versions).
@@ -129,64 +153,161 @@ def iterparentnodeids(nodeid: str) -> Iterator[str]:
         yield nodeid
 
 
-@contextlib.contextmanager
-def inject_fixturedefs_for_step(step: Step, fixturemanager: FixtureManager, node: Node) -> Iterator[None]:
-    """Inject fixture definitions that can parse a step.
+fixturedef_scope_depth_registry: WeakKeyDictionary[FixtureDef[object], int] = WeakKeyDictionary()
 
-    We fist iterate over all the fixturedefs that can parse the step.
 
-    Then we sort them by their "path" (list of parent IDs) so that we respect the fixture scoping rules.
+def get_fixturedef_scope_depth(fixturedef: FixtureDef[object]) -> int:
+    """Get the number of nodes from the session to the node defining the fixture, both included.
 
-    Finally, we inject them into the request.
+    The fixture defs visible from a node are defined by that node or by its parents, so sorting them by depth
+    sorts them from the broadest to the narrowest scope.
+    """
+    depth = fixturedef_scope_depth_registry.get(fixturedef)
+    if depth is None:
+        # The defining node is only known since pytest 9, otherwise we count the parents of the base node ID
+        node: Node | None = getattr(fixturedef, "node", None)
+        if node is not None:
+            depth = len(node.listchain())
+        else:
+            depth = sum(1 for _ in iterparentnodeids(fixturedef.baseid))
+        fixturedef_scope_depth_registry[fixturedef] = depth
+    return depth
+
+
+@dataclass(frozen=True)
+class StepResolution:
+    """The step definitions that can parse a step, as seen from a node.
+
+    Attributes:
+        fixturedefs (tuple[FixtureDef, ...]): The fixture defs providing the step definitions, sorted by the depth
+            of their scope, so that the last one is the one with the narrowest scope.
+        matches (tuple[StepMatch, ...]): The match of the step parser of each fixture def.
     """
-    bdd_name = get_step_fixture_name(step=step)
 
-    fixturedefs = list(find_fixturedefs_for_step(step=step, fixturemanager=fixturemanager, node=node))
+    fixturedefs: tuple[FixtureDef[object], ...]
+    matches: tuple[StepMatch, ...]
+
+    @property
+    def ambiguous_contexts(self) -> tuple[StepFunctionContext, ...]:
+        """The step definitions competing with the winner, if several of them have the narrowest scope.
+
+        The fixture defs visible from a node having the same depth are defined by the same node.
+        Definitions sharing the same step function (e.g. aliases) are not ambiguous.
+        """
+        if len(self.fixturedefs) < 2:
+            return ()
+        depth = get_fixturedef_scope_depth(self.fixturedefs[-1])
+        contexts: dict[Callable[..., object], StepFunctionContext] = {}
+        for fixturedef in reversed(self.fixturedefs):
+            if get_fixturedef_scope_depth(fixturedef) != depth:
+                break
+            context = step_function_context_registry[fixturedef.func]
+            contexts.setdefault(context.step_func, context)
+        if len(contexts) < 2:
+            return ()
+        return tuple(contexts.values())
+
+
+class StepResolutionCache:
+    """Cache of the step definitions that can parse a step, for the steps already resolved in the session.
+
+    Entries are keyed by the step type, the step text and the node whose fixtures are visible from the test item
+    (the step definitions are fixtures defined by modules, classes and conftest files, never by the items
+    themselves), so the same step is resolved only once for all the tests of a module.
+
+    The cache must be cleared when new fixtures are parsed, which the plugin does after collecting each node.
+    """
 
-    # Sort the fixture definitions by their "path", so that the `bdd_name` fixture will
-    # respect the fixture scope
+    def __init__(self) -> None:
+        self._resolutions: dict[tuple[str, str, str], StepResolution] = {}
+        self.hits = 0
+        self.misses = 0
 
-    def get_fixture_path(fixture_def: FixtureDef) -> list[str]:
-        return list(iterparentnodeids(fixture_def.baseid))
+    def resolve(self, step: Step, fixturemanager: FixtureManager, node: Node) -> StepResolution:
+        """Get the step definitions that can parse a step, as seen from the node."""
+        if isinstance(node, pytest.Item) and node.parent is not None:
+            node = node.parent
+        key = (step.type, step.name, node.nodeid)
+        try:
+            resolution = self._resolutions[key]
+        except KeyError:
+            self.misses += 1
+            candidates = sorted(
+                find_step_matches(step=step, fixturemanager=fixturemanager, node=node),
+                key=lambda candidate: get_fixturedef_scope_depth(candidate[0]),
+            )
+            resolution = StepResolution(
+                fixturedefs=tuple(fixturedef for fixturedef, _ in candidates),
+                matches=tuple(match for _, match in candidates),
+            )
+            self._resolutions[key] = resolution
+        else:
+            self.hits += 1
+        return resolution
 
-    fixturedefs.sort(key=lambda x: get_fixture_path(x))
+    def clear(self) -> None:
+        """Forget all the resolved steps."""
+        self._resolutions.clear()
 
-    if not fixturedefs:
-        yield
-        return
 
-    logger.debug("Adding providers for fixture %r: %r", bdd_name, fixturedefs)
-    fixturemanager._arg2fixturedefs[bdd_name] = fixturedefs
+step_resolution_cache_registry: WeakKeyDictionary[FixtureManager, StepResolutionCache] = WeakKeyDictionary()
 
-    try:
-        yield
-    finally:
-        del fixturemanager._arg2fixturedefs[bdd_name]
 
+def get_step_resolution_cache(fixturemanager: FixtureManager) -> StepResolutionCache:
+    """Get the step resolution cache of the session owning the fixture manager."""
+    cache = step_resolution_cache_registry.get(fixturemanager)
+    if cache is None:
+        cache = step_resolution_cache_registry[fixturemanager] = StepResolutionCache()
+    return cache
 
-def get_step_function(request: FixtureRequest, step: Step) -> StepFunctionContext | None:
-    """Get the step function (context) for the given step.
 
-    We first figure out what's the step fixture name that we have to inject.
+def invalidate_step_resolution_caches() -> None:
+    """Clear the step resolution caches, since new step definitions may have been parsed."""
+    for cache in step_resolution_cache_registry.values():
+        cache.clear()
 
-    Then we let `patch_argumented_step_functions` find out what step definition fixtures can parse the current step,
-    and it will inject them for the step fixture name.
 
-    Finally, we let request.getfixturevalue(...) fetch the step definition fixture.
+def resolve_step(
+    step: Step, fixturemanager: FixtureManager, node: Node
+) -> tuple[StepFunctionContext, StepMatch] | None:
+    """Resolve the step definition of a step, as seen from the node.
+
+    The step definitions that can parse the step come from the step resolution cache, sorted by the depth
+    of their scope, and the one with the narrowest scope wins, as it would when requesting a fixture.
+    Pytest's fixture tables are only read.
+
+    :return: The step function context along with the match of its step parser, or None if no step definition
+        can parse the step.
     """
+    resolution = get_step_resolution_cache(fixturemanager).resolve(step=step, fixturemanager=fixturemanager, node=node)
+    if not resolution.fixturedefs:
+        return None
+    context = step_function_context_registry[resolution.fixturedefs[-1].func]
+    return context, resolution.matches[-1]
+
+
+def get_step_function(request: FixtureRequest, step: Step) -> StepFunctionContext | None:
+    """Get the step function (context) for the given step."""
     __tracebackhide__ = True
-    bdd_name = get_step_fixture_name(step=step)
+    step_function_match = get_step_function_match(request=request, step=step)
+    if step_function_match is None:
+        return None
+    return step_function_match[0]
+
+
+def get_step_function_match(request: FixtureRequest, step: Step) -> tuple[StepFunctionContext, StepMatch] | None:
+    """Get the step function (context) for the given step, along with the match of its step parser."""
+    __tracebackhide__ = True
+    return resolve_step(step=step, fixturemanager=request._fixturemanager, node=request.node)
 
-    with inject_fixturedefs_for_step(step=step, fixturemanager=request._fixturemanager, node=request.node):
-        try:
-            return cast(StepFunctionContext, request.getfixturevalue(bdd_name))
-        except pytest.FixtureLookupError:
-            return None
 
+def parse_step_arguments(step: Step, context: StepFunctionContext, match: StepMatch | None = None) -> dict[str, object]:
+    """Parse step arguments.
 
-def parse_step_arguments(step: Step, context: StepFunctionContext) -> dict[str, object]:
-    """Parse step arguments."""
-    parsed_args = context.parser.parse_arguments(step.name)
+    The arguments are extracted from the match of the step parser, if it is given, instead of parsing
+    the step name again. They are extracted anew for every execution of the step.
+    """
+    parsed_args = match.arguments if match is not None else context.parser.parse_arguments(step.name)
 
     assert parsed_args is not None, (
         f"Unexpected `NoneType` returned from parse_arguments(...) in parser: {context.parser!r}"
@@ -205,13 +326,215 @@ def parse_step_arguments(step: Step, context: StepFunctionContext) -> dict[str,
     return converted_args
 
 
-def _execute_step_function(
-    request: FixtureRequest, scenario: Scenario, step: Step, context: StepFunctionContext
-) -> None:
+@dataclass(frozen=True)
+class StepPlan:
+    """How to execute a step, resolved ahead of the execution.
+
+    Attributes:
+        step (Step): The step.
+        context (StepFunctionContext | None): The step definition to execute, or None if no step definition
+            can parse the step.
+        match (StepMatch | None): The match of the step parser of the step definition. The plan does not keep
+            the step arguments: they are built from the match each time the step is executed.
+        fixture_names (tuple[str, ...]): The required arguments of the step function to request as fixtures,
+            unless the step arguments provide them.
+        ambiguous_contexts (tuple[StepFunctionContext, ...]): The step definitions that can parse the step at the
+            same scope as the one to execute (including it), if there are several of them.
+    """
+
+    step: Step
+    context: StepFunctionContext | None
+    match: StepMatch | None
+    fixture_names: tuple[str, ...]
+    ambiguous_contexts: tuple[StepFunctionContext, ...] = ()
+
+
+@dataclass(frozen=True)
+class ScenarioPlan:
+    """The execution plan of a scenario item.
+
+    Attributes:
+        example (dict[str, str]): The example the scenario was rendered with.
+        scenario (Scenario): The rendered scenario.
+        steps (tuple[StepPlan, ...]): The plan of each step of the scenario.
+    """
+
+    example: dict[str, str]
+    scenario: Scenario
+    steps: tuple[StepPlan, ...]
+
+    @property
+    def undefined_steps(self) -> list[Step]:
+        """The steps that no step definition can parse."""
+        return [step_plan.step for step_plan in self.steps if step_plan.context is None]
+
+    @property
+    def ambiguous_steps(self) -> list[StepPlan]:
+        """The plans of the steps that several step definitions at the same scope can parse."""
+        return [step_plan for step_plan in self.steps if step_plan.ambiguous_contexts]
+
+
+scenario_plan_registry: WeakKeyDictionary[Node, ScenarioPlan] = WeakKeyDictionary()
+
+
+def make_step_plan(step: Step, fixturemanager: FixtureManager, node: Node) -> StepPlan:
+    """Resolve the step definition of a step, as seen from the node."""
+    resolution = get_step_resolution_cache(fixturemanager).resolve(step=step, fixturemanager=fixturemanager, node=node)
+    if not resolution.fixturedefs:
+        return StepPlan(step=step, context=None, match=None, fixture_names=())
+    context = step_function_context_registry[resolution.fixturedefs[-1].func]
+
+    argument_plan = context.argument_plan
+    provided_args = set()
+    if argument_plan.accepts_datatable and step.datatable is not None:
+        provided_args.add(STEP_ARGUMENT_DATATABLE)
+    if argument_plan.accepts_docstring and step.docstring is not None:
+        provided_args.add(STEP_ARGUMENT_DOCSTRING)
+    fixture_names = tuple(arg for arg in argument_plan.fixture_names if arg not in provided_args)
+
+    return StepPlan(
+        step=step,
+        context=context,
+        match=resolution.matches[-1],
+        fixture_names=fixture_names,
+        ambiguous_contexts=resolution.ambiguous_contexts,
+    )
+
+
+def make_scenario_plan(
+    templated_scenario: ScenarioTemplate, example: dict[str, str], fixturemanager: FixtureManager, node: Node
+) -> ScenarioPlan:
+    """Render the scenario with the example and resolve all its steps, as seen from the node."""
+    scenario = templated_scenario.render(example)
+    return ScenarioPlan(
+        example=example,
+        scenario=scenario,
+        steps=tuple(make_step_plan(step=step, fixturemanager=fixturemanager, node=node) for step in scenario.steps),
+    )
+
+
+def plan_scenario_items(items: Iterable[pytest.Item], fixturemanager: FixtureManager) -> None:
+    """Compute the execution plan of the collected scenario items."""
+    for item in items:
+        if not isinstance(item, pytest.Function):
+            continue
+        templated_scenario = registry_get_safe(scenario_wrapper_template_registry, item.obj)
+        if templated_scenario is None:
+            continue
+        callspec = getattr(item, "callspec", None)
+        example = callspec.params.get("_pytest_bdd_example", {}) if callspec is not None else {}
+        try:
+            plan = make_scenario_plan(
+                templated_scenario=templated_scenario, example=example, fixturemanager=fixturemanager, node=item
+            )
+        except exceptions.StepParserError:
+            # An invalid step expression visible from the item, compiled on first use: the test reports the error
+            # when it resolves its steps again to run
+            continue
+        scenario_plan_registry[item] = plan
+
+
+def _get_mode(config: pytest.Config, name: str, modes: tuple[str, ...]) -> str:
+    mode = config.getoption(name) or config.getini(name)
+    if mode not in modes:
+        raise pytest.UsageError(f"Invalid {name} value {mode!r}, expected one of: {', '.join(modes)}")
+    return cast(str, mode)
+
+
+def get_undefined_steps_mode(config: pytest.Config) -> str:
+    """Get what to do with the scenarios having undefined steps."""
+    return _get_mode(config, "bdd_undefined_steps", UNDEFINED_STEPS_MODES)
+
+
+def get_ambiguous_steps_mode(config: pytest.Config) -> str:
+    """Get what to do with the steps that several step definitions at the same scope can parse."""
+    return _get_mode(config, "bdd_ambiguous_steps", AMBIGUOUS_STEPS_MODES)
+
+
+def deselect_undefined_scenario_items(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Deselect the planned scenario items having undefined steps."""
+    selected = []
+    deselected = []
+    for item in items:
+        plan = scenario_plan_registry.get(item)
+        if plan is not None and plan.undefined_steps:
+            deselected.append(item)
+        else:
+            selected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def format_ambiguous_step(
+    step: Step, scenario: Scenario, contexts: Iterable[StepFunctionContext], rootpath: str
+) -> str:
+    """Describe an ambiguous step and the step definitions that can parse it."""
+    definitions = ", ".join(
+        f"{context.step_func.__name__} ({getlocation(context.step_func, rootpath)})" for context in contexts
+    )
+    return (
+        f"Step {step} is ambiguous, it can be parsed by several step definitions at the same scope: {definitions}. "
+        f'Line {step.line_number} in scenario "{scenario.name}" in the feature "{scenario.feature.filename}"'
+    )
+
+
+def warn_ambiguous_steps(config: pytest.Config, items: Iterable[pytest.Item]) -> None:
+    """Warn about the steps of the planned scenario items that several step definitions at the same scope can parse.
+
+    Each ambiguous step is reported once per scope, whatever the number of scenarios using it.
+    """
+    reported = set()
+    rootpath = str(config.rootpath)
+    for item in items:
+        plan = scenario_plan_registry.get(item)
+        if plan is None:
+            continue
+        for step_plan in plan.ambiguous_steps:
+            step = step_plan.step
+            key = (step.type, step.name, tuple(context.step_func for context in step_plan.ambiguous_contexts))
+            if key in reported:
+                continue
+            reported.add(key)
+            warnings.warn_explicit(
+                exceptions.AmbiguousStepDefinitionWarning(
+                    format_ambiguous_step(step, plan.scenario, step_plan.ambiguous_contexts, rootpath)
+                ),
+                category=exceptions.AmbiguousStepDefinitionWarning,
+                filename=plan.scenario.feature.filename,
+                lineno=step.line_number,
+            )
+
+
+def _raise_ambiguous_step(request: FixtureRequest, scenario: Scenario, step_plan: StepPlan) -> NoReturn:
+    __tracebackhide__ = True
+    raise exceptions.AmbiguousStepDefinitionError(
+        format_ambiguous_step(step_plan.step, scenario, step_plan.ambiguous_contexts, str(request.config.rootpath))
+    )
+
+
+def _raise_step_definition_not_found(
+    request: FixtureRequest, feature: Feature, scenario: Scenario, step: Step
+) -> NoReturn:
+    __tracebackhide__ = True
+    exc = exceptions.StepDefinitionNotFoundError(
+        f"Step definition is not found: {step}. "
+        f'Line {step.line_number} in scenario "{scenario.name}" in the feature "{scenario.feature.filename}"'
+    )
+    request.config.hook.pytest_bdd_step_func_lookup_error(
+        request=request, feature=feature, scenario=scenario, step=step, exception=exc
+    )
+    raise exc
+
+
+def _execute_step_function(request: FixtureRequest, scenario: Scenario, step_plan: StepPlan) -> None:
     """Execute step function."""
     __tracebackhide__ = True
 
-    func_sig = signature(context.step_func)
+    step = step_plan.step
+    context = step_plan.context
+    assert context is not None
+    argument_plan = context.argument_plan
 
     kw = {
         "request": request,
@@ -224,20 +547,18 @@ def _execute_step_function(
     request.config.hook.pytest_bdd_before_step(**kw)
 
     try:
-        parsed_args = parse_step_arguments(step=step, context=context)
+        parsed_args = parse_step_arguments(step=step, context=context, match=step_plan.match)
 
         # Filter out the arguments that are not in the function signature
-        kwargs = {k: v for k, v in parsed_args.items() if k in func_sig.parameters}
+        kwargs = {k: v for k, v in parsed_args.items() if k in argument_plan.parameters}
 
-        if STEP_ARGUMENT_DATATABLE in func_sig.parameters and step.datatable is not None:
+        if argument_plan.accepts_datatable and step.datatable is not None:
             kwargs[STEP_ARGUMENT_DATATABLE] = step.datatable.raw()
-        if STEP_ARGUMENT_DOCSTRING in func_sig.parameters and step.docstring is not None:
+        if argument_plan.accepts_docstring and step.docstring is not None:
             kwargs[STEP_ARGUMENT_DOCSTRING] = step.docstring
 
         # Fill the missing arguments requesting the fixture values
-        kwargs |= {
-            arg: request.getfixturevalue(arg) for arg in get_required_args(context.step_func) if arg not in kwargs
-        }
+        kwargs |= {arg: request.getfixturevalue(arg) for arg in step_plan.fixture_names if arg not in kwargs}
 
         kw["step_func_args"] = kwargs
 
@@ -257,29 +578,29 @@ def _execute_step_function(
     request.config.hook.pytest_bdd_after_step(**kw)
 
 
-def _execute_scenario(feature: Feature, scenario: Scenario, request: FixtureRequest) -> None:
+def _execute_scenario(feature: Feature, plan: ScenarioPlan, request: FixtureRequest) -> None:
     """Execute the scenario.
 
     :param feature: Feature.
-    :param scenario: Scenario.
+    :param plan: The execution plan of the scenario.
     :param request: request.
     """
     __tracebackhide__ = True
+    scenario = plan.scenario
     request.config.hook.pytest_bdd_before_scenario(request=request, feature=feature, scenario=scenario)
 
     try:
-        for step in scenario.steps:
-            step_func_context = get_step_function(request=request, step=step)
-            if step_func_context is None:
-                exc = exceptions.StepDefinitionNotFoundError(
-                    f"Step definition is not found: {step}. "
-                    f'Line {step.line_number} in scenario "{scenario.name}" in the feature "{scenario.feature.filename}"'
-                )
-                request.config.hook.pytest_bdd_step_func_lookup_error(
-                    request=request, feature=feature, scenario=scenario, step=step, exception=exc
-                )
-                raise exc
-            _execute_step_function(request, scenario, step, step_func_context)
+        undefined_steps = plan.undefined_steps
+        if undefined_steps and get_undefined_steps_mode(request.config) == UNDEFINED_STEPS_FAIL:
+            # Fail before running the steps preceding the undefined one
+            _raise_step_definition_not_found(request, feature, scenario, undefined_steps[0])
+        ambiguous_steps = plan.ambiguous_steps
+        if ambiguous_steps and get_ambiguous_steps_mode(request.config) == AMBIGUOUS_STEPS_FAIL:
+            _raise_ambiguous_step(request, scenario, ambiguous_steps[0])
+        for step_plan in plan.steps:
+            if step_plan.context is None:
+                _raise_step_definition_not_found(request, feature, scenario, step_plan.step)
+            _execute_step_function(request, scenario, step_plan)
     finally:
         request.config.hook.pytest_bdd_after_scenario(request=request, feature=feature, scenario=scenario)
 
@@ -303,8 +624,16 @@ def _get_scenario_decorator(
 
         def scenario_wrapper(request: FixtureRequest, _pytest_bdd_example: dict[str, str]) -> T:
             __tracebackhide__ = True
-            scenario = templated_scenario.render(_pytest_bdd_example)
-            _execute_scenario(feature, scenario, request)
+            plan = scenario_plan_registry.get(request.node)
+            if plan is None or plan.example != _pytest_bdd_example:
+                # The item was not planned at collection time, or the example fixture was overridden
+                plan = make_scenario_plan(
+                    templated_scenario=templated_scenario,
+                    example=_pytest_bdd_example,
+                    fixturemanager=request._fixturemanager,
+                    node=request.node,
+                )
+            _execute_scenario(feature, plan, request)
             fixture_values = [request.getfixturevalue(arg) for arg in func_args]
             return fn(*fixture_values)
 
@@ -429,21 +758,6 @@ def make_string_literal(string: str) -> str:
     return "'{}'".format(string.replace("'", "\\'"))
 
 
-def get_python_name_generator(name: str) -> Iterable[str]:
-    """Generate a sequence of suitable python names out of given arbitrary string name."""
-    python_name = make_python_name(name)
-    suffix = ""
-    index = 0
-
-    def get_name() -> str:
-        return f"test_{python_name}{suffix}"
-
-    while True:
-        yield get_name()
-        index += 1
-        suffix = f"_{index}"
-
-
 def scenarios(*feature_paths: str, encoding: str = "utf-8", features_base_dir: str | None = None) -> None:
     caller_locals = get_caller_module_locals()
     """Parse features from the paths and put all found scenarios in the caller module.
@@ -480,11 +794,8 @@ def scenarios(*feature_paths: str, encoding: str = "utf-8", features_base_dir: s
                 def _scenario() -> None:
                     pass  # pragma: no cover
 
-                for test_name in get_python_name_generator(scenario_name):
-                    if test_name not in caller_locals:
-                        # found a unique test name
-                        caller_locals[test_name] = _scenario
-                        break
+                test_name = get_unique_name(caller_locals, f"test_{make_python_name(scenario_name)}")
+                caller_locals[test_name] = _scenario
             found = True
     if not found:
         raise exceptions.NoScenariosFound(abs_feature_paths)
@@ -0,0 +1,530 @@
+"""Step definition index.
+
+The step decorators register every step definition here, so that finding the definitions
+that can parse a step does not require going through all the fixtures known to pytest.
+
+Definitions using an exact string (the default ``parsers.string``) are stored in a hash table
+keyed by ``(step type, step text)``, and they are resolved in constant time.
+Definitions using ``parsers.re`` or ``parsers.cucumber`` (translated into a regular expression) are combined
+into a few big regular expressions per step type, so that a single ``fullmatch`` call tells whether any of them
+can parse the step.
+Definitions using ``parsers.parse`` or ``parsers.cfparse`` are indexed by a word of the literal text
+of their format, so that only the ones whose literal text occurs in the step are tried.
+Definitions using any other parser are scanned with ``StepParser.match``.
+Only the expression strings are read when registering a definition, so that the parsers compiling
+lazily are not compiled before a step needs them.
+
+The index only answers the question "which definitions can parse this step text".
+Which of them are visible from a given test item is still decided by pytest's fixture scoping.
+"""
+
+from __future__ import annotations
+
+import re
+import weakref
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import count
+from operator import attrgetter
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Optional, cast
+
+import parse as base_parse
+
+from . import parsers
+from .parsers import StepMatch
+
+if TYPE_CHECKING:
+    from .match_stats import MatchStats
+    from .steps import StepFunctionContext
+
+# Constructs that prevent a pattern from being embedded in a bigger expression:
+# - inline flags applying to the whole pattern (e.g. "(?i)"), only allowed at its start;
+# - back-references and conditional groups, relying on the groups of the original pattern;
+# - comments, which could contain unbalanced parentheses.
+UNCOMBINABLE_PATTERN_RE = re.compile(r"\(\?[aiLmsux]+\)|\\[1-9]|\(\?\(|\(\?P=|\(\?#")
+WORD_RE = re.compile(r"\w+")
+
+
+@dataclass(eq=False)
+class StepDefinition:
+    """A registered step definition.
+
+    Attributes:
+        fixture_name (str): The name of the fixture providing the step definition.
+        context (StepFunctionContext): The step function context.
+        order (int): The registration order, used to return the definitions deterministically.
+    """
+
+    fixture_name: str
+    context: StepFunctionContext
+    order: int
+    func_ref: weakref.ref[Callable[..., object]]
+
+    @property
+    def func(self) -> Callable[..., object] | None:
+        """The fixture function providing the step definition, or None if it has been garbage collected."""
+        return self.func_ref()
+
+
+@dataclass(frozen=True)
+class StepParserFailure:
+    """The error raised by the parser of a step definition when it was tried against a step text.
+
+    Invalid expressions raise ``re.error`` (regular expressions) or ``ValueError`` (parse formats and cucumber
+    expressions) when they are compiled, on first use.
+
+    The index is shared by all the modules, so the error is reported instead of raised: only the code knowing
+    which definitions are visible from a node can tell whether it concerns that node.
+    """
+
+    error: re.error | ValueError
+
+
+MatchDefinition = Callable[[StepDefinition, str], Optional[StepMatch]]
+
+
+def match_step_definition(definition: StepDefinition, step_name: str) -> StepMatch | None:
+    """Match a step text with the parser of a step definition."""
+    return definition.context.parser.match(step_name)
+
+
+@dataclass(eq=False)
+class _RegexChunk:
+    """A group of regex step definitions sharing the same flags, matched by a single combined expression."""
+
+    flags: int
+    definitions: list[StepDefinition] = field(default_factory=list)
+    patterns: list[str] = field(default_factory=list)
+    # Combined expression, compiled lazily (None when definitions have been added since the last compilation)
+    regex: re.Pattern[str] | None = None
+    # Whether the patterns turned out not to be combinable, when they are not valid regular expressions
+    broken: bool = False
+
+    def compile(self) -> re.Pattern[str] | None:
+        try:
+            regex = re.compile("|".join(f"({pattern})" for pattern in self.patterns), self.flags)
+        except re.error:
+            regex = None
+        if regex is None or regex.groups != len(self.patterns):
+            self.broken = True
+            return None
+        self.regex = regex
+        return regex
+
+
+class RegexMatcher:
+    """Match a step text against many ``parsers.re`` or ``parsers.cucumber`` definitions at once.
+
+    The patterns are combined into alternations like ``(p1)|(p2)|...``, where each alternative is wrapped
+    in the only capturing group of its branch, so ``Match.lastindex`` tells which alternative matched.
+    The groups of the original patterns are made non-capturing: besides avoiding clashes between group names,
+    this keeps the regex engine from saving and restoring thousands of group marks while backtracking.
+    The arguments are still extracted by the parser of the matching definition.
+
+    A combined expression only reports the first alternative that matches, so the definitions following it
+    are then tried one by one. To keep that cheap, and to avoid recompiling everything when new step
+    modules are imported, the definitions are split in chunks of at most ``max_alternatives`` patterns.
+    Only the last chunk is recompiled when new definitions are added.
+
+    Patterns that can't be embedded in a bigger expression (verbose patterns, global inline flags,
+    back-references, comments) are matched individually.
+
+    The patterns are only examined when the matcher is first used, and the combination works on the pattern
+    strings, so that the regex of each parser is only compiled once a step may match it.
+    """
+
+    max_alternatives = 32
+
+    def __init__(self) -> None:
+        self._chunks: list[_RegexChunk] = []
+        self._individual: list[StepDefinition] = []
+        self._pending: list[StepDefinition] = []
+
+    def add(self, definition: StepDefinition) -> None:
+        """Add a ``parsers.re`` or ``parsers.cucumber`` step definition to the matcher."""
+        self._pending.append(definition)
+
+    def find(
+        self, step_name: str, match_definition: MatchDefinition = match_step_definition
+    ) -> Iterator[tuple[StepDefinition, StepMatch]]:
+        """Find the definitions that can parse a step, in registration order within each chunk."""
+        if self._pending:
+            self._flush()
+        for chunk in self._chunks:
+            candidates = chunk.definitions
+            regex = chunk.regex or (None if chunk.broken else chunk.compile())
+            if regex is not None:
+                combined_match = regex.fullmatch(step_name)
+                if combined_match is None:
+                    continue
+                if combined_match.lastindex is not None:
+                    candidates = candidates[combined_match.lastindex - 1 :]
+            # The arguments are extracted by the parser of each definition
+            for definition in candidates:
+                if (match := match_definition(definition, step_name)) is not None:
+                    yield definition, match
+        for definition in self._individual:
+            if (match := match_definition(definition, step_name)) is not None:
+                yield definition, match
+
+    def compile(self) -> None:
+        """Compile the combined expressions ahead of the first match."""
+        if self._pending:
+            self._flush()
+        for chunk in self._chunks:
+            if chunk.regex is None and not chunk.broken:
+                chunk.compile()
+
+    def definitions(self) -> Iterator[StepDefinition]:
+        """Iterate over all the definitions of the matcher."""
+        for chunk in self._chunks:
+            yield from chunk.definitions
+        yield from self._individual
+        yield from self._pending
+
+    def _flush(self) -> None:
+        for definition in self._pending:
+            parser = cast(parsers.re, definition.context.parser)
+            flags = parser.flags
+            try:
+                pattern = self._make_combinable(parser.pattern, flags)
+            except ValueError:
+                # Invalid Cucumber Expression, the error is raised when its parser is used to match a step
+                pattern = None
+            if pattern is None:
+                self._individual.append(definition)
+                continue
+
+            chunk = next(
+                (
+                    chunk
+                    for chunk in reversed(self._chunks)
+                    if chunk.flags == flags and len(chunk.definitions) < self.max_alternatives
+                ),
+                None,
+            )
+            if chunk is None:
+                chunk = _RegexChunk(flags=flags)
+                self._chunks.append(chunk)
+            chunk.definitions.append(definition)
+            chunk.patterns.append(pattern)
+            chunk.regex = None
+            chunk.broken = False
+        self._pending.clear()
+
+    @staticmethod
+    def _make_combinable(pattern: str, flags: int) -> str | None:
+        """Get a version of the pattern that can be embedded in an alternation, or None if that's not possible."""
+        if not isinstance(pattern, str) or flags & re.VERBOSE or UNCOMBINABLE_PATTERN_RE.search(pattern):
+            return None
+        return make_groups_non_capturing(pattern)
+
+
+def make_groups_non_capturing(pattern: str) -> str:
+    """Turn the capturing groups (named or not) of a regular expression into non-capturing groups.
+
+    Example:
+    >>> make_groups_non_capturing(r"I have (?P<n>\\d+) (apples|pears)")
+    'I have (?:\\\\d+) (?:apples|pears)'
+    """
+    result = []
+    pos = 0
+    in_class = False
+    while pos < len(pattern):
+        char = pattern[pos]
+        if char == "\\":
+            result.append(pattern[pos : pos + 2])
+            pos += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # A "]" right after the opening bracket (or after a negation) is a literal
+            for prefix in ("^", "]"):
+                if pattern.startswith(prefix, pos + 1):
+                    result.append(char)
+                    pos += 1
+                    char = prefix
+        elif char == "(" and pattern.startswith("?P<", pos + 1):
+            result.append("(?:")
+            pos = pattern.index(">", pos) + 1
+            continue
+        elif char == "(" and not pattern.startswith("?", pos + 1):
+            result.append("(?:")
+            pos += 1
+            continue
+        result.append(char)
+        pos += 1
+    return "".join(result)
+
+
+@dataclass(eq=False)
+class _ParseFormatEntry:
+    definition: StepDefinition
+    # Lowercase literal text of the format, split by the fields
+    fragments: tuple[str, ...]
+
+
+class ParseFormatMatcher:
+    """Prefilter ``parsers.parse`` and ``parsers.cfparse`` definitions by the literal text of their format.
+
+    The literal text of a format like ``"I have {n:d} cucumbers in my {bag}"`` must appear as is in the steps it
+    can parse. Each definition is indexed by the longest word of that literal text (one that isn't glued to
+    a field, so that it is also a whole word of the step), and a step is only parsed by the definitions
+    indexed by one of its words whose literal fragments all occur in the step.
+
+    Parse formats are case-insensitive by default, and some non-ASCII characters match ASCII letters
+    when ignoring the case, so the prefilter only applies to ASCII step texts.
+    """
+
+    def __init__(self) -> None:
+        self._entries: list[_ParseFormatEntry] = []
+        self._by_anchor: dict[str, list[_ParseFormatEntry]] = {}
+        self._unanchored: list[_ParseFormatEntry] = []
+
+    def add(self, definition: StepDefinition) -> None:
+        """Add a ``parsers.parse`` or ``parsers.cfparse`` step definition to the matcher."""
+        fragments = get_format_literal_fragments(definition.context.parser.name)
+        entry = _ParseFormatEntry(
+            definition=definition,
+            fragments=tuple(fragment.lower() for fragment in fragments if fragment and fragment.isascii()),
+        )
+        self._entries.append(entry)
+        anchor = get_format_anchor(fragments)
+        if anchor is None:
+            self._unanchored.append(entry)
+        else:
+            self._by_anchor.setdefault(anchor, []).append(entry)
+
+    def find(
+        self, step_name: str, match_definition: MatchDefinition = match_step_definition
+    ) -> Iterator[tuple[StepDefinition, StepMatch]]:
+        """Find the definitions that can parse a step."""
+        for entry in self._get_candidates(step_name):
+            if (match := match_definition(entry.definition, step_name)) is not None:
+                yield entry.definition, match
+
+    def definitions(self) -> Iterator[StepDefinition]:
+        """Iterate over all the definitions of the matcher."""
+        for entry in self._entries:
+            yield entry.definition
+
+    def _get_candidates(self, step_name: str) -> Iterator[_ParseFormatEntry]:
+        if not step_name.isascii():
+            yield from self._entries
+            return
+        lowered = step_name.lower()
+        for word in (None, *set(WORD_RE.findall(lowered))):
+            entries = self._unanchored if word is None else self._by_anchor.get(word, ())
+            for entry in entries:
+                if all(fragment in lowered for fragment in entry.fragments):
+                    yield entry
+
+
+def get_format_literal_fragments(parse_format: str) -> list[str]:
+    """Get the literal text of a parse format, split by its fields.
+
+    The fields are parsed the same way as the ``parse`` library does, the first and the last fragments are
+    empty if the format starts or ends with a field.
+
+    Example:
+    >>> get_format_literal_fragments("I have {n:d} cucumbers in my {bag}")
+    ['I have ', ' cucumbers in my ', '']
+    """
+    fragments = [""]
+    for part in base_parse.PARSE_RE.split(parse_format):
+        if not part:
+            continue
+        elif part == "{{":
+            fragments[-1] += "{"
+        elif part == "}}":
+            fragments[-1] += "}"
+        elif part[0] == "{" and part[-1] == "}":
+            fragments.append("")
+        else:
+            fragments[-1] += part
+    return fragments
+
+
+def get_format_anchor(fragments: list[str]) -> str | None:
+    """Get the longest lowercase ASCII word of the literal fragments that is a whole word of the steps they match.
+
+    Words at the edges of a fragment may be glued to the value of a field, unless the fragment is at the start
+    or at the end of the format.
+    """
+    words = [
+        word.group().lower()
+        for position, fragment in enumerate(fragments)
+        for word in WORD_RE.finditer(fragment)
+        if word.group().isascii()
+        and (word.start() > 0 or position == 0)
+        and (word.end() < len(fragment) or position == len(fragments) - 1)
+    ]
+    return max(words, key=len, default=None)
+
+
+class StepDefinitionIndex:
+    """Index of the step definitions by step type and step text."""
+
+    def __init__(self) -> None:
+        self._order = count()
+        self._exact: dict[tuple[str | None, str], list[StepDefinition]] = {}
+        self._regex: dict[str | None, RegexMatcher] = {}
+        self._parse: dict[str | None, ParseFormatMatcher] = {}
+        self._scanned: dict[str | None, list[StepDefinition]] = {}
+        # Negative cache: the steps that no definition can parse, until a new definition is registered
+        self._unresolved: set[tuple[str, str]] = set()
+        # Set by the ``--bdd-match-stats`` option to record the matching attempts
+        self.match_stats: MatchStats | None = None
+        self._prune_needed = False
+
+    def add(self, fixture_name: str, func: Callable[..., object], context: StepFunctionContext) -> StepDefinition:
+        """Register a step definition.
+
+        Args:
+            fixture_name (str): The name of the fixture providing the step definition.
+            func (Callable): The fixture function providing the step definition.
+            context (StepFunctionContext): The step function context.
+
+        Returns:
+            StepDefinition: The registered definition.
+        """
+        [definition] = self.add_many([(fixture_name, func, context)])
+        return definition
+
+    def add_many(
+        self, entries: Iterable[tuple[str, Callable[..., object], StepFunctionContext]]
+    ) -> list[StepDefinition]:
+        """Register many step definitions at once.
+
+        Args:
+            entries (Iterable[tuple[str, Callable, StepFunctionContext]]): The fixture name, the fixture function
+                and the step function context of each step definition.
+
+        Returns:
+            list[StepDefinition]: The registered definitions.
+        """
+        definitions = []
+        for fixture_name, func, context in entries:
+            definition = StepDefinition(
+                fixture_name=fixture_name,
+                context=context,
+                order=next(self._order),
+                func_ref=weakref.ref(func, self._schedule_prune),
+            )
+            self._insert(definition)
+            definitions.append(definition)
+        self._unresolved.clear()
+        return definitions
+
+    def find(self, step_type: str, step_name: str) -> list[tuple[StepDefinition, StepMatch | StepParserFailure]]:
+        """Find the definitions that can parse a step.
+
+        Args:
+            step_type (str): The type of the step ("given", "when" or "then").
+            step_name (str): The text of the step.
+
+        Returns:
+            list[tuple[StepDefinition, StepMatch | StepParserFailure]]: The matching definitions with the match
+                of their parser, in registration order. The definitions whose parser raised an error (e.g. an invalid
+                expression, compiled on first use) come with that error instead.
+        """
+        match_stats = self.match_stats
+        if match_stats is None:
+            return self._find(step_type, step_name, match_step_definition)
+
+        start = perf_counter()
+        try:
+            return self._find(step_type, step_name, match_stats.match_definition)
+        finally:
+            match_stats.record_lookup(perf_counter() - start)
+
+    def _find(
+        self, step_type: str, step_name: str, match_definition: MatchDefinition
+    ) -> list[tuple[StepDefinition, StepMatch | StepParserFailure]]:
+        if (step_type, step_name) in self._unresolved:
+            return []
+        if self._prune_needed:
+            self._prune()
+
+        found: list[tuple[StepDefinition, StepMatch | StepParserFailure]] = []
+
+        def match_definition_safely(definition: StepDefinition, step_name: str) -> StepMatch | None:
+            try:
+                return match_definition(definition, step_name)
+            except (re.error, ValueError) as error:
+                found.append((definition, StepParserFailure(error)))
+                return None
+
+        # Definitions registered without a type apply to all the step types
+        for type_ in (None, step_type):
+            for definition in self._exact.get((type_, step_name), ()):
+                if self.match_stats is not None:
+                    self.match_stats.record_match(definition, step_name, matched=True, duration=0.0)
+                found.append((definition, StepMatch(definition.context.parser, step_name, dict)))
+            if (regex_matcher := self._regex.get(type_)) is not None:
+                found.extend(regex_matcher.find(step_name, match_definition_safely))
+            if (parse_matcher := self._parse.get(type_)) is not None:
+                found.extend(parse_matcher.find(step_name, match_definition_safely))
+            found.extend(self._scan(type_, step_name, match_definition_safely))
+        if not found:
+            self._unresolved.add((step_type, step_name))
+        found.sort(key=lambda candidate: candidate[0].order)
+        return found
+
+    def _scan(
+        self, type_: str | None, step_name: str, match_definition: MatchDefinition
+    ) -> Iterator[tuple[StepDefinition, StepMatch]]:
+        for definition in self._scanned.get(type_, ()):
+            if (match := match_definition(definition, step_name)) is not None:
+                yield definition, match
+
+    def _insert(self, definition: StepDefinition) -> None:
+        context = definition.context
+        parser_type = type(context.parser)
+        if parser_type is parsers.string:
+            self._exact.setdefault((context.type, context.parser.name), []).append(definition)
+            return
+        if parser_type in (parsers.re, parsers.cucumber):
+            self._regex.setdefault(context.type, RegexMatcher()).add(definition)
+            return
+        if parser_type in (parsers.parse, parsers.cfparse):
+            self._parse.setdefault(context.type, ParseFormatMatcher()).add(definition)
+            return
+        self._scanned.setdefault(context.type, []).append(definition)
+
+    def _schedule_prune(self, func_ref: weakref.ref[Callable[..., object]]) -> None:
+        # Called by the garbage collector: just flag the index, it will be cleaned up on the next lookup
+        self._prune_needed = True
+
+    def compile(self) -> None:
+        """Compile the parsers of all the registered definitions, instead of compiling them on first use."""
+        for matcher in self._regex.values():
+            matcher.compile()
+        for definition in self._definitions():
+            definition.context.parser.compile()
+
+    def _definitions(self) -> list[StepDefinition]:
+        return [
+            *(definition for definitions in self._exact.values() for definition in definitions),
+            *(definition for matcher in self._regex.values() for definition in matcher.definitions()),
+            *(definition for matcher in self._parse.values() for definition in matcher.definitions()),
+            *(definition for definitions in self._scanned.values() for definition in definitions),
+        ]
+
+    def _prune(self) -> None:
+        """Remove the definitions whose fixture function has been garbage collected."""
+        self._prune_needed = False
+        definitions = self._definitions()
+        self._exact.clear()
+        self._regex.clear()
+        self._parse.clear()
+        self._scanned.clear()
+        for definition in sorted(definitions, key=attrgetter("order")):
+            if definition.func is not None:
+                self._insert(definition)
+
+
+step_definition_index = StepDefinitionIndex()
@@ -40,8 +40,10 @@ from __future__ import annotations
 import enum
 from collections.abc import Iterable
 from dataclasses import dataclass, field
-from itertools import count
-from typing import Callable, Literal, TypeVar
+from functools import lru_cache
+from inspect import signature
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Literal, NamedTuple, TypeVar
 from weakref import WeakKeyDictionary
 
 import pytest
@@ -49,11 +51,21 @@ from typing_extensions import ParamSpec
 
 from .parser import Step
 from .parsers import StepParser, get_parser
-from .utils import get_caller_module_locals
+from .step_index import step_definition_index
+from .utils import get_caller_module_locals, get_required_args, get_unique_name
+
+if TYPE_CHECKING:
+    from functools import _CacheInfo
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
+STEP_ARGUMENT_DATATABLE = "datatable"
+STEP_ARGUMENT_DOCSTRING = "docstring"
+
+# Number of converted values remembered by each converter, when they are cached with `cache_converters=True`
+CONVERTERS_CACHE_SIZE = 256
+
 step_function_context_registry: WeakKeyDictionary[Callable[..., object], StepFunctionContext] = WeakKeyDictionary()
 
 
@@ -63,6 +75,81 @@ class StepNamePrefix(enum.Enum):
     step_impl = "pytestbdd_stepimpl"
 
 
+@dataclass(frozen=True)
+class StepArgumentPlan:
+    """How to call a step function, computed once from its signature.
+
+    Attributes:
+        parameters (frozenset[str]): The names of the parameters of the step function, used to filter out the step
+            arguments it doesn't accept.
+        fixture_names (tuple[str, ...]): The required arguments of the step function, to request as fixtures when
+            the step doesn't provide them.
+        accepts_datatable (bool): Whether the step function wants the datatable of the step.
+        accepts_docstring (bool): Whether the step function wants the docstring of the step.
+    """
+
+    parameters: frozenset[str]
+    fixture_names: tuple[str, ...]
+    accepts_datatable: bool
+    accepts_docstring: bool
+
+    @classmethod
+    def from_function(cls, func: Callable[..., object]) -> StepArgumentPlan:
+        params = signature(func).parameters
+        return cls(
+            parameters=frozenset(params),
+            fixture_names=tuple(get_required_args(func)),
+            accepts_datatable=STEP_ARGUMENT_DATATABLE in params,
+            accepts_docstring=STEP_ARGUMENT_DOCSTRING in params,
+        )
+
+
+class CachedConverter:
+    """A step argument converter remembering the values it converted, in a bounded LRU cache.
+
+    The values that can't be hashed (e.g. the lists of the ``cfparse`` many-fields) are converted every time.
+    """
+
+    def __init__(self, converter: Callable[[str], object], maxsize: int = CONVERTERS_CACHE_SIZE) -> None:
+        self.converter = converter
+        self._cached_converter = lru_cache(maxsize=maxsize)(converter)
+
+    def __call__(self, value: str) -> object:
+        try:
+            hash(value)
+        except TypeError:
+            return self.converter(value)
+        return self._cached_converter(value)
+
+    def cache_info(self) -> _CacheInfo:
+        """Get the hits, misses, maximum and current size of the cache."""
+        return self._cached_converter.cache_info()
+
+    def cache_clear(self) -> None:
+        """Forget the converted values."""
+        self._cached_converter.cache_clear()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.converter!r})"
+
+
+def make_converters(
+    converters: dict[str, Callable[[str], object]] | None, cache_converters: bool | int = False
+) -> dict[str, Callable[[str], object]]:
+    """Get the converters of a step definition, wrapped in a cache if requested.
+
+    :param converters: The step argument converters.
+    :param cache_converters: Whether to cache the converted values, or the maximum number of values to cache
+        for each converter.
+    """
+    if converters is None:
+        return {}
+    if cache_converters is False:
+        return converters
+    maxsize = CONVERTERS_CACHE_SIZE if cache_converters is True else cache_converters
+    return {name: CachedConverter(converter, maxsize=maxsize) for name, converter in converters.items()}
+
+
 @dataclass
 class StepFunctionContext:
     type: Literal["given", "when", "then"] | None
@@ -70,6 +157,27 @@ class StepFunctionContext:
     parser: StepParser
     converters: dict[str, Callable[[str], object]] = field(default_factory=dict)
     target_fixture: str | None = None
+    argument_plan: StepArgumentPlan = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.argument_plan = StepArgumentPlan.from_function(self.step_func)
+
+    def converters_cache_info(self) -> dict[str, _CacheInfo]:
+        """Get the cache statistics of the converters cached with ``cache_converters``, by argument name."""
+        return {
+            name: converter.cache_info()
+            for name, converter in self.converters.items()
+            if isinstance(converter, CachedConverter)
+        }
+
+
+def compile_step_definitions() -> None:
+    """Compile the step parsers of all the step definitions registered so far.
+
+    The step parsers compile their expression when they are first used to match a step. Call this once
+    the step definitions are imported (e.g. in a ``pytest_collection_finish`` hook) to compile them eagerly.
+    """
+    step_definition_index.compile()
 
 
 def get_step_fixture_name(step: Step) -> str:
@@ -82,6 +190,7 @@ def given(
     converters: dict[str, Callable[[str], object]] | None = None,
     target_fixture: str | None = None,
     stacklevel: int = 1,
+    cache_converters: bool | int = False,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Given step decorator.
 
@@ -90,10 +199,19 @@ def given(
                        {<param_name>: <converter function>}.
     :param target_fixture: Target fixture name to replace by steps definition function.
     :param stacklevel: Stack level to find the caller frame. This is used when injecting the step definition fixture.
+    :param cache_converters: Remember the converted values in a bounded LRU cache (``True``), or the maximum number
+                             of values to remember for each converter (``int``).
 
     :return: Decorator function for the step.
     """
-    return step(name, "given", converters=converters, target_fixture=target_fixture, stacklevel=stacklevel)
+    return step(
+        name,
+        "given",
+        converters=converters,
+        target_fixture=target_fixture,
+        stacklevel=stacklevel,
+        cache_converters=cache_converters,
+    )
 
 
 def when(
@@ -101,6 +219,7 @@ def when(
     converters: dict[str, Callable[[str], object]] | None = None,
     target_fixture: str | None = None,
     stacklevel: int = 1,
+    cache_converters: bool | int = False,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """When step decorator.
 
@@ -109,10 +228,19 @@ def when(
                        {<param_name>: <converter function>}.
     :param target_fixture: Target fixture name to replace by steps definition function.
     :param stacklevel: Stack level to find the caller frame. This is used when injecting the step definition fixture.
+    :param cache_converters: Remember the converted values in a bounded LRU cache (``True``), or the maximum number
+                             of values to remember for each converter (``int``).
 
     :return: Decorator function for the step.
     """
-    return step(name, "when", converters=converters, target_fixture=target_fixture, stacklevel=stacklevel)
+    return step(
+        name,
+        "when",
+        converters=converters,
+        target_fixture=target_fixture,
+        stacklevel=stacklevel,
+        cache_converters=cache_converters,
+    )
 
 
 def then(
@@ -120,6 +248,7 @@ def then(
     converters: dict[str, Callable[[str], object]] | None = None,
     target_fixture: str | None = None,
     stacklevel: int = 1,
+    cache_converters: bool | int = False,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Then step decorator.
 
@@ -128,10 +257,19 @@ def then(
                        {<param_name>: <converter function>}.
     :param target_fixture: Target fixture name to replace by steps definition function.
     :param stacklevel: Stack level to find the caller frame. This is used when injecting the step definition fixture.
+    :param cache_converters: Remember the converted values in a bounded LRU cache (``True``), or the maximum number
+                             of values to remember for each converter (``int``).
 
     :return: Decorator function for the step.
     """
-    return step(name, "then", converters=converters, target_fixture=target_fixture, stacklevel=stacklevel)
+    return step(
+        name,
+        "then",
+        converters=converters,
+        target_fixture=target_fixture,
+        stacklevel=stacklevel,
+        cache_converters=cache_converters,
+    )
 
 
 def step(
@@ -140,6 +278,7 @@ def step(
     converters: dict[str, Callable[[str], object]] | None = None,
     target_fixture: str | None = None,
     stacklevel: int = 1,
+    cache_converters: bool | int = False,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Generic step decorator.
 
@@ -148,6 +287,8 @@ def step(
     :param converters: Optional step arguments converters mapping.
     :param target_fixture: Optional fixture name to replace by step definition.
     :param stacklevel: Stack level to find the caller frame. This is used when injecting the step definition fixture.
+    :param cache_converters: Remember the converted values in a bounded LRU cache (``True``), or the maximum number
+                             of values to remember for each converter (``int``).
 
     :return: Decorator function for the step.
 
@@ -157,53 +298,94 @@ def step(
     >>>     return {"eur": 0, "usd": 0}
 
     """
-    if converters is None:
-        converters = {}
+    converters = make_converters(converters, cache_converters)
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
-        parser = get_parser(name)
-
         context = StepFunctionContext(
             type=type_,
             step_func=func,
-            parser=parser,
+            parser=get_parser(name),
             converters=converters,
             target_fixture=target_fixture,
         )
-
-        def step_function_marker() -> StepFunctionContext:
-            return context
-
-        step_function_context_registry[step_function_marker] = context
-
         caller_locals = get_caller_module_locals(stacklevel=stacklevel)
-        fixture_step_name = find_unique_name(
-            f"{StepNamePrefix.step_def.value}_{type_ or '*'}_{parser.name}", seen=caller_locals.keys()
-        )
-        caller_locals[fixture_step_name] = pytest.fixture(name=fixture_step_name)(step_function_marker)
+        step_definition_index.add(*inject_step_definition_fixture(caller_locals, context))
         return func
 
     return decorator
 
 
-def find_unique_name(name: str, seen: Iterable[str]) -> str:
-    """Find a unique name among a set of strings.
+class StepSpec(NamedTuple):
+    """A step definition to register with ``register_steps``.
+
+    Plain tuples with the same fields, in the same order, are accepted too.
+    """
+
+    type: Literal["given", "when", "then"] | None
+    name: str | StepParser
+    func: Callable[..., object]
+    converters: dict[str, Callable[[str], object]] | None = None
+    target_fixture: str | None = None
+    cache_converters: bool | int = False
+
+
+def register_steps(
+    module: ModuleType | dict[str, object],
+    steps: Iterable[StepSpec | tuple[Any, ...]],
+) -> None:
+    """Register many step definitions in a module at once.
+
+    This is the equivalent of applying the step decorators to each function, for the step libraries that
+    generate their step definitions in loops: the step definition fixtures are injected in the namespace of the
+    given module (instead of finding the caller module for every step), and the step definitions are added
+    to the step definition index in one go.
 
-    New names are generated by appending an increasing number at the end of the name.
+    :param module: The module (or its namespace, e.g. ``globals()``) to inject the step definition fixtures in.
+        Like for the step decorators, the steps are available to the tests collected from this module,
+        or from the directory of this ``conftest.py``.
+    :param steps: The steps, as ``StepSpec`` or as ``(type, name, func[, converters[, target_fixture[, cache_converters]]])``
+        tuples.
 
     Example:
-    >>> find_unique_name("foo", ["foo", "foo_1"])
-    'foo_2'
+    >>> from pytest_bdd import parsers
+    >>> def pay_eur(wallet, amount):
+    ...     wallet["eur"] -= amount
+    >>> register_steps(globals(), [
+    ...     ("given", "there is a wallet", lambda: {"eur": 0, "usd": 0}, None, "wallet"),
+    ...     ("when", parsers.parse("I pay {amount:d} EUR"), pay_eur),
+    ... ])
     """
-    seen = set(seen)
-    if name not in seen:
-        return name
-
-    # Generate new names with increasing numbers
-    for i in count(1):
-        new_name = f"{name}_{i}"
-        if new_name not in seen:
-            return new_name
-
-    # This line will never be reached, but it's here to satisfy mypy
-    raise RuntimeError("Unable to find a unique name")
+    namespace = module.__dict__ if isinstance(module, ModuleType) else module
+    entries = []
+    for spec in steps:
+        spec = StepSpec(*spec)
+        context = StepFunctionContext(
+            type=spec.type,
+            step_func=spec.func,
+            parser=get_parser(spec.name),
+            converters=make_converters(spec.converters, spec.cache_converters),
+            target_fixture=spec.target_fixture,
+        )
+        entries.append(inject_step_definition_fixture(namespace, context))
+    step_definition_index.add_many(entries)
+
+
+def inject_step_definition_fixture(
+    namespace: dict[str, object], context: StepFunctionContext
+) -> tuple[str, Callable[[], StepFunctionContext], StepFunctionContext]:
+    """Inject the fixture providing a step definition in a module namespace.
+
+    :return: The fixture name, the fixture function and the step function context, to add to the step definition
+        index.
+    """
+
+    def step_function_marker() -> StepFunctionContext:
+        return context
+
+    step_function_context_registry[step_function_marker] = context
+
+    fixture_step_name = get_unique_name(
+        namespace, f"{StepNamePrefix.step_def.value}_{context.type or '*'}_{context.parser.name}"
+    )
+    namespace[fixture_step_name] = pytest.fixture(name=fixture_step_name)(step_function_marker)
+    return fixture_step_name, step_function_marker, context
@@ -20,6 +20,12 @@ V = TypeVar("V")
 
 CONFIG_STACK: list[Config] = []
 
+# The next suffix to try for each name of the namespaces (keyed by their id, and kept alive so that their id is not
+# reused), for each pytest session, see `get_unique_name`
+unique_name_suffixes_registry: WeakKeyDictionary[Config, dict[int, tuple[dict[str, object], dict[str, int]]]] = (
+    WeakKeyDictionary()
+)
+
 
 def get_required_args(func: Callable[..., object]) -> list[str]:
     """Get a list of argument that are required for a function.
@@ -53,6 +59,35 @@ def get_caller_module_path(depth: int = 2) -> str:
     return getframeinfo(frame, context=0).filename
 
 
+def get_unique_name(namespace: dict[str, object], name: str) -> str:
+    """Get a name that is not defined in a namespace (e.g. the locals of a module) yet.
+
+    New names are generated by appending an increasing number at the end of the name. During a pytest session,
+    the next number to try for each name of the namespace is remembered (outside of the namespace), so that
+    defining many objects under the same name takes constant time instead of probing all the names already taken.
+    Outside of a pytest session (e.g. steps defined at import time, before pytest is configured), nothing is
+    remembered and the numbers are probed from 1: the memory is tied to the session, so that it doesn't keep
+    the namespaces alive after it.
+
+    Example:
+    >>> namespace = {"foo": 1, "foo_1": 2}
+    >>> get_unique_name(namespace, "foo")
+    'foo_2'
+    """
+    if name not in namespace:
+        return name
+
+    suffixes: dict[str, int] = {}
+    if CONFIG_STACK:
+        namespaces = unique_name_suffixes_registry.setdefault(CONFIG_STACK[-1], {})
+        suffixes = namespaces.setdefault(id(namespace), (namespace, suffixes))[1]
+    suffix = suffixes.get(name, 1)
+    while (new_name := f"{name}_{suffix}") in namespace:
+        suffix += 1
+    suffixes[name] = suffix + 1
+    return new_name
+
+
 _DUMP_START = "_pytest_bdd_>>>"
 _DUMP_END = "<<<_pytest_bdd_"
 
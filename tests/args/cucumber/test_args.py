@@ -0,0 +1,224 @@
+"""Step arguments tests."""
+
+from __future__ import annotations
+
+import re
+import textwrap
+from decimal import Decimal
+
+import pytest
+
+from pytest_bdd import parsers
+
+
+def test_cucumber_expressions(pytester):
+    pytester.makefile(
+        ".feature",
+        arguments=textwrap.dedent(
+            """\
+            Feature: Step arguments
+                Scenario: Cucumber Expressions
+                    Given I have 1 cucumber in my belly
+                    And I have 12 cucumbers in my stomach
+                    When "Bob" eats 2.5 "big" cucumbers
+                    Then the colour of the cucumbers is green
+            """
+        ),
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, when, then, parsers, scenarios
+
+            parsers.define_parameter_type("colour", r"red|green|blue", str.upper)
+
+            scenarios("arguments.feature")
+
+
+            @given(parsers.cucumber("I have {int} cucumber(s) in my belly/stomach", names=["count"]))
+            def _(count):
+                assert count in (1, 12)
+
+
+            @when(parsers.cucumber("{string} eats {float} {string} cucumbers", names=["who", "eat", "size"]))
+            def _(who, eat, size):
+                assert (who, eat, size) == ("Bob", 2.5, "big")
+
+
+            @then(parsers.cucumber("the colour of the cucumbers is {colour}", names=["colour"]))
+            def _(colour):
+                assert colour == "GREEN"
+            """
+        )
+    )
+    # Run in a subprocess, the parameter types are registered globally
+    result = pytester.runpytest_subprocess()
+    result.assert_outcomes(passed=1)
+
+
+def test_transformers_run_for_the_executed_step_definition(pytester):
+    """The transformers of the step definitions that match the step but are not executed don't run."""
+    pytester.makefile(
+        ".feature",
+        arguments=textwrap.dedent(
+            """\
+            Feature: Step arguments
+                Scenario: Overridden step definition
+                    Given I have 3 cucumbers
+            """
+        ),
+    )
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, parsers
+
+
+            def transform(value):
+                raise ValueError(f"Cannot transform {value!r}")
+
+
+            parsers.define_parameter_type("test_failing", r"\\d+", transform)
+
+
+            @given(parsers.cucumber("I have {test_failing} cucumbers", names=["count"]))
+            def _(count):
+                raise AssertionError("The step definition of the conftest should not be executed")
+            """
+        )
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, parsers, scenarios
+
+            scenarios("arguments.feature")
+
+
+            @given(parsers.cucumber("I have {int} cucumbers", names=["count"]))
+            def _(count):
+                assert count == 3
+            """
+        )
+    )
+    # Run in a subprocess, the parameter types are registered globally
+    result = pytester.runpytest_subprocess()
+    result.assert_outcomes(passed=1)
+
+
+@pytest.mark.parametrize(
+    ["expression", "step_name", "expected"],
+    [
+        ("I have {int} cucumbers", "I have -3 cucumbers", {"value": -3}),
+        ("I have {float} cucumbers", "I have .5 cucumbers", {"value": 0.5}),
+        ("I have {bigdecimal} cucumbers", "I have 1.10 cucumbers", {"value": Decimal("1.10")}),
+        ("I have {word} cucumbers", "I have many cucumbers", {"value": "many"}),
+        ("I say {string}", 'I say "a \\"big\\" one"', {"value": 'a "big" one'}),
+        ("I say {string}", "I say ''", {"value": ""}),
+        ("I have {} in my belly", "I have 3 cucumbers in my belly", {"value": "3 cucumbers"}),
+        ("I have cucumber(s)", "I have cucumber", {}),
+        ("I have cucumber(s)", "I have cucumbers", {}),
+        ("I have a cucumber in my belly/stomach", "I have a cucumber in my stomach", {}),
+        (r"I have \(escaped\) \{int\} 1\/2", "I have (escaped) {int} 1/2", {}),
+        ("I have a.b*c", "I have a.b*c", {}),
+    ],
+)
+def test_cucumber_match(expression, step_name, expected):
+    parser = parsers.cucumber(expression, names=list(expected))
+    match = parser.match(step_name)
+    assert match is not None
+    assert match.arguments == expected
+    assert parser.parse_arguments(step_name) == expected
+
+
+@pytest.mark.parametrize(
+    ["expression", "step_name"],
+    [
+        ("I have {int} cucumbers", "I have 3.5 cucumbers"),
+        ("I have {word} cucumbers", "I have two big cucumbers"),
+        ("I have cucumber(s)", "I have cucumberss"),
+        ("I have a cucumber in my belly/stomach", "I have a cucumber in my belly/stomach"),
+        ("I have a.b", "I have axb"),
+    ],
+)
+def test_cucumber_no_match(expression, step_name):
+    names = ["value"] if "{" in expression else None
+    assert parsers.cucumber(expression, names=names).match(step_name) is None
+
+
+@pytest.mark.parametrize(
+    ["expression", "names", "error"],
+    [
+        ("I have {int}", None, "0 argument names given for the 1 parameters"),
+        ("{int} and {int}", ["a"], "1 argument names given for the 2 parameters"),
+        ("{int} and {int}", ["a", "a"], "The argument names ['a', 'a'] of '{int} and {int}' are not unique"),
+        ("I have (a{int})", None, "A parameter can't be used in the optional text"),
+        ("I have ((a))", None, "An optional text can't be used in the optional text"),
+        ("I have (a", None, "The optional text at 7 of 'I have (a' is not closed"),
+        ("I have ()", None, "The optional text at 7 of 'I have ()' is empty"),
+        ("I have a)", None, "Unexpected ')'"),
+        ("I have a/{int}", None, "A parameter can't be used in an alternation"),
+        ("I have a/", None, "An alternative is empty"),
+        ("I have \\", None, "doesn't escape anything"),
+    ],
+)
+def test_invalid_cucumber_expression(expression, names, error):
+    """The syntax and the argument names are checked when the step is defined."""
+    with pytest.raises(ValueError, match=re.escape(error)):
+        parsers.cucumber(expression, names=names)
+
+
+def test_undefined_parameter_type():
+    """The parameter types are looked up on first use, so that they can be defined after the steps."""
+    parser = parsers.cucumber("I have {test_undefined}", names=["value"])
+    with pytest.raises(ValueError, match=re.escape("Undefined parameter type {test_undefined}")):
+        parser.match("I have a")
+
+    parser = parsers.cucumber("I have {test_defined_later}", names=["value"])
+    parsers.define_parameter_type("test_defined_later", r"[a-z]+")
+    assert parser.match("I have a").arguments == {"value": "a"}
+
+
+def test_parameter_type_is_compiled_once():
+    """The expression is translated with the parameter types defined when it is first used.
+
+    The values are converted when the arguments of a match are extracted.
+    """
+    calls = []
+
+    def transformer(value):
+        calls.append(value)
+        return value[::-1]
+
+    parsers.define_parameter_type("test_reversed_word", r"[a-z]+", transformer)
+    parser = parsers.cucumber("I say {test_reversed_word}", names=["word"])
+    match = parser.match("I say hello")
+    assert calls == []
+    assert match.arguments == {"word": "olleh"}
+    assert parser.match("I say world").arguments == {"word": "dlrow"}
+    assert calls == ["hello", "world"]
+    assert parser.regex is parser.regex
+    assert parser.pattern == r"I\ say\ ([a-z]+)"
+
+    with pytest.raises(ValueError, match="There is already a parameter type named 'test_reversed_word'"):
+        parsers.define_parameter_type("test_reversed_word", r"[a-z]+")
+
+
+@pytest.mark.parametrize(
+    ["name", "regexp", "error"],
+    [
+        ("int", r"\d+", "There is already a parameter type named 'int'"),
+        ("test{invalid}", r"\d+", "Illegal character in parameter type name"),
+        ("test_named_group", r"(?P<value>\d+)", "can't have named groups"),
+    ],
+)
+def test_invalid_parameter_type(name, regexp, error):
+    with pytest.raises(ValueError, match=error):
+        parsers.define_parameter_type(name, regexp)
+
+
+def test_parameter_type_with_groups():
+    """The inner groups of the parameter types don't shift the arguments following them."""
+    parsers.define_parameter_type("test_point", [r"\((\d+), (\d+)\)", r"(\d+)x(\d+)"])
+    parser = parsers.cucumber("from {test_point} to {test_point} in {int} steps", names=["start", "end", "steps"])
+    assert parser.match("from (1, 2) to 3x4 in 5 steps").arguments == {"start": "(1, 2)", "end": "3x4", "steps": 5}
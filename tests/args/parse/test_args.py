@@ -107,3 +107,52 @@ def test_argument_in_when_step_1(pytester):
     )
     result = pytester.runpytest()
     result.assert_outcomes(passed=1)
+
+
+def test_argument_values_are_not_shared_by_the_scenarios(pytester):
+    pytester.makefile(
+        ".feature",
+        arguments=textwrap.dedent(
+            """\
+            Feature: Step arguments
+                Scenario: Modify the argument
+                    Given I have the fruits apple,pear
+                    Then I eat the fruits
+
+                Scenario: Use the argument
+                    Given I have the fruits apple,pear
+                    Then I still have 2 fruits
+            """
+        ),
+    )
+
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+        from pytest_bdd import parsers, given, then, scenarios
+
+        scenarios("arguments.feature")
+
+
+        @given(
+            parsers.parse("I have the fruits {fruits:List}", extra_types={"List": lambda text: text.split(",")}),
+            target_fixture="fruits",
+        )
+        def _(fruits):
+            return fruits
+
+
+        @then("I eat the fruits")
+        def _(fruits):
+            fruits.clear()
+
+
+        @then(parsers.parse("I still have {count:d} fruits"))
+        def _(fruits, count):
+            assert fruits == ["apple", "pear"]
+            assert len(fruits) == count
+        """
+        )
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=2)
@@ -116,3 +116,98 @@ def test_string_steps_dont_take_precedence(pytester):
 
     [which] = collect_dumped_objects(result)
     assert which == "re"
+
+
+def test_step_arguments_are_converted_at_each_execution(pytester):
+    """The step name is parsed once, but the arguments are converted again for each execution of the step."""
+    pytester.makefile(
+        ".feature",
+        arguments=textwrap.dedent(
+            """\
+            Feature: Step arguments are converted at each execution
+                Scenario: First scenario
+                    Given I have 3 apples
+
+                Scenario: Second scenario
+                    Given I have 3 apples
+            """
+        ),
+    )
+
+    pytester.makepyfile(
+        textwrap.dedent(
+            r"""
+        from pytest_bdd import parsers, given, scenarios
+        from pytest_bdd.utils import dump_obj
+
+        scenarios("arguments.feature")
+
+        parsed_names = []
+
+
+        class counting_parse(parsers.parse):
+            def __init__(self, name):
+                super().__init__(name)
+                parser = self.parser
+
+                class CountingParser:
+                    def parse(self, string, evaluate_result=True):
+                        parsed_names.append(string)
+                        return parser.parse(string, evaluate_result=evaluate_result)
+
+                self.parser = CountingParser()
+
+
+        @given(counting_parse("I have {n:d} apples"))
+        def _(n):
+            dump_obj((n, list(parsed_names)))
+        """
+        )
+    )
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=2)
+
+    # The match of the step definition is reused by every execution, without parsing the step name again
+    assert collect_dumped_objects(result) == [(3, ["I have 3 apples"]), (3, ["I have 3 apples"])]
+
+
+def test_custom_step_parser(pytester):
+    """Parsers only implementing `is_matching` and `parse_arguments` keep working."""
+    pytester.makefile(
+        ".feature",
+        arguments=textwrap.dedent(
+            """\
+            Feature: Custom step parser
+                Scenario: Custom step parser
+                    Given I have 3 APPLES
+            """
+        ),
+    )
+
+    pytester.makepyfile(
+        textwrap.dedent(
+            r"""
+        from pytest_bdd import parsers, given, scenarios
+        from pytest_bdd.utils import dump_obj
+
+        scenarios("arguments.feature")
+
+
+        class case_insensitive(parsers.StepParser):
+            def is_matching(self, name):
+                return name.lower() == self.name
+
+            def parse_arguments(self, name):
+                return {"n": int(name.split()[2])}
+
+
+        @given(case_insensitive("i have 3 apples"))
+        def _(n):
+            dump_obj(n)
+        """
+        )
+    )
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=1)
+
+    assert collect_dumped_objects(result) == [3]
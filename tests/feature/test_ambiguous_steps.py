@@ -0,0 +1,124 @@
+"""Test the detection of the steps that several step definitions can parse."""
+
+from __future__ import annotations
+
+import textwrap
+
+import pytest
+
+FEATURE = textwrap.dedent(
+    """\
+    Feature: Ambiguous steps
+        Scenario: Ambiguous step
+            Given I have 3 cucumbers
+            Then I have cucumbers
+
+        Scenario: Ambiguous step again
+            Given I have 3 cucumbers
+
+        Scenario: Overridden step
+            Given I have a conftest step
+            Then I have an alias
+    """
+)
+
+CONFTEST = textwrap.dedent(
+    """\
+    from pytest_bdd import given
+
+
+    @given("I have a conftest step")
+    def conftest_step():
+        raise AssertionError("The step of the module has a narrower scope")
+    """
+)
+
+STEPS = textwrap.dedent(
+    """\
+    from pytest_bdd import given, then, parsers, scenarios
+
+    scenarios("ambiguous.feature")
+
+
+    @given(parsers.parse("I have {count:d} cucumbers"))
+    def have_parsed_cucumbers(count):
+        print("Running have_parsed_cucumbers")
+
+
+    @given("I have 3 cucumbers")
+    def have_3_cucumbers():
+        print("Running have_3_cucumbers")
+
+
+    @then("I have cucumbers")
+    def have_cucumbers():
+        pass
+
+
+    @given("I have a conftest step")
+    def module_step():
+        pass
+
+
+    @then("I have an alias")
+    @then(parsers.re("I have an? alias"))
+    def alias():
+        pass
+    """
+)
+
+
+@pytest.fixture
+def ambiguous_steps(pytester):
+    pytester.makefile(".feature", ambiguous=FEATURE)
+    pytester.makeconftest(CONFTEST)
+    pytester.makepyfile(STEPS)
+
+
+@pytest.mark.usefixtures("ambiguous_steps")
+def test_ambiguous_steps_are_ignored_by_default(pytester):
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=3)
+    # The last registered step definition wins
+    assert result.stdout.str().count("Running have_3_cucumbers") == 2
+    result.stdout.no_fnmatch_line("*AmbiguousStepDefinitionWarning*")
+
+
+@pytest.mark.usefixtures("ambiguous_steps")
+def test_ambiguous_steps_warn(pytester):
+    result = pytester.runpytest("--bdd-ambiguous-steps=warn")
+    result.assert_outcomes(passed=3, warnings=1)
+    definitions = (
+        "have_3_cucumbers (test_ambiguous_steps_warn.py:*), have_parsed_cucumbers (test_ambiguous_steps_warn.py:*)"
+    )
+    warning = (
+        '*ambiguous.feature:3: AmbiguousStepDefinitionWarning: Step Given "I have 3 cucumbers" is ambiguous, '
+        f"it can be parsed by several step definitions at the same scope: {definitions}*"
+    )
+    result.stdout.fnmatch_lines([warning])
+
+
+@pytest.mark.usefixtures("ambiguous_steps")
+def test_ambiguous_steps_fail(pytester):
+    pytester.makeini(
+        """\
+        [pytest]
+        bdd_ambiguous_steps = fail
+        """
+    )
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=1, failed=2)
+    # The steps are not run
+    assert "Running have_" not in result.stdout.str()
+    result.stdout.fnmatch_lines(['*AmbiguousStepDefinitionError: Step Given "I have 3 cucumbers" is ambiguous*'])
+
+
+def test_invalid_ambiguous_steps_mode(pytester):
+    pytester.makeini(
+        """\
+        [pytest]
+        bdd_ambiguous_steps = error
+        """
+    )
+    result = pytester.runpytest()
+    result.stderr.fnmatch_lines(["*Invalid bdd_ambiguous_steps value 'error', expected one of: ignore, warn, fail"])
@@ -0,0 +1,161 @@
+"""Test the persistent cache of the parsed features."""
+
+from __future__ import annotations
+
+import textwrap
+from importlib.metadata import PackageNotFoundError
+
+from pytest_bdd import feature
+from pytest_bdd.feature import PersistentFeatureCache
+from pytest_bdd.parser import FeatureParser
+from pytest_bdd.utils import collect_dumped_objects
+
+FEATURE = textwrap.dedent(
+    """\
+    Feature: Feature cache
+        Scenario: Cached scenario
+            Given I have a cached feature
+    """
+)
+
+
+def make_project(pytester):
+    pytester.makefile(".feature", cached=FEATURE)
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            from pytest_bdd.feature import get_persistent_feature_cache
+            from pytest_bdd.utils import dump_obj
+
+
+            def pytest_sessionfinish(session):
+                cache = get_persistent_feature_cache()
+                dump_obj(None if cache is None else (cache.hits, cache.misses))
+            """
+        )
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("cached.feature")
+
+
+            @given("I have a cached feature")
+            def _():
+                pass
+
+
+            @given("I have a modified feature")
+            def _():
+                pass
+            """
+        )
+    )
+
+
+def test_feature_cache(pytester):
+    make_project(pytester)
+    pytester.makeini(
+        """\
+        [pytest]
+        bdd_feature_cache = true
+        """
+    )
+
+    # Run in subprocesses, the features are also cached in memory
+    result = pytester.runpytest_subprocess("-s")
+    result.assert_outcomes(passed=1)
+    assert collect_dumped_objects(result) == [(0, 1)]
+    assert len(list(pytester.path.joinpath(".pytest_cache", "d", "pytest-bdd-features").glob("*.pickle"))) == 1
+
+    result = pytester.runpytest_subprocess("-s", "-v")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*::test_cached_scenario PASSED*"])
+    assert collect_dumped_objects(result) == [(1, 0)]
+
+    # The feature is parsed again when its content changes
+    pytester.makefile(".feature", cached=FEATURE.replace("I have a cached feature", "I have a modified feature"))
+    result = pytester.runpytest_subprocess("-s")
+    result.assert_outcomes(passed=1)
+    assert collect_dumped_objects(result) == [(0, 1)]
+    assert len(list(pytester.path.joinpath(".pytest_cache", "d", "pytest-bdd-features").glob("*.pickle"))) == 1
+
+
+def test_feature_cache_is_disabled_by_default(pytester):
+    make_project(pytester)
+    result = pytester.runpytest_subprocess("-s")
+    result.assert_outcomes(passed=1)
+    assert collect_dumped_objects(result) == [None]
+    assert not pytester.path.joinpath(".pytest_cache", "d", "pytest-bdd-features").exists()
+
+
+def test_corrupted_feature_cache(pytester):
+    make_project(pytester)
+    pytester.makeini(
+        """\
+        [pytest]
+        bdd_feature_cache = true
+        """
+    )
+    result = pytester.runpytest_subprocess("-s")
+    result.assert_outcomes(passed=1)
+    [entry] = pytester.path.joinpath(".pytest_cache", "d", "pytest-bdd-features").glob("*.pickle")
+    entry.write_bytes(b"corrupted")
+
+    result = pytester.runpytest_subprocess("-s")
+    result.assert_outcomes(passed=1)
+    assert collect_dumped_objects(result) == [(0, 1)]
+
+
+def test_feature_cache_version(monkeypatch, tmp_path):
+    """The cache entries depend on the versions of pytest-bdd and gherkin-official."""
+    versions = {"pytest-bdd": "1.0", "gherkin-official": "2.0"}
+
+    def get_version(distribution):
+        if distribution not in versions:
+            raise PackageNotFoundError(distribution)
+        return versions[distribution]
+
+    monkeypatch.setattr(feature, "version", get_version)
+    assert PersistentFeatureCache(str(tmp_path)).version == f"1.0:2.0:{feature.FEATURE_CACHE_FORMAT}"
+
+    # pytest-bdd is imported from a source checkout
+    del versions["pytest-bdd"]
+    pytest_bdd_version, gherkin_version, _ = PersistentFeatureCache(str(tmp_path)).version.split(":")
+    assert (len(pytest_bdd_version), gherkin_version) == (64, "2.0")
+
+
+def test_feature_cache_entry_not_picklable(tmp_path):
+    """An entry that can't be pickled is not cached, and its temporary file is removed."""
+    cache = PersistentFeatureCache(str(tmp_path))
+
+    cache._store(str(tmp_path / "entry.pickle"), "hash", lambda: None)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_feature_cache_entry_of_feature_file_changed_while_parsed(monkeypatch, tmp_path):
+    """The entry has the hash of the content before the parsing, so a feature file changed meanwhile is parsed again."""
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    feature_file = tmp_path / "changed.feature"
+    feature_file.write_text(FEATURE)
+    cache = PersistentFeatureCache(str(cache_dir))
+
+    parse = FeatureParser.parse
+
+    def parse_then_change(self):
+        parsed = parse(self)
+        feature_file.write_text(FEATURE.replace("I have a cached feature", "I have a modified feature"))
+        return parsed
+
+    monkeypatch.setattr(FeatureParser, "parse", parse_then_change)
+    [scenario] = cache.get_feature(str(tmp_path), "changed.feature").scenarios.values()
+    assert [step.name for step in scenario.steps] == ["I have a cached feature"]
+    monkeypatch.undo()
+
+    [scenario] = cache.get_feature(str(tmp_path), "changed.feature").scenarios.values()
+    assert [step.name for step in scenario.steps] == ["I have a modified feature"]
+    assert (cache.hits, cache.misses) == (0, 2)
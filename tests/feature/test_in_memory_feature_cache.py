@@ -0,0 +1,160 @@
+"""Test the in-memory cache of the parsed features."""
+
+from __future__ import annotations
+
+import os
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pytest_bdd import feature
+from pytest_bdd.utils import collect_dumped_objects
+
+
+@pytest.fixture
+def feature_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(feature, "features", feature.FeatureCache(maxsize=2))
+    for index in range(3):
+        tmp_path.joinpath(f"feature_{index}.feature").write_text(
+            textwrap.dedent(
+                f"""\
+                Feature: Feature {index}
+                    Scenario: Scenario {index}
+                        Given I have {index} cucumbers
+                """
+            )
+        )
+    return tmp_path
+
+
+def test_features_are_cached(feature_files):
+    first = feature.get_feature(str(feature_files), "feature_0.feature")
+
+    assert feature.get_feature(str(feature_files), "feature_0.feature") is first
+    assert feature.features.stats() == feature.FeatureCacheStats(
+        hits=1, misses=1, invalidations=0, evictions=0, size=1, maxsize=2
+    )
+
+
+def test_least_recently_used_features_are_evicted(feature_files):
+    first = feature.get_feature(str(feature_files), "feature_0.feature")
+    feature.get_feature(str(feature_files), "feature_1.feature")
+    # Use the first feature again, so that the second one is the least recently used
+    feature.get_feature(str(feature_files), "feature_0.feature")
+    feature.get_feature(str(feature_files), "feature_2.feature")
+
+    assert str(feature_files / "feature_1.feature") not in feature.features
+    assert feature.get_feature(str(feature_files), "feature_0.feature") is first
+    assert feature.features.stats().evictions == 1
+
+    feature.features.resize(1)
+    assert len(feature.features) == 1
+    assert feature.features.stats().evictions == 2
+
+
+def test_changed_features_are_parsed_again(feature_files):
+    feature_file = feature_files / "feature_0.feature"
+    first = feature.get_feature(str(feature_files), "feature_0.feature")
+
+    feature_file.write_text(feature_file.read_text().replace("Feature 0", "Changed feature"))
+    os.utime(feature_file, ns=(feature_file.stat().st_atime_ns, feature_file.stat().st_mtime_ns + 1_000_000_000))
+    changed = feature.get_feature(str(feature_files), "feature_0.feature")
+
+    assert changed is not first
+    assert changed.name == "Changed feature"
+    assert feature.features.stats().invalidations == 1
+
+
+def test_features_changed_while_parsed_are_parsed_again(feature_files, monkeypatch):
+    """The feature is cached with the signature of its feature file before the parsing."""
+    feature_file = feature_files / "feature_0.feature"
+    parse = feature.FeatureParser.parse
+
+    def parse_then_change(self):
+        parsed = parse(self)
+        feature_file.write_text(feature_file.read_text().replace("Feature 0", "Changed feature"))
+        os.utime(feature_file, ns=(feature_file.stat().st_atime_ns, feature_file.stat().st_mtime_ns + 1_000_000_000))
+        return parsed
+
+    monkeypatch.setattr(feature.FeatureParser, "parse", parse_then_change)
+    assert feature.get_feature(str(feature_files), "feature_0.feature").name == "Feature 0"
+    monkeypatch.setattr(feature.FeatureParser, "parse", parse)
+
+    assert feature.get_feature(str(feature_files), "feature_0.feature").name == "Changed feature"
+    assert feature.features.stats().invalidations == 1
+
+
+def test_clear(feature_files):
+    feature.get_feature(str(feature_files), "feature_0.feature")
+
+    feature.features.clear()
+
+    assert len(feature.features) == 0
+    assert feature.features.stats() == feature.FeatureCacheStats(
+        hits=0, misses=0, invalidations=0, evictions=0, size=0, maxsize=2
+    )
+
+
+def test_features_cache_is_shared_by_threads(feature_files):
+    feature.features.resize(None)
+    names = [f"feature_{index % 3}.feature" for index in range(60)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parsed = list(executor.map(lambda name: feature.get_feature(str(feature_files), name), names))
+
+    assert [f.name for f in parsed] == [f"Feature {index % 3}" for index in range(60)]
+    stats = feature.features.stats()
+    assert stats.hits + stats.misses == 60
+    assert stats.size == 3
+
+
+def test_feature_files_are_parsed_once_by_default(pytester):
+    """The cache is not bounded by default: more feature files than the old bound of 1024 are each parsed once."""
+    features_dir = pytester.mkdir("features")
+    for index in range(1025):
+        features_dir.joinpath(f"feature_{index}.feature").write_text(
+            textwrap.dedent(
+                f"""\
+                Feature: Feature {index}
+                    Scenario: Scenario {index}
+                        Given I have {index} cucumbers
+                """
+            )
+        )
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            from pytest_bdd.feature import features
+            from pytest_bdd.utils import dump_obj
+
+
+            def pytest_collection_finish(session):
+                dump_obj(features.stats())
+            """
+        )
+    )
+    pytester.makepyfile(
+        test_first='from pytest_bdd import scenarios\n\nscenarios("features")\n',
+        test_second='from pytest_bdd import scenarios\n\nscenarios("features")\n',
+    )
+
+    # Run in a subprocess, with a features cache of its own
+    result = pytester.runpytest_subprocess("--collect-only", "-s")
+    result.assert_outcomes()
+
+    [stats] = collect_dumped_objects(result)
+    # Each feature file is parsed when it misses the cache, and is then found in the cache
+    assert (stats.misses, stats.invalidations, stats.evictions, stats.size, stats.maxsize) == (1025, 0, 0, 1025, None)
+    assert stats.hits >= 1025
+
+
+def test_invalid_features_cache_size(pytester):
+    pytester.makeini(
+        """\
+        [pytest]
+        bdd_features_cache_size = -1
+        """
+    )
+    result = pytester.runpytest()
+    result.stderr.fnmatch_lines(["*Invalid bdd_features_cache_size value '-1', expected a number of features"])
@@ -0,0 +1,66 @@
+"""Test the parsing of the feature files in a pool of processes."""
+
+from __future__ import annotations
+
+import textwrap
+
+import pytest
+
+from pytest_bdd import feature
+from pytest_bdd.exceptions import ScenarioError
+
+
+@pytest.fixture
+def feature_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(feature, "features", feature.FeatureCache())
+    monkeypatch.setattr(feature, "PARALLEL_PARSE_MIN_FILES", 2)
+    tmp_path.joinpath("nested").mkdir()
+    for index in range(4):
+        tmp_path.joinpath("nested" if index % 2 else "", f"feature_{index}.feature").write_text(
+            textwrap.dedent(
+                f"""\
+                Feature: Feature {index}
+                    Scenario: Scenario {index}
+                        Given I have {index} cucumbers
+                """
+            )
+        )
+    return tmp_path
+
+
+def test_parse_features_in_parallel(feature_files, monkeypatch):
+    parallel = feature.get_features([str(feature_files)], workers=2)
+    parallel_cache = feature.features
+    monkeypatch.setattr(feature, "features", feature.FeatureCache())
+    sequential = feature.get_features([str(feature_files)], workers=0)
+
+    assert [f.name for f in parallel] == ["Feature 0", "Feature 1", "Feature 2", "Feature 3"]
+    assert [(f.filename, f.rel_filename, list(f.scenarios)) for f in parallel] == [
+        (f.filename, f.rel_filename, list(f.scenarios)) for f in sequential
+    ]
+    # The parallel mode fills the features cache
+    assert len(parallel_cache) == len(feature.features) == 4
+    assert all(parallel_cache.get(f.filename) is f for f in parallel)
+
+
+def test_parse_errors_in_parallel(feature_files):
+    feature_files.joinpath("nested", "feature_1.feature").write_text("Scenario: No feature\n    Given a step\n")
+    feature_files.joinpath("feature_2.feature").write_text("Scenario: No feature\n    Given a step\n")
+
+    with pytest.raises(ScenarioError) as excinfo:
+        feature.get_features([str(feature_files / "nested"), str(feature_files)], workers=2)
+    # The first invalid feature file is reported, as when parsing sequentially
+    assert excinfo.value.filename == str(feature_files / "nested" / "feature_1.feature")
+    assert str(feature_files / "feature_0.feature") in feature.features
+    assert str(feature_files / "nested" / "feature_1.feature") not in feature.features
+
+
+def test_invalid_parse_workers(pytester):
+    pytester.makeini(
+        """\
+        [pytest]
+        bdd_parse_workers = many
+        """
+    )
+    result = pytester.runpytest()
+    result.stderr.fnmatch_lines(["*Invalid bdd_parse_workers value 'many', expected a number of processes or 'auto'"])
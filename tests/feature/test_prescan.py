@@ -0,0 +1,259 @@
+"""Test the prescan of the feature files and the feature index."""
+
+from __future__ import annotations
+
+import json
+import os
+import textwrap
+
+from pytest_bdd.feature import PersistentFeatureCache
+from pytest_bdd.prescan import FeatureIndex, RuleSummary, ScenarioSummary, prescan_feature_file
+
+FEATURE = textwrap.dedent(
+    '''\
+    @feature-tag
+    Feature: Prescanned feature
+        A description mentioning Given steps
+
+        Background:
+            Given I have a background
+
+        @scenario-tag @other-tag # A comment
+        Scenario: Scenario
+            Given I have a docstring
+                """
+                Scenario: Not a scenario
+                @not-a-tag
+                """
+
+        Rule: Rule
+            @rule-scenario-tag
+            Scenario Outline: Outline in a rule
+                Given I have <count> cucumbers
+
+                @examples-tag
+                Examples:
+                    | count |
+                    | 1     |
+    '''
+)
+
+
+def test_prescan_feature_file(tmp_path):
+    feature_file = tmp_path / "prescan.feature"
+    feature_file.write_text(FEATURE)
+
+    summary = prescan_feature_file(str(feature_file))
+
+    assert (summary.name, summary.line_number, summary.tags) == ("Prescanned feature", 2, {"feature-tag"})
+    assert summary.rules == (RuleSummary(name="Rule", line_number=16, tags=frozenset()),)
+    assert summary.scenarios == (
+        ScenarioSummary(name="Scenario", line_number=9, tags=frozenset({"feature-tag", "scenario-tag", "other-tag"})),
+        ScenarioSummary(
+            name="Outline in a rule",
+            line_number=18,
+            tags=frozenset({"feature-tag", "rule-scenario-tag", "examples-tag"}),
+            rule="Rule",
+        ),
+    )
+    assert summary.all_tags == {"feature-tag", "scenario-tag", "other-tag", "rule-scenario-tag", "examples-tag"}
+
+
+def test_prescan_feature_file_language(tmp_path):
+    feature_file = tmp_path / "prescan.feature"
+    feature_file.write_text(
+        textwrap.dedent(
+            """\
+            # language: fr
+            @tag
+            Fonctionnalité: Fonctionnalité
+                Scénario: Scénario
+                    Soit une étape
+            """
+        ),
+        encoding="utf-8",
+    )
+
+    summary = prescan_feature_file(str(feature_file))
+
+    assert summary.name == "Fonctionnalité"
+    assert [(scenario.name, scenario.line_number, scenario.tags) for scenario in summary.scenarios] == [
+        ("Scénario", 4, {"tag"})
+    ]
+
+
+def test_feature_index(tmp_path):
+    feature_file = tmp_path / "prescan.feature"
+    feature_file.write_text(FEATURE)
+    index_path = str(tmp_path / "index.json")
+
+    index = FeatureIndex(index_path)
+    summary = index.get_summary(str(feature_file))
+    index.save()
+
+    assert FeatureIndex(index_path).get_summary(str(feature_file)) == summary
+
+    feature_file.write_text(FEATURE.replace("Prescanned feature", "Changed feature"))
+    os.utime(feature_file, ns=(feature_file.stat().st_atime_ns, feature_file.stat().st_mtime_ns + 1_000_000_000))
+    assert FeatureIndex(index_path).get_summary(str(feature_file)).name == "Changed feature"
+
+
+def test_feature_index_is_saved_with_the_feature_cache(pytester):
+    pytester.makefile(".feature", prescan=FEATURE)
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("prescan.feature")
+
+
+            @given("I have a background")
+            @given("I have a docstring")
+            @given("I have 1 cucumbers")
+            def _():
+                pass
+            """
+        )
+    )
+    pytester.makeini(
+        """\
+        [pytest]
+        bdd_feature_cache = true
+        """
+    )
+
+    result = pytester.runpytest_subprocess()
+    result.assert_outcomes(passed=2)
+
+    with open(pytester.path / ".pytest_cache" / "d" / "pytest-bdd-features" / "index.json") as index_file:
+        index = json.load(index_file)
+    [entry] = index["features"].values()
+    assert [scenario["name"] for scenario in entry["summary"]["scenarios"]] == ["Scenario", "Outline in a rule"]
+
+
+def test_feature_index_merge(tmp_path):
+    """Each session saves its own index file, merged in the index afterwards."""
+    feature_file = tmp_path / "prescan.feature"
+    feature_file.write_text(FEATURE)
+    other_feature_file = tmp_path / "other.feature"
+    other_feature_file.write_text(FEATURE.replace("Prescanned feature", "Other feature"))
+    index_path = str(tmp_path / "index.json")
+
+    for worker_id, path in (("gw0", feature_file), ("gw1", other_feature_file)):
+        worker_index = FeatureIndex(index_path, save_path=str(tmp_path / f"index-{worker_id}.json"))
+        worker_index.get_summary(str(path))
+        worker_index.save()
+    assert not os.path.exists(index_path)
+
+    index = FeatureIndex(index_path)
+    index.merge([str(tmp_path / "index-gw0.json"), str(tmp_path / "index-gw1.json")])
+    index.save()
+
+    assert sorted(path.name for path in tmp_path.glob("index*.json")) == ["index.json"]
+    with open(index_path) as index_file:
+        assert sorted(json.load(index_file)["features"]) == [str(other_feature_file), str(feature_file)]
+
+
+def test_feature_index_is_merged_with_xdist(pytester):
+    pytester.makefile(".feature", prescan=FEATURE, other=FEATURE.replace("Prescanned feature", "Other feature"))
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("prescan.feature", "other.feature")
+
+
+            @given("I have a background")
+            @given("I have a docstring")
+            @given("I have 1 cucumbers")
+            def _():
+                pass
+            """
+        )
+    )
+    pytester.makeini(
+        """\
+        [pytest]
+        bdd_feature_cache = true
+        """
+    )
+
+    result = pytester.runpytest_subprocess("-n", "2")
+    result.assert_outcomes(passed=4)
+
+    cache_dir = pytester.path / ".pytest_cache" / "d" / "pytest-bdd-features"
+    assert sorted(path.name for path in cache_dir.glob("index*.json")) == ["index.json"]
+    with open(cache_dir / "index.json") as index_file:
+        index = json.load(index_file)
+    assert sorted(entry["summary"]["name"] for entry in index["features"].values()) == [
+        "Other feature",
+        "Prescanned feature",
+    ]
+
+
+def test_feature_index_errors_do_not_prevent_loading_the_features(pytester):
+    pytester.makefile(".feature", prescan=FEATURE)
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            from pytest_bdd.prescan import FeatureIndex
+
+
+            def get_summary(self, filename, encoding="utf-8"):
+                raise UnicodeDecodeError(encoding, b"", 0, 1, "broken feature file")
+
+
+            FeatureIndex.get_summary = get_summary
+            """
+        )
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("prescan.feature")
+
+
+            @given("I have a background")
+            @given("I have a docstring")
+            @given("I have 1 cucumbers")
+            def _():
+                pass
+            """
+        )
+    )
+    pytester.makeini(
+        """\
+        [pytest]
+        bdd_feature_cache = true
+        """
+    )
+
+    result = pytester.runpytest_subprocess()
+    result.assert_outcomes(passed=2)
+
+
+def test_feature_index_is_updated_on_feature_cache_misses(monkeypatch, tmp_path):
+    """Loading a cached feature doesn't prescan its feature file nor stat it for the index."""
+    feature_file = tmp_path / "prescan.feature"
+    feature_file.write_text(FEATURE)
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    summarized = []
+    get_summary = FeatureIndex.get_summary
+
+    def recording_get_summary(self, filename, encoding="utf-8"):
+        summarized.append(os.path.basename(filename))
+        return get_summary(self, filename, encoding)
+
+    monkeypatch.setattr(FeatureIndex, "get_summary", recording_get_summary)
+
+    PersistentFeatureCache(str(cache_dir)).get_feature(str(tmp_path), "prescan.feature")
+    cache = PersistentFeatureCache(str(cache_dir))
+    cache.get_feature(str(tmp_path), "prescan.feature")
+
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert summarized == ["prescan.feature"]
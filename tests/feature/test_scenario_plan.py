@@ -0,0 +1,213 @@
+"""Test the execution plan of the scenarios."""
+
+from __future__ import annotations
+
+import textwrap
+
+from pytest_bdd.utils import collect_dumped_objects
+
+
+def test_scenarios_are_planned_at_collection(pytester):
+    pytester.makefile(
+        ".feature",
+        plan=textwrap.dedent(
+            """\
+            Feature: Scenario plan
+                Scenario Outline: Eating cucumbers
+                    Given there are <start> cucumbers
+                    When I eat <eat> cucumbers
+                    Then I should have <left> cucumbers
+
+                    Examples:
+                    | start | eat | left |
+                    |  12   |  5  |  7   |
+                    |  5    |  4  |  1   |
+
+                Scenario: Undefined step
+                    Given there are 3 cucumbers
+                    When I do something undefined
+            """
+        ),
+    )
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            from pytest_bdd.scenario import scenario_plan_registry
+            from pytest_bdd.utils import dump_obj
+
+
+            def pytest_collection_finish(session):
+                for item in session.items:
+                    plan = scenario_plan_registry[item]
+                    dump_obj(
+                        (
+                            item.name,
+                            [
+                                (
+                                    step_plan.step.name,
+                                    step_plan.context and step_plan.context.step_func.__name__,
+                                    step_plan.fixture_names,
+                                )
+                                for step_plan in plan.steps
+                            ],
+                        )
+                    )
+            """
+        )
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, when, then, parsers, scenarios
+
+            scenarios("plan.feature")
+
+
+            @given(parsers.parse("there are {start:d} cucumbers"), target_fixture="cucumbers")
+            def given_cucumbers(start):
+                return {"start": start, "eat": 0}
+
+
+            @when(parsers.parse("I eat {eat:d} cucumbers"))
+            def eat_cucumbers(cucumbers, eat):
+                cucumbers["eat"] += eat
+
+
+            @then(parsers.parse("I should have {left:d} cucumbers"))
+            def should_have_left_cucumbers(cucumbers, left):
+                assert cucumbers["start"] - cucumbers["eat"] == left
+            """
+        )
+    )
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=2, failed=1)
+    result.stdout.fnmatch_lines(["*StepDefinitionNotFoundError: Step definition is not found: When *"])
+
+    assert collect_dumped_objects(result) == [
+        (
+            "test_eating_cucumbers[12-5-7]",
+            [
+                ("there are 12 cucumbers", "given_cucumbers", ("start",)),
+                ("I eat 5 cucumbers", "eat_cucumbers", ("cucumbers", "eat")),
+                ("I should have 7 cucumbers", "should_have_left_cucumbers", ("cucumbers", "left")),
+            ],
+        ),
+        (
+            "test_eating_cucumbers[5-4-1]",
+            [
+                ("there are 5 cucumbers", "given_cucumbers", ("start",)),
+                ("I eat 4 cucumbers", "eat_cucumbers", ("cucumbers", "eat")),
+                ("I should have 1 cucumbers", "should_have_left_cucumbers", ("cucumbers", "left")),
+            ],
+        ),
+        (
+            "test_undefined_step",
+            [
+                ("there are 3 cucumbers", "given_cucumbers", ("start",)),
+                ("I do something undefined", None, ()),
+            ],
+        ),
+    ]
+
+
+def test_overridden_example_is_planned_at_run_time(pytester):
+    """The plan is computed again if the example given to the scenario is not the one collected."""
+    pytester.makefile(
+        ".feature",
+        plan=textwrap.dedent(
+            """\
+            Feature: Scenario plan
+                Scenario: Overridden example
+                    Given there are <start> cucumbers
+            """
+        ),
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            import pytest
+            from pytest_bdd import given, parsers, scenarios
+
+            scenarios("plan.feature")
+
+
+            @pytest.fixture
+            def _pytest_bdd_example():
+                return {"start": "12"}
+
+
+            @given(parsers.parse("there are {start:d} cucumbers"))
+            def _(start):
+                assert start == 12
+            """
+        )
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
+
+
+def test_step_arguments_are_built_at_each_execution(pytester):
+    """The plan keeps the match of the step, the arguments are built from it each time the step is executed."""
+    pytester.makefile(
+        ".feature",
+        plan=textwrap.dedent(
+            """\
+            Feature: Scenario plan
+                Scenario Outline: Eating cucumbers
+                    Given there are <cucumbers> cucumbers
+                    Then I eat them all
+
+                    Examples:
+                    | cucumbers |
+                    |  1,2      |
+                    |  1,2      |
+            """
+        ),
+    )
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            from pytest_bdd.scenario import scenario_plan_registry
+            from pytest_bdd.utils import dump_obj
+
+
+            def pytest_collection_finish(session):
+                for item in session.items:
+                    match = scenario_plan_registry[item].steps[0].match
+                    first_arguments, second_arguments = match.arguments, match.arguments
+                    dump_obj(
+                        (
+                            first_arguments == second_arguments,
+                            first_arguments["cucumbers"] is second_arguments["cucumbers"],
+                        )
+                    )
+            """
+        )
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, then, parsers, scenarios
+
+            scenarios("plan.feature")
+
+
+            @given(
+                parsers.parse("there are {cucumbers:List} cucumbers", extra_types={"List": lambda text: text.split(",")}),
+                target_fixture="cucumbers",
+            )
+            def given_cucumbers(cucumbers):
+                assert cucumbers == ["1", "2"]
+                return cucumbers
+
+
+            @then("I eat them all")
+            def eat_cucumbers(cucumbers):
+                cucumbers.clear()
+            """
+        )
+    )
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=2)
+
+    assert collect_dumped_objects(result) == [(True, False), (True, False)]
@@ -739,3 +739,49 @@ def test_keywords_used_outside_steps(pytester):
     )
     result = pytester.runpytest()
     result.assert_outcomes(passed=1, failed=0)
+
+
+def test_invalid_step_parser_only_fails_where_visible(pytester):
+    """An invalid step expression only fails the scenarios that can see its step definition."""
+    pytester.makefile(
+        ".feature",
+        apples=textwrap.dedent(
+            """\
+            Feature: Apples
+                Scenario: Having apples
+                    Given I have 3 apples
+            """
+        ),
+    )
+    pytester.makepyfile(
+        test_a=textwrap.dedent(
+            """\
+            from pytest_bdd import given, parsers, scenarios
+
+            scenarios("apples.feature")
+
+            @given(parsers.re(r"I have (?P<n>\\d+ apples"))
+            def broken_apples():
+                pass
+            """
+        ),
+        test_b=textwrap.dedent(
+            """\
+            from pytest_bdd import given, parsers, scenarios
+
+            scenarios("apples.feature")
+
+            @given(parsers.re(r"I have (?P<n>\\d+) apples"))
+            def valid_apples(n):
+                assert n == "3"
+            """
+        ),
+    )
+    result = pytester.runpytest_subprocess("-p", "no:cacheprovider")
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*StepParserError: The parser * of the step definition broken_apples (test_a.py:6) failed to match*",
+            "FAILED test_a.py::test_having_apples - *",
+        ]
+    )
@@ -0,0 +1,86 @@
+"""Test the handling of the scenarios having undefined steps."""
+
+from __future__ import annotations
+
+import textwrap
+
+import pytest
+
+FEATURE = textwrap.dedent(
+    """\
+    Feature: Undefined steps
+        Scenario: Defined steps
+            Given I have a cucumber
+            Then I have a cucumber
+
+        Scenario: Undefined step
+            Given I have a cucumber
+            When I eat the cucumber
+            Then I have no cucumber
+    """
+)
+
+STEPS = textwrap.dedent(
+    """\
+    from pytest_bdd import given, then, scenarios
+
+    scenarios("undefined.feature")
+
+
+    @given("I have a cucumber")
+    def _():
+        print("Running the given step")
+
+
+    @then("I have a cucumber")
+    def _():
+        pass
+    """
+)
+
+
+@pytest.fixture
+def undefined_steps(pytester):
+    pytester.makefile(".feature", undefined=FEATURE)
+    pytester.makepyfile(STEPS)
+
+
+@pytest.mark.usefixtures("undefined_steps")
+def test_undefined_steps_run_by_default(pytester):
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=1, failed=1)
+    assert result.stdout.str().count("Running the given step") == 2
+    result.stdout.fnmatch_lines(["*StepDefinitionNotFoundError: Step definition is not found: When*"])
+
+
+@pytest.mark.usefixtures("undefined_steps")
+def test_undefined_steps_fail(pytester):
+    result = pytester.runpytest("-s", "--bdd-undefined-steps=fail")
+    result.assert_outcomes(passed=1, failed=1)
+    # The steps before the undefined one are not run
+    assert result.stdout.str().count("Running the given step") == 1
+    result.stdout.fnmatch_lines(["*StepDefinitionNotFoundError: Step definition is not found: When*"])
+
+
+@pytest.mark.usefixtures("undefined_steps")
+def test_undefined_steps_deselect(pytester):
+    pytester.makeini(
+        """\
+        [pytest]
+        bdd_undefined_steps = deselect
+        """
+    )
+    result = pytester.runpytest("-v")
+    result.assert_outcomes(passed=1, deselected=1)
+    result.stdout.fnmatch_lines(["*test_defined_steps PASSED*"])
+
+
+def test_invalid_undefined_steps_mode(pytester):
+    pytester.makeini(
+        """\
+        [pytest]
+        bdd_undefined_steps = ignore
+        """
+    )
+    result = pytester.runpytest()
+    result.stderr.fnmatch_lines(["*Invalid bdd_undefined_steps value 'ignore', expected one of: run, fail, deselect"])
@@ -2,20 +2,8 @@
 
 from __future__ import annotations
 
-import itertools
 import textwrap
 
-from pytest_bdd.scenario import get_python_name_generator
-
-
-def test_python_name_generator():
-    """Test python name generator function."""
-    assert list(itertools.islice(get_python_name_generator("Some name"), 3)) == [
-        "test_some_name",
-        "test_some_name_1",
-        "test_some_name_2",
-    ]
-
 
 def test_generate_missing(pytester):
     """Test generate missing command."""
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import pickle
 import textwrap
 from collections import OrderedDict
 from pathlib import Path
 
+from gherkin.parser import Parser
+
+from src.pytest_bdd import gherkin_parser
 from src.pytest_bdd.gherkin_parser import (
     Background,
     Cell,
@@ -22,7 +26,7 @@ from src.pytest_bdd.gherkin_parser import (
     Tag,
     get_gherkin_document,
 )
-from src.pytest_bdd.parser import Examples, ScenarioTemplate
+from src.pytest_bdd.parser import Examples, FeatureParser, ScenarioTemplate
 from src.pytest_bdd.parser import Feature as PytestBddFeature
 from src.pytest_bdd.parser import Step as PytestBddStep
 
@@ -1261,3 +1265,115 @@ def test_render_scenario_with_example_tags_non_first_row():
     rendered_scenario = scenario_template.render({"username": "user2", "password": "pw2"})
 
     assert rendered_scenario.tags == {"scenario_tag", "example_tag"}
+
+
+def test_gherkin_document_nodes_are_slotted_and_share_locations():
+    feature_file = Path(__file__).parent / "test.feature"
+    gherkin_doc = get_gherkin_document(str(feature_file.resolve()))
+    other_doc = get_gherkin_document(str(feature_file.resolve()))
+
+    assert not hasattr(gherkin_doc.feature, "__dict__")
+    assert not hasattr(gherkin_doc.feature.location, "__dict__")
+    assert other_doc.feature.location is gherkin_doc.feature.location
+
+    unpickled_doc = pickle.loads(pickle.dumps(gherkin_doc))
+    assert unpickled_doc == gherkin_doc
+    assert unpickled_doc.feature.location is gherkin_doc.feature.location
+
+
+def test_render_datatable_does_not_change_the_template():
+    location = Location(column=1, line=1)
+    datatable = DataTable(
+        location=location,
+        rows=[Row(id="1", location=location, cells=[Cell(location=location, value="<username>")])],
+    )
+
+    rendered_datatable = PytestBddStep.render_datatable(datatable, {"username": "user1"})
+
+    assert rendered_datatable.raw() == [["user1"]]
+    assert datatable.raw() == [["<username>"]]
+
+
+def test_gherkin_document_is_built_like_the_gherkin_ast():
+    feature_file = Path(__file__).parent / "test.feature"
+
+    gherkin_data = Parser().parse(feature_file.read_text())
+
+    assert get_gherkin_document(str(feature_file.resolve())) == GherkinDocument.from_dict(gherkin_data)
+
+
+def test_gherkin_document_falls_back_to_the_gherkin_ast(monkeypatch):
+    """The document is built from the gherkin AST if the parser tokens miss an attribute the builder uses."""
+    feature_file = Path(__file__).parent / "test.feature"
+
+    def get_location(token, column=None):
+        return token.unknown_attribute
+
+    monkeypatch.setattr(gherkin_parser, "_use_document_builder", True)
+    monkeypatch.setattr(gherkin_parser.GherkinDocumentBuilder, "_get_location", staticmethod(get_location))
+
+    gherkin_data = Parser().parse(feature_file.read_text())
+
+    assert get_gherkin_document(str(feature_file.resolve())) == GherkinDocument.from_dict(gherkin_data)
+    assert not gherkin_parser._use_document_builder
+
+
+def test_step_texts_are_shared_by_the_scenarios():
+    feature = FeatureParser(str(Path(__file__).parent), "test.feature").parse()
+    successful = feature.scenarios["Successful login with valid credentials"]
+    empty_username = feature.scenarios["Login with empty username"]
+
+    # "When the user clicks the login button"
+    assert successful.steps[3].name is empty_username.steps[3].name
+    assert successful.steps[2].keyword is empty_username.steps[2].keyword
+
+
+def test_tag_and_example_parameter_names_are_shared_by_the_features(tmp_path):
+    for name in ("first", "second"):
+        tmp_path.joinpath(f"{name}.feature").write_text(
+            textwrap.dedent(
+                f"""\
+                @shared-tag
+                Feature: {name}
+                    @shared-tag
+                    Scenario Outline: Outline
+                        Given I have <shared_parameter> cucumbers
+
+                        Examples:
+                        | shared_parameter |
+                        | 1                |
+                """
+            )
+        )
+    first, second = (FeatureParser(str(tmp_path), f"{name}.feature").parse() for name in ("first", "second"))
+    [first_scenario], [second_scenario] = first.scenarios.values(), second.scenarios.values()
+
+    [first_tag], [second_tag] = first.tags, second.tags
+    assert first_tag == "shared-tag"
+    assert first_tag is second_tag
+    assert next(iter(first_scenario.tags)) is first_tag
+    [first_parameter] = first_scenario.examples[0].example_params
+    [second_parameter] = second_scenario.examples[0].example_params
+    assert first_parameter == "shared_parameter"
+    assert first_parameter is second_parameter
+
+
+def test_scenario_template_steps_are_cached():
+    feature = FeatureParser(str(Path(__file__).parent), "test.feature").parse()
+    scenario = feature.scenarios["Successful login with valid credentials"]
+
+    steps = scenario.steps
+    assert isinstance(steps, tuple)
+    assert scenario.steps is steps
+    assert steps[: len(scenario.all_background_steps)] == scenario.all_background_steps
+
+    step = PytestBddStep(name="the user logs out", type="when", indent=0, line_number=18, keyword="When")
+    scenario.add_step(step)
+    assert scenario.steps == (*steps, step)
+
+    # The cache is also renewed when a step is added to the background
+    background_step = PytestBddStep(name="the user is logged out", type="given", indent=0, line_number=5, keyword="And")
+    background_steps = scenario.all_background_steps
+    feature.background.add_step(background_step)
+    assert scenario.all_background_steps == (*background_steps, background_step)
+    assert scenario.steps == (*background_steps, background_step, *steps[len(background_steps) :], step)
@@ -7,6 +7,7 @@ from unittest import mock
 import pytest
 
 from pytest_bdd import given, parsers, then, when
+from pytest_bdd.steps import StepArgumentPlan, StepFunctionContext
 from pytest_bdd.utils import collect_dumped_objects
 
 
@@ -20,15 +21,17 @@ def test_given_when_then_delegate_to_step(step_fn: Callable[..., Any], step_type
     with mock.patch("pytest_bdd.steps.step", autospec=True) as step_mock:
         step_fn("foo")
 
-    step_mock.assert_called_once_with("foo", type_=step_type, converters=None, target_fixture=None, stacklevel=1)
+    step_mock.assert_called_once_with(
+        "foo", type_=step_type, converters=None, target_fixture=None, stacklevel=1, cache_converters=False
+    )
 
     # Advanced usage: step parser, converters, target_fixture, ...
     with mock.patch("pytest_bdd.steps.step", autospec=True) as step_mock:
         parser = parsers.re(r"foo (?P<n>\d+)")
-        step_fn(parser, converters={"n": int}, target_fixture="foo_n", stacklevel=3)
+        step_fn(parser, converters={"n": int}, target_fixture="foo_n", stacklevel=3, cache_converters=True)
 
     step_mock.assert_called_once_with(
-        name=parser, type_=step_type, converters={"n": int}, target_fixture="foo_n", stacklevel=3
+        name=parser, type_=step_type, converters={"n": int}, target_fixture="foo_n", stacklevel=3, cache_converters=True
     )
 
 
@@ -360,3 +363,51 @@ def test_step_catches_all(pytester):
 
     objects = collect_dumped_objects(result)
     assert objects == ["foo", ("foo parametrized", 1), "foo", ("foo parametrized", 2), "foo", ("foo parametrized", 3)]
+
+
+def test_step_argument_plan():
+    """The arguments of the step function are planned when the step is defined."""
+
+    def step_func(request, n, datatable, docstring=None, *args, flag=False, **kwargs):
+        pass
+
+    context = StepFunctionContext(type="given", step_func=step_func, parser=parsers.string("foo"))
+
+    assert context.argument_plan == StepArgumentPlan(
+        parameters=frozenset({"request", "n", "datatable", "docstring", "args", "flag", "kwargs"}),
+        fixture_names=("request", "n", "datatable"),
+        accepts_datatable=True,
+        accepts_docstring=True,
+    )
+
+
+def test_step_fixture_names_are_unique():
+    namespace: dict[str, object] = {"pytestbdd_stepdef_given_I have a foo_2": None}
+    exec(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given
+
+            @given("I have a foo")
+            @given("I have a foo")
+            def _():
+                pass
+
+            @given("I have a foo")
+            @given("I have a bar")
+            def _():
+                pass
+            """
+        ),
+        namespace,
+    )
+
+    assert [name for name in namespace if name.startswith("pytestbdd_stepdef_")] == [
+        "pytestbdd_stepdef_given_I have a foo_2",
+        "pytestbdd_stepdef_given_I have a foo",
+        "pytestbdd_stepdef_given_I have a foo_1",
+        "pytestbdd_stepdef_given_I have a bar",
+        "pytestbdd_stepdef_given_I have a foo_3",
+    ]
+    # The suffixes to try next are not remembered in the namespace
+    assert [name for name in namespace if name.startswith("__")] == ["__builtins__"]
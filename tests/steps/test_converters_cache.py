@@ -0,0 +1,97 @@
+"""Test the cache of the step argument converters."""
+
+from __future__ import annotations
+
+import textwrap
+
+from pytest_bdd.steps import CachedConverter, make_converters
+from pytest_bdd.utils import collect_dumped_objects
+
+
+def test_cache_converters(pytester):
+    pytester.makefile(
+        ".feature",
+        converters=textwrap.dedent(
+            """\
+            Feature: Cached converters
+                Scenario Outline: Cached converters
+                    Given the date is <date>
+                    And the date is <date>
+
+                    Examples:
+                    | date       |
+                    | 2024-01-01 |
+                    | 2024-01-01 |
+                    | 2024-02-01 |
+            """
+        ),
+    )
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            from pytest_bdd.scenario import scenario_plan_registry
+            from pytest_bdd.utils import dump_obj
+
+
+            def pytest_sessionfinish(session):
+                context = scenario_plan_registry[session.items[0]].steps[0].context
+                dump_obj(tuple(context.converters_cache_info()["date"]))
+            """
+        )
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            import datetime
+
+            from pytest_bdd import given, parsers, scenarios
+
+            scenarios("converters.feature")
+
+
+            @given(
+                parsers.parse("the date is {date}"),
+                converters={"date": datetime.date.fromisoformat},
+                cache_converters=2,
+            )
+            def _(date):
+                assert isinstance(date, datetime.date)
+            """
+        )
+    )
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=3)
+    # Hits, misses, maximum size and current size
+    assert collect_dumped_objects(result) == [(4, 2, 2, 2)]
+
+
+def test_cached_converter():
+    calls = []
+
+    def convert(value):
+        calls.append(value)
+        return len(value)
+
+    converter = CachedConverter(convert, maxsize=2)
+    assert [converter(value) for value in ("a", "bb", "a", "ccc", "a", "bb")] == [1, 2, 1, 3, 1, 2]
+    # "bb" was evicted by "ccc"
+    assert calls == ["a", "bb", "ccc", "bb"]
+    assert converter.cache_info().hits == 2
+
+    # Unhashable values are converted every time
+    assert converter(["x", "y"]) == 2
+    assert calls[-1] == ["x", "y"]
+
+    converter.cache_clear()
+    assert converter.cache_info().currsize == 0
+
+
+def test_make_converters():
+    converters = {"n": int}
+    assert make_converters(None) == {}
+    assert make_converters(converters) is converters
+
+    cached = make_converters(converters, cache_converters=True)
+    assert isinstance(cached["n"], CachedConverter)
+    assert cached["n"].cache_info().maxsize == 256
+    assert make_converters(converters, cache_converters=10)["n"].cache_info().maxsize == 10
@@ -0,0 +1,164 @@
+"""Test the step matching statistics."""
+
+from __future__ import annotations
+
+import json
+import textwrap
+
+import pytest
+
+
+def test_match_stats(pytester):
+    pytester.makefile(
+        ".feature",
+        stats=textwrap.dedent(
+            """\
+            Feature: Step matching statistics
+                Scenario: Cucumbers
+                    Given there are 12 cucumbers
+                    When I eat 5 cucumbers
+                    Then I have no pears
+            """
+        ),
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, when, then, parsers, scenarios
+
+            scenarios("stats.feature")
+
+
+            @given(parsers.parse("there are {start:d} cucumbers"))
+            def _(start):
+                pass
+
+
+            @given(parsers.re(r"there are (?P<start>\\d+) pears"))
+            def _(start):
+                pass
+
+
+            @when(parsers.re(r"I eat (?P<eat>\\d+) (?P<fruits>\\w+)"))
+            def _(eat, fruits):
+                pass
+
+
+            @then("I have no pears")
+            def _():
+                pass
+            """
+        )
+    )
+    # Run in a subprocess, so that only the step definitions of this test are registered
+    result = pytester.runpytest_subprocess("--bdd-match-stats=stats.json")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "Step matching statistics: 3 lookups in *ms",
+            "  pytest_bdd.parsers.re: 1 step definitions, 1 attempts, 1 hits, *ms",
+            "Slowest step definitions:",
+            "*generated step matching statistics file: *stats.json*",
+        ]
+    )
+
+    stats = json.loads(pytester.path.joinpath("stats.json").read_text())
+    assert stats["lookups"] == 3
+    assert {parser["parser"]: (parser["attempts"], parser["hits"]) for parser in stats["parsers"]} == {
+        "pytest_bdd.parsers.string": (1, 1),
+        "pytest_bdd.parsers.parse": (1, 1),
+        "pytest_bdd.parsers.re": (1, 1),
+    }
+    definitions = {
+        (definition["type"], definition["expression"]): definition for definition in stats["step_definitions"]
+    }
+    assert set(definitions) == {
+        ("given", "there are {start:d} cucumbers"),
+        ("when", "I eat (?P<eat>\\d+) (?P<fruits>\\w+)"),
+        ("then", "I have no pears"),
+    }
+    eat = definitions["when", "I eat (?P<eat>\\d+) (?P<fruits>\\w+)"]
+    assert eat["location"].startswith("test_match_stats.py:")
+    assert [step["step"] for step in eat["slowest_steps"]] == ["I eat 5 cucumbers"]
+
+
+def test_match_stats_with_xdist(pytester):
+    """Each xdist worker writes its own statistics file, the controller does not write any."""
+    pytester.makefile(
+        ".feature",
+        stats=textwrap.dedent(
+            """\
+            Feature: Step matching statistics
+                Scenario: Cucumbers
+                    Given there are cucumbers
+
+                Scenario: Pears
+                    Given there are cucumbers
+            """
+        ),
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("stats.feature")
+
+
+            @given("there are cucumbers")
+            def _():
+                pass
+            """
+        )
+    )
+    result = pytester.runpytest_subprocess("--bdd-match-stats=stats.json", "-n", "2")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(
+        ["*step matching statistics files generated by the xdist workers: *stats-<worker id>.json*"]
+    )
+
+    assert sorted(path.name for path in pytester.path.glob("stats*.json")) == ["stats-gw0.json", "stats-gw1.json"]
+    assert (
+        sum(json.loads(pytester.path.joinpath(f"stats-gw{worker}.json").read_text())["lookups"] for worker in (0, 1))
+        >= 1
+    )
+
+
+def test_no_match_stats_by_default(pytester):
+    pytester.makefile(
+        ".feature",
+        stats=textwrap.dedent(
+            """\
+            Feature: Step matching statistics
+                Scenario: Cucumbers
+                    Given there are cucumbers
+            """
+        ),
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+            from pytest_bdd.step_index import step_definition_index
+
+            scenarios("stats.feature")
+
+
+            @given("there are cucumbers")
+            def _():
+                assert step_definition_index.match_stats is None
+            """
+        )
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
+    result.stdout.no_fnmatch_line("*Step matching statistics*")
+
+
+def test_match_stats_path_is_required(pytester):
+    """The option does not take the next argument (e.g. a test file) for its path unless explicitly given one."""
+    pytester.makepyfile(test_a="def test_a(): pass")
+    result = pytester.runpytest("test_a.py", "--bdd-match-stats")
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.stderr.fnmatch_lines(["*--bdd-match-stats: expected one argument*"])
+    assert pytester.path.joinpath("test_a.py").read_text() == "def test_a(): pass"
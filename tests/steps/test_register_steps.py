@@ -0,0 +1,116 @@
+"""Test the bulk registration of step definitions."""
+
+from __future__ import annotations
+
+import textwrap
+
+
+def test_register_steps(pytester):
+    pytester.makefile(
+        ".feature",
+        generated=textwrap.dedent(
+            """\
+            Feature: Generated steps
+                Scenario: Generated steps
+                    Given there is a wallet
+                    When I pay 3 EUR
+                    And I pay 4 USD
+                    Then I have paid 3 EUR
+                    And I have paid 4 USD
+            """
+        ),
+    )
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            import sys
+
+            from pytest_bdd import parsers, register_steps
+            from pytest_bdd.steps import StepSpec
+
+
+            def make_pay_step(currency):
+                def pay(wallet, amount):
+                    wallet[currency] += amount
+
+                return pay
+
+
+            def make_paid_step(currency):
+                def paid(wallet, amount):
+                    assert wallet[currency] == amount
+
+                return paid
+
+
+            register_steps(
+                sys.modules[__name__],
+                [StepSpec("given", "there is a wallet", lambda: {"EUR": 0, "USD": 0}, target_fixture="wallet")],
+            )
+            register_steps(
+                globals(),
+                [
+                    *(
+                        ("when", parsers.parse(f"I pay {{amount}} {currency}"), make_pay_step(currency), {"amount": int})
+                        for currency in ("EUR", "USD")
+                    ),
+                    *(
+                        ("then", parsers.parse(f"I have paid {{amount:d}} {currency}"), make_paid_step(currency))
+                        for currency in ("EUR", "USD")
+                    ),
+                ],
+            )
+            """
+        )
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import scenarios
+
+            scenarios("generated.feature")
+            """
+        )
+    )
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
+
+
+def test_registered_steps_are_module_scoped(pytester):
+    """Like the decorators, the registered steps are only visible from the module they are registered in."""
+    pytester.makefile(
+        ".feature",
+        scoped=textwrap.dedent(
+            """\
+            Feature: Generated steps
+                Scenario: Generated step
+                    Given I have a generated step
+            """
+        ),
+    )
+    pytester.makepyfile(
+        test_with_steps=textwrap.dedent(
+            """\
+            from pytest_bdd import register_steps, scenarios
+
+            scenarios("scoped.feature")
+
+            register_steps(globals(), [("given", "I have a generated step", lambda: None)])
+            """
+        ),
+        test_without_steps=textwrap.dedent(
+            """\
+            from pytest_bdd import scenarios
+
+            scenarios("scoped.feature")
+            """
+        ),
+    )
+    result = pytester.runpytest("-v")
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*test_with_steps.py::test_generated_step PASSED*",
+            "*test_without_steps.py::test_generated_step FAILED*",
+        ]
+    )
@@ -0,0 +1,256 @@
+"""Test the step definition index."""
+
+from __future__ import annotations
+
+import gc
+import re as base_re
+
+import pytest
+
+from pytest_bdd import parsers
+from pytest_bdd.step_index import (
+    RegexMatcher,
+    StepDefinitionIndex,
+    StepParserFailure,
+    get_format_anchor,
+    get_format_literal_fragments,
+    make_groups_non_capturing,
+)
+from pytest_bdd.steps import StepFunctionContext
+
+
+def _add(index, parser, type_="given"):
+    def marker():
+        pass
+
+    context = StepFunctionContext(type=type_, step_func=lambda: None, parser=parsers.get_parser(parser))
+    index.add(fixture_name="step_fixture", func=marker, context=context)
+    # Return the marker too, so that the caller keeps the definition alive
+    return context, marker
+
+
+def test_exact_string_lookup():
+    index = StepDefinitionIndex()
+    foo, _foo_marker = _add(index, "I have a foo")
+    _bar, _bar_marker = _add(index, "I have a bar")
+    when_foo, _when_foo_marker = _add(index, "I have a foo", type_="when")
+
+    assert [d.context for d, _ in index.find("given", "I have a foo")] == [foo]
+    assert [d.context for d, _ in index.find("when", "I have a foo")] == [when_foo]
+    assert index.find("then", "I have a foo") == []
+    assert index.find("given", "I have a baz") == []
+
+
+def test_untyped_and_parsed_definitions():
+    index = StepDefinitionIndex()
+    untyped, _untyped_marker = _add(index, "I have 1 foo", type_=None)
+    regex, _regex_marker = _add(index, parsers.re(r"I have (?P<n>\d+) foo"))
+    exact, _exact_marker = _add(index, "I have 1 foo")
+
+    assert [d.context for d, _ in index.find("given", "I have 1 foo")] == [untyped, regex, exact]
+    assert [d.context for d, _ in index.find("then", "I have 1 foo")] == [untyped]
+
+
+def test_garbage_collected_definitions_are_dropped():
+    index = StepDefinitionIndex()
+    _add(index, "I have a foo")
+    _add(index, parsers.parse("I have {n:d} foo"))
+    gc.collect()
+
+    assert index.find("given", "I have a foo") == []
+    assert index.find("given", "I have 2 foo") == []
+    assert index._exact == {}
+    assert index._scanned == {}
+
+
+def test_regex_definitions_are_combined(monkeypatch):
+    monkeypatch.setattr(RegexMatcher, "max_alternatives", 3)
+    index = StepDefinitionIndex()
+    contexts = [
+        _add(index, parsers.re(r"I have (?P<n>\d+) (?P<fruit>\w+)")),
+        _add(index, parsers.re(r"I have (?P<n>\d+) apples?")),
+        _add(index, parsers.re(r"I eat (?P<n>\d+) (?P<fruit>\w+)")),
+        _add(index, parsers.re(r"I have (\d+) pears", base_re.IGNORECASE)),
+        _add(index, parsers.re(r"I have (?P<n>(\d)+) (apples|pears)")),
+    ]
+    [have_fruit, have_apples, eat_fruit, have_pears, have_apples_or_pears] = [context for context, _ in contexts]
+
+    assert [d.context for d, _ in index.find("given", "I have 2 apples")] == [
+        have_fruit,
+        have_apples,
+        have_apples_or_pears,
+    ]
+    assert [d.context for d, _ in index.find("given", "I have 2 PEARS")] == [have_fruit, have_pears]
+    assert [d.context for d, _ in index.find("given", "I have 2 pears")] == [
+        have_fruit,
+        have_pears,
+        have_apples_or_pears,
+    ]
+    assert [d.context for d, _ in index.find("given", "I eat 2 pears")] == [eat_fruit]
+    assert index.find("given", "I eat pears") == []
+
+    # Patterns sharing the same flags are combined, at most `max_alternatives` at a time
+    matcher = index._regex["given"]
+    assert [len(chunk.definitions) for chunk in matcher._chunks] == [3, 1, 1]
+    assert matcher._individual == []
+    assert "given" not in index._scanned
+
+
+def test_regex_definitions_that_cannot_be_combined():
+    index = StepDefinitionIndex()
+    contexts = [
+        _add(index, parsers.re(r"(?i)I have (?P<n>\d+) apples")),
+        _add(index, parsers.re(r"I have (?P<fruit>\w+) and (?P=fruit)")),
+        _add(index, parsers.re(r"I have (\w+) and \1")),
+        _add(index, parsers.re(r"I  have  (?P<n>\d+)  pears  # comment", base_re.VERBOSE)),
+    ]
+
+    assert [d.context for d, _ in index.find("given", "I have 2 APPLES")] == [contexts[0][0]]
+    assert [d.context for d, _ in index.find("given", "I have pears and pears")] == [contexts[1][0], contexts[2][0]]
+    assert [d.context for d, _ in index.find("given", "Ihave2pears")] == [contexts[3][0]]
+
+    matcher = index._regex["given"]
+    assert matcher._chunks == []
+    assert [d.context for d in matcher._individual] == [context for context, _ in contexts]
+
+
+def test_invalid_regex_definitions_are_matched_individually():
+    index = StepDefinitionIndex()
+    _valid, _valid_marker = _add(index, parsers.re(r"I have (?P<n>\d+) apples"))
+    _invalid, _invalid_marker = _add(index, parsers.re(r"I have (\d+ pears"))
+
+    # The error is reported along with the other matches, since the index is shared by all the modules
+    [(valid, valid_match), (invalid, failure)] = index.find("given", "I have 2 apples")
+    assert (valid.context, valid_match.arguments) == (_valid, {"n": "2"})
+    assert invalid.context is _invalid
+    assert isinstance(failure, StepParserFailure)
+    assert isinstance(failure.error, base_re.error)
+
+    [chunk] = index._regex["given"]._chunks
+    assert chunk.broken
+
+
+def test_cucumber_definitions_are_combined_with_regex_definitions():
+    index = StepDefinitionIndex()
+    contexts = [
+        _add(index, parsers.cucumber("I have {int} apple(s)", names=["n"])),
+        _add(index, parsers.re(r"I have (?P<n>\d+) (?P<fruit>\w+)")),
+        _add(index, parsers.cucumber("I eat {int} apple(s)/pear(s)", names=["n"])),
+        _add(index, parsers.cucumber("I eat {unknown}", names=["food"]), type_="when"),
+    ]
+    [have_apples, have_fruit, eat_fruit, invalid] = [context for context, _ in contexts]
+
+    [(_, have_apples_match), (_, have_fruit_match)] = index.find("given", "I have 2 apples")
+    assert have_apples_match.arguments == {"n": 2}
+    assert have_fruit_match.arguments == {"n": "2", "fruit": "apples"}
+    assert [d.context for d, _ in index.find("given", "I eat 1 pear")] == [eat_fruit]
+    matcher = index._regex["given"]
+    assert [d.context for chunk in matcher._chunks for d in chunk.definitions] == [have_apples, have_fruit, eat_fruit]
+
+    # Invalid expressions are matched individually, so that the error is reported when a step is matched
+    [(definition, failure)] = index.find("when", "I eat apples")
+    assert definition.context is invalid
+    assert isinstance(failure, StepParserFailure)
+    assert "Undefined parameter type" in str(failure.error)
+    assert [d.context for d in index._regex["when"]._individual] == [invalid]
+
+
+def test_parsers_are_compiled_lazily():
+    index = StepDefinitionIndex()
+    contexts = [
+        _add(index, parsers.re(r"I eat (?P<n>\d+) apples")),
+        _add(index, parsers.re(r"I have (?P<n>\d+) apples")),
+        _add(index, parsers.parse("I have {n:d} pears")),
+        _add(index, parsers.cfparse("I eat {n:d} pears")),
+    ]
+    [eat_apples, have_apples, have_pears, eat_pears] = [context.parser for context, _ in contexts]
+    assert [parser._regex for parser in (have_apples, eat_apples)] == [None, None]
+    assert [parser._parser for parser in (have_pears, eat_pears)] == [None, None]
+
+    assert [d.context.parser for d, _ in index.find("given", "I have 2 apples")] == [have_apples]
+    assert [d.context.parser for d, _ in index.find("given", "I have 2 pears")] == [have_pears]
+    # Only the parsers that may parse the steps are compiled
+    assert have_apples._regex is not None
+    assert eat_apples._regex is None
+    assert have_pears._parser is not None
+    assert eat_pears._parser is None
+
+    index.compile()
+    assert eat_apples._regex is not None
+    assert eat_pears._parser is not None
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        (r"I have (?P<n>\d+) (apples|pears)", r"I have (?:\d+) (?:apples|pears)"),
+        (r"a[(]b(c)", r"a[(]b(?:c)"),
+        (r"[]()](x)", r"[]()](?:x)"),
+        (r"[^]()](x)", r"[^]()](?:x)"),
+        (r"\((y)\)", r"\((?:y)\)"),
+        (r"(?:a)(?=b)(?<=c)(?!d)", r"(?:a)(?=b)(?<=c)(?!d)"),
+    ],
+)
+def test_make_groups_non_capturing(pattern, expected):
+    assert make_groups_non_capturing(pattern) == expected
+    assert base_re.compile(expected).groups == 0
+
+
+@pytest.mark.parametrize(
+    "parse_format, fragments, anchor",
+    [
+        ("I have {n:d} cucumbers in my {bag}", ["I have ", " cucumbers in my ", ""], "cucumbers"),
+        ("{n:d} apples", ["", " apples"], "apples"),
+        ("I have {n:d}apples", ["I have ", "apples"], "have"),
+        ("{name}", ["", ""], None),
+        ("{{literal}} braces and {field}", ["{literal} braces and ", ""], "literal"),
+        ("Ich habe {n:d} Äpfel", ["Ich habe ", " Äpfel"], "habe"),
+    ],
+)
+def test_parse_format_anchor(parse_format, fragments, anchor):
+    assert get_format_literal_fragments(parse_format) == fragments
+    assert get_format_anchor(fragments) == anchor
+
+
+def test_parse_definitions_are_prefiltered():
+    index = StepDefinitionIndex()
+    contexts = [
+        _add(index, parsers.parse("I have {n:d} cucumbers in my {bag}")),
+        _add(index, parsers.cfparse("I have {n:d} cucumbers")),
+        _add(index, parsers.parse("{subject} have {n:d} cucumbers in my {bag}")),
+        _add(index, parsers.parse("{anything}")),
+        _add(index, parsers.parse("I eat {n:d} cucumbers", case_sensitive=True)),
+    ]
+    [in_bag, cucumbers, subject, anything, eat] = [context for context, _ in contexts]
+
+    matcher = index._parse["given"]
+    assert set(matcher._by_anchor) == {"cucumbers"}
+    assert [entry.definition.context for entry in matcher._unanchored] == [anything]
+
+    def find(step_name):
+        return [(d.context, match.arguments) for d, match in index.find("given", step_name)]
+
+    assert find("I HAVE 2 cucumbers in my BAG") == [
+        (in_bag, {"n": 2, "bag": "BAG"}),
+        (subject, {"subject": "I", "n": 2, "bag": "BAG"}),
+        (anything, {"anything": "I HAVE 2 cucumbers in my BAG"}),
+    ]
+    assert find("I have 2 cucumbers") == [(cucumbers, {"n": 2}), (anything, {"anything": "I have 2 cucumbers"})]
+    assert find("I EAT 2 cucumbers") == [(anything, {"anything": "I EAT 2 cucumbers"})]
+    assert find("I eat 2 cucumbers") == [(anything, {"anything": "I eat 2 cucumbers"}), (eat, {"n": 2})]
+    # Non-ASCII step names are not prefiltered: the Kelvin sign matches "k" when ignoring the case
+    kiwis, _kiwis_marker = _add(index, parsers.parse("I have {n:d} kiwis"))
+    assert find("I have 2 \u212aiwis") == [(anything, {"anything": "I have 2 \u212aiwis"}), (kiwis, {"n": 2})]
+
+
+def test_unresolved_steps_are_cached():
+    index = StepDefinitionIndex()
+    _foo, _foo_marker = _add(index, parsers.parse("I have {n:d} foo"))
+
+    assert index.find("given", "I have a bar") == []
+    assert index._unresolved == {("given", "I have a bar")}
+
+    # The negative cache is cleared when a new definition may parse the step
+    bar, _bar_marker = _add(index, "I have a bar")
+    assert index._unresolved == set()
+    assert [d.context for d, _ in index.find("given", "I have a bar")] == [bar]
@@ -0,0 +1,188 @@
+"""Test the step resolution cache."""
+
+from __future__ import annotations
+
+import textwrap
+
+from pytest_bdd.utils import collect_dumped_objects
+
+
+def test_steps_are_resolved_once_per_module(pytester):
+    pytester.makefile(
+        ".feature",
+        steps=textwrap.dedent(
+            """\
+            Feature: Step resolution cache
+                Scenario: First scenario
+                    Given I have a foo
+                    Then the foo is fine
+
+                Scenario: Second scenario
+                    Given I have a foo
+                    And I have a bar
+                    Then the foo is fine
+            """
+        ),
+    )
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            from pytest_bdd.scenario import get_step_resolution_cache
+            from pytest_bdd.utils import dump_obj
+
+
+            def pytest_sessionfinish(session):
+                cache = get_step_resolution_cache(session._fixturemanager)
+                dump_obj((cache.hits, cache.misses))
+            """
+        )
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, then, scenarios
+
+            scenarios("steps.feature")
+
+
+            @given("I have a foo")
+            @given("I have a bar")
+            def _():
+                pass
+
+
+            @then("the foo is fine")
+            def _():
+                pass
+            """
+        )
+    )
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=2)
+
+    [(hits, misses)] = collect_dumped_objects(result)
+    assert (hits, misses) == (2, 3)
+
+
+def test_step_lookup_does_not_mutate_the_fixture_manager(pytester):
+    pytester.makefile(
+        ".feature",
+        steps=textwrap.dedent(
+            """\
+            Feature: Step lookup
+                Scenario: Lookup
+                    Given I have a foo
+                    Then I can find the step definition of "I have a foo"
+            """
+        ),
+    )
+    pytester.makeconftest(
+        textwrap.dedent(
+            """\
+            from pytest_bdd.utils import dump_obj
+
+
+            class RecordingDict(dict):
+                written = []
+
+                def __setitem__(self, key, value):
+                    self.written.append(key)
+                    super().__setitem__(key, value)
+
+                def __delitem__(self, key):
+                    self.written.append(key)
+                    super().__delitem__(key)
+
+
+            def pytest_collection_finish(session):
+                fm = session._fixturemanager
+                fm._arg2fixturedefs = RecordingDict(fm._arg2fixturedefs)
+
+
+            def pytest_sessionfinish(session):
+                dump_obj(RecordingDict.written)
+            """
+        )
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, then, parsers, scenarios
+            from pytest_bdd.parser import Step
+            from pytest_bdd.scenario import get_step_function
+
+            scenarios("steps.feature")
+
+
+            @given("I have a foo")
+            def given_foo():
+                pass
+
+
+            @then(parsers.parse('I can find the step definition of "{name}"'))
+            def _(request, name):
+                step = Step(name=name, type="given", indent=0, line_number=0, keyword="Given")
+                context = get_step_function(request, step)
+                assert context.step_func is given_foo
+            """
+        )
+    )
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=1)
+
+    [written] = collect_dumped_objects(result)
+    assert written == []
+
+
+def test_step_definition_with_the_narrowest_scope_wins(pytester):
+    pytester.makefile(
+        ".feature",
+        steps=textwrap.dedent(
+            """\
+            Feature: Step scopes
+                Scenario: Scopes
+                    Given I have a foo
+            """
+        ),
+    )
+    conftest = textwrap.dedent(
+        """\
+        from pytest_bdd import given
+        from pytest_bdd.utils import dump_obj
+
+
+        @given("I have a foo")
+        def _():
+            dump_obj("{}")
+        """
+    )
+    pytester.makeconftest(conftest.format("root conftest"))
+    pytester.mkdir("scoped")
+    pytester.path.joinpath("scoped", "conftest.py").write_text(conftest.format("scoped conftest"))
+    pytester.path.joinpath("scoped", "test_scopes.py").write_text(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenario
+            from pytest_bdd.scenario import get_fixturedef_scope_depth
+            from pytest_bdd.utils import dump_obj
+
+
+            @given("I have a foo")
+            def _():
+                dump_obj("module")
+
+
+            @scenario("../steps.feature", "Scopes")
+            def test_module(request):
+                fixturedefs = request._fixturemanager.getfixturedefs(
+                    "pytestbdd_stepdef_given_I have a foo", request.node
+                )
+                depths = [get_fixturedef_scope_depth(fixturedef) for fixturedef in fixturedefs]
+                assert depths == sorted(set(depths))
+            """
+        )
+    )
+    result = pytester.runpytest("-s")
+    result.assert_outcomes(passed=1)
+
+    assert collect_dumped_objects(result) == ["module"]